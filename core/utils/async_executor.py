@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+"""
+Async Execution Backend for VisualCare File Migration Renamer.
+
+This module runs the file operations of a migration (mkdir, copy/move, utime)
+on an asyncio event loop that offloads each blocking call to a bounded thread
+pool. Walking and extraction keep running on their own thread while earlier
+files are still being transferred, so on high-latency network shares the
+per-file round trips overlap instead of adding up.
+
+File Path: core/utils/async_executor.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Pipelined planning (walk + extraction) and transfers
+- Bounded thread offload for blocking file system calls
+- In-flight limits overall, per source directory and per destination directory
+- Results streamed back to the caller as transfers complete
+
+Configuration:
+- Execution.backend: 'serial' (default) or 'async'
+- Execution.max_workers: Thread pool size for file operations
+- Execution.max_in_flight: Maximum transfers in progress at once
+- Execution.per_source_limit: Maximum concurrent transfers from one source directory
+- Execution.per_destination_limit: Maximum concurrent transfers into one destination directory
+"""
+
+import asyncio
+import queue
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator
+
+from core.utils.migration_plan import PlanEntry
+from core.utils.results import FileResult
+
+
+_DONE = object()
+
+
+class AsyncTransferExecutor:
+    """Run transfers for a stream of plan entries on an asyncio event loop."""
+
+    def __init__(self, config: Dict):
+        """
+        Initialize the executor.
+
+        Args:
+            config: Configuration dictionary containing Execution settings.
+        """
+        settings = config.get('Execution', {})
+        self.max_workers = max(1, settings.get('max_workers', 32))
+        self.max_in_flight = max(1, settings.get('max_in_flight', 64))
+        self.per_source_limit = max(1, settings.get('per_source_limit', 8))
+        self.per_destination_limit = max(1, settings.get('per_destination_limit', 8))
+
+    def run(self, entries: Iterable[PlanEntry], transfer: Callable[[PlanEntry], FileResult]) -> Iterator[FileResult]:
+        """
+        Transfer every planned entry, yielding results as they complete.
+
+        The event loop runs on a background thread; results are handed back
+        through a bounded queue so a slow consumer applies back-pressure.
+
+        Args:
+            entries: Plan entries in walk order (consumed on a single thread).
+            transfer: Blocking callable performing one transfer.
+
+        Yields:
+            FileResult for each entry, in completion order.
+        """
+        results = queue.Queue(maxsize=self.max_in_flight * 2)
+        stop = threading.Event()
+        failure = []
+
+        def run_loop():
+            try:
+                asyncio.run(self._run(entries, transfer, results, stop))
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                results.put(_DONE)
+
+        worker = threading.Thread(target=run_loop, name='async-executor', daemon=True)
+        worker.start()
+        try:
+            while True:
+                result = results.get()
+                if result is _DONE:
+                    break
+                yield result
+        finally:
+            # Unblock producers if the consumer stopped early
+            stop.set()
+            while worker.is_alive():
+                try:
+                    results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            worker.join()
+        if failure:
+            raise failure[0]
+
+    async def _run(self, entries: Iterable[PlanEntry], transfer: Callable[[PlanEntry], FileResult],
+                   results: queue.Queue, stop: threading.Event):
+        """
+        Pull plan entries and schedule their transfers within the configured limits.
+
+        Args:
+            entries: Plan entries in walk order.
+            transfer: Blocking callable performing one transfer.
+            results: Queue receiving each FileResult.
+            stop: Event set when the consumer no longer wants results.
+        """
+        loop = asyncio.get_running_loop()
+        # The planner is a generator (and may hold per-thread resources such as
+        # the extraction cache), so it always advances on the same single thread
+        planner = ThreadPoolExecutor(max_workers=1, thread_name_prefix='async-planner')
+        io_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='async-io')
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        source_limits = defaultdict(lambda: asyncio.Semaphore(self.per_source_limit))
+        destination_limits = defaultdict(lambda: asyncio.Semaphore(self.per_destination_limit))
+        pending = set()
+
+        def transfer_and_emit(entry: PlanEntry):
+            # Runs on an I/O thread, so a full results queue blocks here, not the loop
+            result = transfer(entry)
+            if not stop.is_set():
+                results.put(result)
+
+        async def schedule(entry: PlanEntry):
+            try:
+                async with source_limits[entry.source_path.parent], destination_limits[entry.person]:
+                    await loop.run_in_executor(io_pool, transfer_and_emit, entry)
+            finally:
+                in_flight.release()
+
+        iterator = iter(entries)
+        try:
+            while not stop.is_set():
+                entry = await loop.run_in_executor(planner, next, iterator, _DONE)
+                if entry is _DONE:
+                    break
+                await in_flight.acquire()
+                task = asyncio.create_task(schedule(entry))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            # Close the planner generator on its own thread so its cleanup runs there
+            close = getattr(iterator, 'close', None)
+            if close:
+                await loop.run_in_executor(planner, close)
+            planner.shutdown(wait=True)
+            io_pool.shutdown(wait=True)
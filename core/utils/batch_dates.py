@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+"""
+Batch Date Extraction for VisualCare File Migration Renamer.
+
+This module extracts dates from large listings of filenames (millions of
+vendor paths) in one pass. The allowed date formats are compiled once into a
+single alternation regex, the matched year/month/day components of all rows
+are converted and validated in bulk (with NumPy arrays when NumPy is
+installed), and the results are identical to calling extract_date_matches on
+every row.
+
+File Path: core/utils/batch_dates.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Configuration and patterns compiled once per extractor, not once per string
+- Single combined regex pass selecting the same match as the scalar pattern loop
+- Bulk component conversion and vectorized rejection of impossible dates
+- Normalized date strings plus a matched mask for the whole listing
+- Rows the fast path cannot decide exactly (date ranges, excluded prefixes such
+  as "exp", several dates) are handed to extract_date_matches unchanged
+
+Optional Dependencies:
+- numpy: Vectorized validation (a pure Python fallback is used without it)
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from core.utils.date_matcher import build_date_patterns, extract_date_matches, load_config
+from core.utils.date_utils import range_date_patterns
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Markers used by extract_date_matches; rows containing them always take the scalar path
+_MARKERS = ('__PROTECTED_RANGE__', '__EXCLUDED_DATE__')
+
+_SEPARATORS = '-._ '
+
+
+class BatchDateResult(NamedTuple):
+    """Dates extracted from a listing, one entry per input row."""
+    dates: List[str]
+    remainders: List[str]
+    matched: Sequence[bool]
+
+    def to_strings(self) -> List[str]:
+        """
+        Render every row in the extract_date_matches output format.
+
+        Returns:
+            List[str]: "dates|remainder|true" or "|filename|false" per row.
+        """
+        return [f"{dates}|{remainder}|{'true' if matched else 'false'}"
+                for dates, remainder, matched in zip(self.dates, self.remainders, self.matched)]
+
+
+def _valid_dates(years: List[int], months: List[int], days: List[int]) -> List[bool]:
+    """
+    Check which year/month/day triples form a real calendar date.
+
+    Args:
+        years: Years.
+        months: Months (any integer).
+        days: Days (any integer).
+
+    Returns:
+        List[bool]: True where datetime(year, month, day) would succeed.
+    """
+    if np is not None:
+        y = np.asarray(years, dtype=np.int64)
+        m = np.asarray(months, dtype=np.int64)
+        d = np.asarray(days, dtype=np.int64)
+        leap = (y % 4 == 0) & ((y % 100 != 0) | (y % 400 == 0))
+        limit = np.asarray(DAYS_IN_MONTH, dtype=np.int64)[np.clip(m, 0, 12)] + (leap & (m == 2))
+        valid = (y >= 1) & (y <= 9999) & (m >= 1) & (m <= 12) & (d >= 1) & (d <= limit)
+        return valid.tolist()
+
+    valid = []
+    for y, m, d in zip(years, months, days):
+        if not (1 <= y <= 9999 and 1 <= m <= 12):
+            valid.append(False)
+            continue
+        leap = y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+        valid.append(1 <= d <= DAYS_IN_MONTH[m] + (leap and m == 2))
+    return valid
+
+
+class BatchDateExtractor:
+    """Extract dates from many filenames with the semantics of extract_date_matches."""
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Compile the date and range patterns of the configuration.
+
+        Args:
+            config: Configuration dictionary containing Date settings (default:
+                components.yaml, which is also what the scalar fallback reads).
+        """
+        config = config or load_config()
+        date_config = config.get('Date', {})
+        allowed_formats = date_config.get('allowed_formats', ['%Y-%m-%d'])
+        self.normalized_format = date_config.get('normalized_format', '%Y-%m-%d')
+        self.fallbacks = 0
+
+        # Alternative i of the combined regex is scalar pattern i with its groups renamed
+        self.patterns = []
+        self.month_names = []
+        alternatives = []
+        for index, (pattern, date_format) in enumerate(build_date_patterns(allowed_formats)):
+            self.patterns.append(re.compile(pattern, re.IGNORECASE))
+            self.month_names.append('Month' in date_format)
+            renamed = re.sub(r'\(\?P<(year|month|day)>', rf'(?P<\1_{index}>', pattern)
+            alternatives.append(f"(?P<p{index}>{renamed})")
+        self.combined = re.compile('|'.join(alternatives), re.IGNORECASE) if alternatives else None
+
+        # Any text matching this could contain a date range (see is_date_range_and_normalize)
+        loose = range_date_patterns(allowed_formats)
+        separators = '|'.join(re.escape(sep) for sep in
+                              date_config.get('exclude_ranges_separators', [" ", "-", "_", ".", ",", "to"]))
+        normalized_separator = re.escape(date_config.get('exclude_ranges_normalized_separator', " - "))
+        ranges = [f"(?i:{p}(?:{separators})+{p})" for p in loose]
+        ranges += [f"(?i:{p}{re.escape(sep)}{p})" for sep in date_config.get('exclude_ranges_separator_strings', [])
+                   for p in loose]
+        ranges += [f"{p}{normalized_separator}{p}" for p in loose]
+        self.ranges = re.compile('|'.join(ranges)) if ranges else None
+
+        prefixes = date_config.get('excluded_date_by_prefix', [])
+        self.prefixes = None
+        if date_config.get('exclude_ranges', False) and prefixes:
+            self.prefixes = re.compile('|'.join(re.escape(prefix) for prefix in prefixes), re.IGNORECASE)
+
+    def _candidate(self, filename: str):
+        """
+        Find the match extract_date_matches would take first, if the row is simple.
+
+        Args:
+            filename: Filename to inspect.
+
+        Returns:
+            Tuple of (match, pattern index), None when no date pattern matches,
+            or False when the row needs the scalar path.
+        """
+        match = self.combined.search(filename)
+        if match is None:
+            return None
+        if any(marker in filename for marker in _MARKERS):
+            return False
+        if self.ranges is not None and self.ranges.search(filename):
+            return False
+        if self.prefixes is not None and self.prefixes.search(filename):
+            return False
+        index = int(match.lastgroup[1:])
+        # The scalar loop takes the first pattern matching anywhere; earlier patterns
+        # cannot match at or before this position, but may still match further on
+        start = match.start()
+        for pattern in self.patterns[:index]:
+            if pattern.search(filename, start + 1):
+                return False
+        return match, index
+
+    def extract(self, filenames: Iterable[str]) -> BatchDateResult:
+        """
+        Extract dates from every filename of a listing.
+
+        Args:
+            filenames: List or array of filenames.
+
+        Returns:
+            BatchDateResult: Normalized dates ("" when unmatched), remainders and
+            the matched mask (a NumPy bool array when NumPy is installed).
+        """
+        filenames = [str(filename) for filename in filenames]
+        dates = [""] * len(filenames)
+        remainders = list(filenames)
+        matched = [False] * len(filenames)
+        if self.combined is None:
+            return BatchDateResult(dates, remainders, np.asarray(matched, dtype=bool) if np is not None else matched)
+
+        # Pass 1: one combined regex search per row
+        rows, spans, years, months, days, numeric = [], [], [], [], [], []
+        scalar = []
+        for row, filename in enumerate(filenames):
+            candidate = self._candidate(filename)
+            if candidate is None:
+                continue
+            if candidate is False:
+                scalar.append(row)
+                continue
+            match, index = candidate
+            rows.append(row)
+            spans.append((match.start(), match.end(), match.group(0)))
+            years.append(match.group(f'year_{index}'))
+            days.append(match.group(f'day_{index}'))
+            month = match.group(f'month_{index}')
+            months.append(MONTHS[month.lower()] if self.month_names[index] else month)
+            numeric.append(not self.month_names[index])
+
+        # Pass 2: bulk conversion and validation of the matched components
+        if np is not None and rows:
+            years = np.asarray(years).astype(np.int64)
+            months = np.asarray([str(month) for month in months]).astype(np.int64)
+            days = np.asarray(days).astype(np.int64)
+            # Numeric formats read 2-digit years as 20xx
+            years = np.where(np.asarray(numeric) & (years < 100), years + 2000, years)
+            valid = _valid_dates(years, months, days)
+            years, months, days = years.tolist(), months.tolist(), days.tolist()
+        else:
+            years = [int(year) + (2000 if is_numeric and int(year) < 100 else 0)
+                     for year, is_numeric in zip(years, numeric)]
+            months = [int(month) for month in months]
+            days = [int(day) for day in days]
+            valid = _valid_dates(years, months, days)
+
+        # Pass 3: remove the date like the scalar loop and confirm nothing else matches
+        for row, (start, end, text), year, month, day, ok in zip(rows, spans, years, months, days, valid):
+            filename = filenames[row]
+            if not ok:
+                # Invalid dates are dropped from the text; with nothing else found the row is unmatched
+                if self.combined.search(filename.replace(text, '', 1)):
+                    scalar.append(row)
+                continue
+            sep_before = ""
+            sep_after = ""
+            if start > 0 and filename[start - 1] in _SEPARATORS:
+                sep_before = filename[start - 1]
+                start -= 1
+            if end < len(filename) and filename[end] in _SEPARATORS:
+                sep_after = filename[end]
+                end += 1
+            remainder = filename[:start] + sep_before + sep_after + filename[end:]
+            if self.combined.search(remainder):
+                scalar.append(row)
+                continue
+            if self.normalized_format == '%Y%m%d' and year >= 1000:
+                dates[row] = f"{year:04d}{month:02d}{day:02d}"
+            else:
+                dates[row] = datetime(year, month, day).strftime(self.normalized_format)
+            remainders[row] = remainder
+            matched[row] = True
+
+        # Rows with ranges, excluded prefixes or several dates use the scalar extractor
+        for row in scalar:
+            self.fallbacks += 1
+            head, flag = extract_date_matches(filenames[row]).rsplit('|', 1)
+            dates[row], remainders[row] = head.split('|', 1)
+            matched[row] = flag == 'true'
+
+        return BatchDateResult(dates, remainders, np.asarray(matched, dtype=bool) if np is not None else matched)
+
+
+def extract_date_matches_batch(filenames: Iterable[str], config: Optional[Dict] = None) -> List[str]:
+    """
+    Batch equivalent of extract_date_matches.
+
+    Args:
+        filenames: List or array of filenames.
+        config: Configuration dictionary (default: components.yaml).
+
+    Returns:
+        List[str]: extract_date_matches output for every filename, in order.
+    """
+    return BatchDateExtractor(config).extract(filenames).to_strings()
+
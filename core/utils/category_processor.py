@@ -14,17 +14,32 @@ File Path: core/utils/category_processor.py
 
 Features:
 - Load category mappings from CSV file
-- Case insensitive category name matching
-- First-level directory category detection
+- Case insensitive category name matching on Unicode normalized names
+  (NFC, case folded, canonical whitespace; non-ASCII letters are kept)
+- First-level directory category detection, also available per directory
+  (match_category_directory) so callers resolve a folder's category once
 - Category ID extraction and validation
 """
 
 import csv
+import re
 import sys
 from pathlib import Path
 import os
 from typing import Dict, Optional, Tuple
 
+try:
+    from core.utils.filename_formatter import FilenameFormatter
+    from core.utils.text_normalization import TextNormalizer
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.utils.filename_formatter import FilenameFormatter
+    from core.utils.text_normalization import TextNormalizer
+
+
+# (mapping path, mtime_ns) -> normalized category name -> (category name, category ID)
+_DIRECTORY_INDEX = {}
+
 
 class CategoryProcessor:
     """Process category mappings and detect categories from directory structures."""
@@ -39,6 +54,8 @@ class CategoryProcessor:
         self.config = config
         self.category_mapping = {}
         self.category_settings = config.get('Category', {})
+        self.normalizer = TextNormalizer(config)
+        self.formatter = FilenameFormatter(config)
         self._load_category_mapping()
     
     def _load_category_mapping(self):
@@ -68,7 +85,7 @@ class CategoryProcessor:
                     category_name = row.get(name_column, '').strip()
                     if category_id and category_name:
                         # Store with case-insensitive key if enabled
-                        key = category_name.lower() if self.category_settings.get('case_insensitive', True) else category_name
+                        key = self._key(category_name)
                         self.category_mapping[key] = category_id
             
             print(f"Loaded {len(self.category_mapping)} category mappings", file=sys.stderr)
@@ -116,6 +133,20 @@ class CategoryProcessor:
         # Check if the first-level directory matches a category
         return self._match_category_name(first_level_dir)
     
+    def _key(self, name: str) -> str:
+        """
+        Normalized lookup key of a category or directory name.
+        
+        Args:
+            name: Category name or directory name.
+            
+        Returns:
+            str: Case folded key if case_insensitive is enabled, else the canonical name.
+        """
+        if self.category_settings.get('case_insensitive', True):
+            return self.normalizer.key(name)
+        return self.normalizer.canonical(name)
+    
     def _match_category_name(self, directory_name: str) -> Optional[str]:
         """
         Match a directory name to a category ID.
@@ -130,10 +161,7 @@ class CategoryProcessor:
             return None
         
         # Use case-insensitive matching if enabled
-        if self.category_settings.get('case_insensitive', True):
-            search_name = directory_name.lower()
-        else:
-            search_name = directory_name
+        search_name = self._key(directory_name)
         
         # Check for exact match
         if search_name in self.category_mapping:
@@ -182,24 +210,16 @@ class CategoryProcessor:
         
         if placement == 'prefix':
             # Add category at the beginning
-            return f"{category_id}_{base_filename}"
-        elif placement == 'suffix':
-            # Add category at the end (before extension)
-            name_parts = base_filename.rsplit('.', 1)
-            if len(name_parts) == 2:
-                return f"{name_parts[0]}_{category_id}.{name_parts[1]}"
-            else:
-                return f"{base_filename}_{category_id}"
+            return self.formatter.join((category_id, base_filename))
         elif placement == 'separate_component':
             # Add category as a separate component in the middle
-            return f"{base_filename}_{category_id}"
+            return self.formatter.join((base_filename, category_id))
         else:
-            # Default to suffix
-            name_parts = base_filename.rsplit('.', 1)
-            if len(name_parts) == 2:
-                return f"{name_parts[0]}_{category_id}.{name_parts[1]}"
-            else:
-                return f"{base_filename}_{category_id}"
+            # Add category at the end (before extension); default placement
+            stem, dot, extension = base_filename.rpartition('.')
+            if not dot:
+                return self.formatter.join((base_filename, category_id))
+            return self.formatter.join((stem, category_id)) + dot + extension
     
     def get_all_categories(self) -> Dict[str, str]:
         """
@@ -223,12 +243,88 @@ class CategoryProcessor:
         return category_id in self.category_mapping.values()
 
 
+def normalize_category_directory(name: str, normalizer: TextNormalizer) -> str:
+    """
+    Normalize a directory or category name for the exact first-directory match.
+    
+    Unicode normalize and casefold, replace underscores/hyphens/& with spaces,
+    remove non-alphanumeric characters (letters of any script are kept) except
+    spaces, collapse spaces.
+    
+    Args:
+        name: Directory or category name.
+        normalizer: Text normalizer.
+        
+    Returns:
+        str: Normalized name.
+    """
+    name = normalizer.key(name)
+    name = re.sub(r'[\-_&]', ' ', name)
+    name = re.sub(r'[^\w ]|_', '', name)
+    name = re.sub(r'\s+', ' ', name)
+    return name.strip()
+
+
+def get_category_mapping_path(config: Dict) -> Path:
+    """
+    Resolve the category mapping CSV used for directory matching.
+    
+    Args:
+        config: Configuration dictionary containing Category settings.
+        
+    Returns:
+        Path: Absolute path of the mapping file ($VC_CATEGORY_MAPPING_FILE first).
+    """
+    mapping_file = os.environ.get('VC_CATEGORY_MAPPING_FILE') or config.get('Category', {}).get(
+        'mapping_test_file', 'config/category_mapping.csv')
+    mapping_path = Path(mapping_file)
+    if not mapping_path.is_absolute():
+        mapping_path = Path(__file__).parent.parent.parent / mapping_path
+    return mapping_path
+
+
+def match_category_directory(dirname: str, config: Dict) -> Tuple[str, str]:
+    """
+    Match a first-level directory exactly (after normalization) against the category mapping.
+    
+    The mapping is indexed once per file version; the first row of a
+    normalized name wins.
+    
+    Args:
+        dirname: Directory name below the person folder.
+        config: Configuration dictionary (Category and TextNormalization settings).
+        
+    Returns:
+        Tuple[str, str]: (category name as written in the mapping, category ID), or ("", "").
+    """
+    mapping_path = get_category_mapping_path(config)
+    try:
+        mtime_ns = mapping_path.stat().st_mtime_ns
+    except OSError:
+        return "", ""
+    normalizer = TextNormalizer(config)
+    stamp = (str(mapping_path), mtime_ns, tuple(sorted(config.get('TextNormalization', {}).items())))
+    index = _DIRECTORY_INDEX.get(stamp)
+    if index is None:
+        index = {}
+        with open(mapping_path, 'r') as f:
+            for row in csv.DictReader(f):
+                index.setdefault(normalize_category_directory(row['category_name'], normalizer),
+                                 (row['category_name'], row['category_id']))
+        _DIRECTORY_INDEX.clear()
+        _DIRECTORY_INDEX[stamp] = index
+    key = normalize_category_directory(dirname, normalizer)
+    if not key:
+        return "", ""
+    return index.get(key, ("", ""))
+
+
 def main():
     """Test the category processor."""
     # Load config
     import yaml
     import sys
-    config_path = Path(__file__).parent.parent.parent / 'config' / 'components.yaml'
+    config_path = os.environ.get('VC_CONFIG_FILE') or Path(__file__).parent.parent.parent / 'config' / 'components.yaml'
     with open(config_path, 'r') as f:
         config = yaml.safe_load(f)
     # Create processor
@@ -274,11 +370,6 @@ def extract_category_from_path_cli(input_path: str, config: dict):
     - If first directory doesn't match: return full path unchanged
     - Never touches the person's name directory
     """
-    processor = CategoryProcessor(config)
-    import os
-    import re
-    from pathlib import Path
-    
     path_parts = Path(input_path).parts
     
     # Need at least 3 parts: person/category/filename
@@ -290,38 +381,9 @@ def extract_category_from_path_cli(input_path: str, config: dict):
     person_dir = path_parts[0]  # First directory is person's name
     category_candidate = path_parts[1]  # Second directory is category candidate
     
-    # Normalize function: lowercase, replace underscores/hyphens/& with spaces, remove non-alphanum except spaces, collapse spaces
-    def normalize(s):
-        s = s.lower()
-        s = re.sub(r'[\-_&]', ' ', s)
-        s = re.sub(r'[^a-z0-9 ]', '', s)
-        s = re.sub(r'\s+', ' ', s)
-        return s.strip()
-    
-    norm_candidate = normalize(category_candidate)
-    
-    # Load mapping file for exact matching of first directory only
-    # Allow environment override
-    mapping_file = os.environ.get('VC_CATEGORY_MAPPING_FILE') or processor.category_settings.get('mapping_test_file', 'config/category_mapping.csv')
+    # Exact match only (no partial matches) for the first directory
+    mapped_name_csv, mapped_id = match_category_directory(category_candidate, config)
     project_root = Path(__file__).parent.parent.parent
-    mapping_path = Path(mapping_file)
-    if not mapping_path.is_absolute():
-        mapping_path = project_root / mapping_path
-    
-    mapped_name_csv = None
-    mapped_id = None
-    
-    if mapping_path.exists() and norm_candidate:
-        import csv
-        with open(mapping_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                norm_map = normalize(row['category_name'])
-                # EXACT MATCH ONLY for first directory - no partial matches
-                if norm_candidate == norm_map:
-                    mapped_name_csv = row['category_name']
-                    mapped_id = row['category_id']
-                    break
     
     if mapped_name_csv:
         # FIRST DIRECTORY MATCHES - remove category directory and process remainder
@@ -367,7 +429,7 @@ def extract_category_from_path_cli(input_path: str, config: dict):
 if __name__ == "__main__":
     import yaml
     import sys
-    config_path = Path(__file__).parent.parent.parent / 'config' / 'components.yaml'
+    config_path = os.environ.get('VC_CONFIG_FILE') or Path(__file__).parent.parent.parent / 'config' / 'components.yaml'
     with open(config_path, 'r') as f:
         config = yaml.safe_load(f)
     if len(sys.argv) == 2:
@@ -37,6 +37,7 @@ Processing Logic:
 - Multiple date extraction from single filename
 """
 
+import os
 import re
 import sys
 import yaml
@@ -44,11 +45,24 @@ from datetime import datetime
 from pathlib import Path
 
 
+# (config path, mtime_ns) -> parsed configuration
+_CONFIG_CACHE = {}
+
+
 def load_config():
-    """Load configuration from components.yaml."""
-    config_path = Path(__file__).parent.parent.parent / 'config' / 'components.yaml'
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    """Load configuration from components.yaml (or $VC_CONFIG_FILE), parsed once per file version (shared; do not modify)."""
+    config_path = os.environ.get('VC_CONFIG_FILE') or Path(__file__).parent.parent.parent / 'config' / 'components.yaml'
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    stamp = (str(config_path), mtime_ns)
+    if stamp not in _CONFIG_CACHE:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f)
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[stamp] = config
+    return _CONFIG_CACHE[stamp]
 
 
 def build_date_patterns(allowed_formats):
@@ -467,13 +481,17 @@ def extract_date_from_path(full_path: str, date_to_match: str) -> str:
         return f"|{full_path}|false"
 
 
-def extract_date_from_remainder(remainder_string: str) -> str:
+def extract_date_from_remainder(remainder_string: str, file_stat=None, file_path: str = None, document_reader=None, folder_date_matches=None) -> str:
     """
     Extract date from remainder string following sequential string-based approach.
     This function is designed to be called after category and name extraction.
     
     Args:
         remainder_string: String containing potential dates (e.g., "2024/Updated Contacts/contact_list.pdf")
+        file_stat: Stat result captured by the walker; enables the 'modified' and 'created' sources
+        file_path: Full path to the file; used with document_reader for the 'document' source
+        document_reader: Optional DocumentDateReader for embedded document dates
+        folder_date_matches: Optional memoized replacement for extract_date_matches on folder names
         
     Returns:
         extracted_date|raw_remainder|cleaned_remainder|matched
@@ -516,8 +534,8 @@ def extract_date_from_remainder(remainder_string: str) -> str:
                         raw_remainder = cleaned_filename
                 break
         elif source == 'foldername' and foldername:
-            # Extract date from foldername
-            date_result = extract_date_matches(foldername)
+            # Extract date from foldername (memoized per folder name when provided)
+            date_result = (folder_date_matches or extract_date_matches)(foldername)
             date_parts = date_result.split('|')
             if date_parts[0]:  # If date found in foldername
                 extracted_date = date_parts[0]
@@ -529,12 +547,16 @@ def extract_date_from_remainder(remainder_string: str) -> str:
                     else:
                         raw_remainder = filename
                 break
-        elif source == 'modified':
-            # For now, skip modified date as we don't have file system access
-            continue
-        elif source == 'created':
-            # For now, skip created date as we don't have file system access
-            continue
+        elif source == 'document' and document_reader is not None and file_path:
+            # Creation date embedded in the document; the remainder is unchanged
+            extracted_date = document_reader.get(file_path)
+            if extracted_date:
+                break
+        elif source in ('modified', 'created') and file_stat is not None:
+            # Use the stat result captured by the walker; the remainder is unchanged
+            extracted_date = date_from_stat(file_stat, source, config)
+            if extracted_date:
+                break
     
     # Clean the remainder using global cleaner
     cleaned_remainder = raw_remainder
@@ -555,6 +577,33 @@ def extract_date_from_remainder(remainder_string: str) -> str:
     return f"{extracted_date}|{raw_remainder}|{cleaned_remainder}|{matched}"
 
 
+def date_from_stat(file_stat, source: str, config: dict = None) -> str:
+    """
+    Format the modified or created time of a stat result using the configured format.
+    
+    Args:
+        file_stat: os.stat_result captured when the file was discovered
+        source: 'modified' (st_mtime) or 'created' (st_birthtime, falling back to st_ctime)
+        config: Optional configuration dictionary (loaded if omitted)
+        
+    Returns:
+        Formatted date string, or empty string if the timestamp is unavailable
+    """
+    from core.utils.file_walker import file_birthtime
+    
+    if source == 'modified':
+        timestamp = file_stat.st_mtime
+    else:
+        timestamp = file_birthtime(file_stat)
+    if not timestamp or timestamp <= 0:
+        return ""
+    
+    if config is None:
+        config = load_config()
+    normalized_format = config.get('Date', {}).get('normalized_format', '%Y-%m-%d')
+    return datetime.fromtimestamp(timestamp).strftime(normalized_format)
+
+
 def extract_date_from_file_metadata(file_path: str) -> str:
     """
     Extract date from file metadata (modified or created date) when no date is found in filename.
@@ -596,13 +645,18 @@ def extract_date_from_file_metadata(file_path: str) -> str:
         return ""
 
 
-def extract_date_with_metadata_fallback(filename: str, file_path: str = None) -> str:
+def extract_date_with_metadata_fallback(filename: str, file_path: str = None, document_reader=None) -> str:
     """
     Extract date from filename first, then fall back to file metadata if no date found.
     
+    Metadata sources are tried in Date.date_priority_order: 'document' reads the
+    creation date embedded in the file (PDF/OOXML/EXIF) when a document_reader is
+    supplied, 'modified'/'created' use the file system timestamps.
+    
     Args:
         filename: Filename to extract date from
         file_path: Full path to the file (for metadata fallback)
+        document_reader: Optional DocumentDateReader for embedded document dates
         
     Returns:
         Pipe-separated string: extracted_date|remainder|matched
@@ -613,10 +667,19 @@ def extract_date_with_metadata_fallback(filename: str, file_path: str = None) ->
     
     # If no date found in filename and we have file path, try metadata
     if not parts[0] and file_path:
-        metadata_date = extract_date_from_file_metadata(file_path)
-        if metadata_date:
-            # Return the metadata date with the original filename as remainder
-            return f"{metadata_date}|{filename}|true"
+        config = load_config()
+        date_priority_order = config.get('Date', {}).get('date_priority_order', ['filename', 'foldername', 'modified', 'created'])
+        for source in date_priority_order:
+            if source == 'document' and document_reader is not None:
+                document_date = document_reader.get(file_path)
+                if document_date:
+                    return f"{document_date}|{filename}|true"
+            elif source in ('modified', 'created'):
+                metadata_date = extract_date_from_file_metadata(file_path)
+                if metadata_date:
+                    # Return the metadata date with the original filename as remainder
+                    return f"{metadata_date}|{filename}|true"
+                break
     
     return result
 
@@ -2,21 +2,10 @@ import re
 import sys
 from core.utils.date_matcher import load_config
 
-def is_date_range_and_normalize(text, config=None):
+def range_date_patterns(allowed_formats):
     """
-    Detects if the input text contains a date range (using allowed_formats and exclude_ranges_separators from config),
-    and normalizes it using exclude_ranges_normalized_separator. Returns (is_date_range: bool, normalized_range: str or None).
+    Build the loose date patterns used to detect date ranges, one per allowed format.
     """
-    import datetime
-    if config is None:
-        config = load_config()
-    allowed_formats = config.get('Date', {}).get('allowed_formats', ['%Y-%m-%d'])
-    exclude_ranges_separators = config.get('Date', {}).get('exclude_ranges_separators', [" ", "-", "_", ".", ",", "to"])
-    normalized_separator = config.get('Date', {}).get('exclude_ranges_normalized_separator', " - ")
-    normalized_format = config.get('Date', {}).get('normalized_format', '%Y-%m-%d')
-    normalized_ranges_format = config.get('Date', {}).get('normalized_ranges_format', '%Y-%m-%d')
-
-    # Build regex patterns for all allowed formats
     date_patterns = []
     for fmt in allowed_formats:
         if fmt == "%Y-%m-%d":
@@ -56,6 +45,25 @@ def is_date_range_and_normalize(text, config=None):
         elif fmt == "%d-%m-%y":
             date_patterns.append(r'\d{1,2}-\d{1,2}-\d{2}')
 
+    return date_patterns
+
+
+def is_date_range_and_normalize(text, config=None):
+    """
+    Detects if the input text contains a date range (using allowed_formats and exclude_ranges_separators from config),
+    and normalizes it using exclude_ranges_normalized_separator. Returns (is_date_range: bool, normalized_range: str or None).
+    """
+    import datetime
+    if config is None:
+        config = load_config()
+    allowed_formats = config.get('Date', {}).get('allowed_formats', ['%Y-%m-%d'])
+    exclude_ranges_separators = config.get('Date', {}).get('exclude_ranges_separators', [" ", "-", "_", ".", ",", "to"])
+    normalized_separator = config.get('Date', {}).get('exclude_ranges_normalized_separator', " - ")
+    normalized_format = config.get('Date', {}).get('normalized_format', '%Y-%m-%d')
+    normalized_ranges_format = config.get('Date', {}).get('normalized_ranges_format', '%Y-%m-%d')
+
+    date_patterns = range_date_patterns(allowed_formats)
+
     # Build separator pattern (zero or more, any order)
     escaped_separators = [re.escape(sep) for sep in exclude_ranges_separators]
     separator_pattern = '|'.join(escaped_separators)
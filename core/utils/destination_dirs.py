@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+"""
+Destination Directory Manager for VisualCare File Migration Renamer.
+
+This module creates output directories once and remembers which ones exist, so
+the per-file transfer loop does not repeat mkdir calls (each of which costs
+several round trips on network file systems even when the directory exists).
+
+File Path: core/utils/destination_dirs.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Existing destination folders discovered with a single scandir
+- Batch creation of known target directories in sorted (parent-first) order
+- Thread-safe lookups for the async execution backend
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Iterable
+
+
+class DestinationDirectoryManager:
+    """Create output directories once and remember which ones exist."""
+
+    def __init__(self, output_root: Path):
+        """
+        Initialize the manager.
+
+        Args:
+            output_root: Output directory under which all destinations live.
+        """
+        self.output_root = Path(output_root)
+        self.created = 0
+        self._known = set()
+        self._lock = threading.Lock()
+
+    def scan(self):
+        """Record the output root and its existing subdirectories as known."""
+        self.ensure(self.output_root)
+        try:
+            with os.scandir(self.output_root) as it:
+                existing = [Path(entry.path) for entry in it if entry.is_dir()]
+        except OSError:
+            return
+        with self._lock:
+            self._known.update(existing)
+
+    def prepare(self, directories: Iterable[Path]):
+        """
+        Create every directory that is not already known, parents first.
+
+        Args:
+            directories: Target directories computed from the plan.
+        """
+        for directory in sorted(set(map(Path, directories))):
+            self.ensure(directory)
+
+    def ensure(self, directory: Path) -> Path:
+        """
+        Make sure a directory exists, creating it only the first time it is seen.
+
+        Args:
+            directory: Directory to create.
+
+        Returns:
+            Path: The directory.
+        """
+        directory = Path(directory)
+        if directory in self._known:
+            return directory
+        with self._lock:
+            if directory not in self._known:
+                directory.mkdir(parents=True, exist_ok=True)
+                self.created += 1
+                self._known.add(directory)
+                self._known.update(directory.parents)
+        return directory
@@ -12,7 +12,10 @@ File Path: core/utils/directory_processor.py
 @since   1.0.0
 
 Features:
-- Multi-level directory traversal with configurable depth limits
+- Multi-level directory traversal with configurable depth limits, pruned while
+  descending (the traversal engine of main.py)
+- Folder context (year/date folders, category of the first folder below the
+  person) computed once per directory and shared by its files
 - File and directory ignore patterns
 - Year and date folder detection and handling
 - Smart directory name inclusion/exclusion
@@ -22,40 +25,61 @@ Features:
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Callable, Dict, Iterator, List, Tuple, Optional, Set
 from datetime import datetime
 
+from core.utils.category_processor import match_category_directory
+from core.utils.date_matcher import extract_date_matches
+from core.utils.file_walker import WalkEntry, walk_files
+from core.utils.ignore_matcher import IgnoreMatcher
+
+
+# Folder names seen in one tree are few; the memo is only cleared past this size
+FOLDER_CACHE_SIZE = 65536
+
+_FOUR_DIGITS = re.compile(r'^\d{4}$')
+_DMY_DOTTED = re.compile(r'^\d{2}\.\d{2}\.\d{4}$')
+_YMD_DOTTED = re.compile(r'^\d{4}\.\d{2}\.\d{2}$')
+
 
 class DirectoryProcessor:
     """Handles multi-level directory processing and file filtering."""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, ignore: Optional[IgnoreMatcher] = None):
         """
         Initialize the directory processor with configuration.
         
         Args:
             config: Configuration dictionary containing directory processing settings.
+            ignore: Ignore matcher to share (default: compiled from config, hidden files ignored).
         """
         self.config = config
         self.file_ignore_config = config.get('FileIgnore', {})
         self.dir_structure_config = config.get('DirectoryStructure', {})
         self.date_folder_config = config.get('DateFolderHandling', {})
         
+        self.max_depth = self.dir_structure_config.get('max_depth', 0)
+        
         # Compile ignore patterns for efficiency
-        self._compile_ignore_patterns()
+        self._compile_ignore_patterns(ignore)
+        
+        # Date folder patterns compiled once; classification memoized per folder name
+        self.year_pattern = re.compile(self.date_folder_config.get('year_pattern', r'^\d{4}$'))
+        self.full_date_pattern = re.compile(self.date_folder_config.get(
+            'full_date_pattern', r'^\d{2}\.\d{2}\.\d{4}$|^\d{4}\.\d{2}\.\d{2}$'))
+        self._folder_cache: Dict[str, Tuple[bool, bool, Optional[datetime]]] = {}
+        # Folder context per directory and extracted folder-name dates per folder name
+        self._context_cache: Dict[str, Dict] = {}
+        self._folder_dates: Dict[str, str] = {}
     
-    def _compile_ignore_patterns(self):
+    def _compile_ignore_patterns(self, ignore: Optional[IgnoreMatcher] = None):
         """Compile ignore patterns for efficient matching."""
         self.ignore_files = set(self.file_ignore_config.get('ignore_files', []))
         self.ignore_directories = set(self.file_ignore_config.get('ignore_directories', []))
         self.exclude_directories = set(self.dir_structure_config.get('exclude_directories', []))
         
-        # Compile regex patterns for wildcard matching
-        self.ignore_file_patterns = []
-        for pattern in self.ignore_files:
-            if '*' in pattern:
-                regex_pattern = pattern.replace('*', '.*')
-                self.ignore_file_patterns.append(re.compile(regex_pattern, re.IGNORECASE))
+        # Global.file_exclusions and FileIgnore rules share one compiled matcher
+        self.ignore = ignore or IgnoreMatcher(self.config, ignore_hidden=True)
     
     def should_ignore_file(self, filepath: Path) -> bool:
         """
@@ -67,23 +91,7 @@ class DirectoryProcessor:
         Returns:
             bool: True if file should be ignored, False otherwise.
         """
-        filename = filepath.name
-        
-        # Check exact matches
-        if filename in self.ignore_files:
-            return True
-        
-        # Check wildcard patterns
-        for pattern in self.ignore_file_patterns:
-            if pattern.match(filename):
-                return True
-        
-        # Check hidden files
-        if self.file_ignore_config.get('ignore_hidden_files', True):
-            if filename.startswith('.'):
-                return True
-        
-        return False
+        return self.ignore.ignores_file(filepath.name)
     
     def should_ignore_directory(self, dirpath: Path) -> bool:
         """
@@ -95,18 +103,46 @@ class DirectoryProcessor:
         Returns:
             bool: True if directory should be ignored, False otherwise.
         """
-        dirname = dirpath.name
-        
-        # Check exact matches
-        if dirname in self.ignore_directories:
-            return True
+        return self.ignore.ignores_directory(dirpath.name)
+    
+    def classify_folder(self, dirname: str) -> Tuple[bool, bool, Optional[datetime]]:
+        """
+        Classify a folder name once and remember the result.
         
-        # Check hidden directories
-        if self.file_ignore_config.get('ignore_hidden_files', True):
-            if dirname.startswith('.'):
-                return True
+        Args:
+            dirname: Directory name to classify.
+            
+        Returns:
+            Tuple: (is year folder, is full date folder, date parsed from the name)
+        """
+        cached = self._folder_cache.get(dirname)
+        if cached is not None:
+            return cached
+        
+        enabled = self.date_folder_config.get('enabled', True)
+        is_year = enabled and bool(self.year_pattern.match(dirname))
+        is_full_date = enabled and bool(self.full_date_pattern.match(dirname))
+        parsed_date = None
+        try:
+            # Handle DD.MM.YYYY format
+            if _DMY_DOTTED.match(dirname):
+                parsed_date = datetime.strptime(dirname, '%d.%m.%Y')
+            
+            # Handle YYYY.MM.DD format
+            elif _YMD_DOTTED.match(dirname):
+                parsed_date = datetime.strptime(dirname, '%Y.%m.%d')
+            
+            # Handle YYYY format (convert to January 1st of that year)
+            elif _FOUR_DIGITS.match(dirname):
+                parsed_date = datetime.strptime(f'{dirname}-01-01', '%Y-%m-%d')
+            
+        except ValueError:
+            pass
         
-        return False
+        if len(self._folder_cache) >= FOLDER_CACHE_SIZE:
+            self._folder_cache.clear()
+        result = self._folder_cache[dirname] = (is_year, is_full_date, parsed_date)
+        return result
     
     def is_year_folder(self, dirname: str) -> bool:
         """
@@ -118,11 +154,7 @@ class DirectoryProcessor:
         Returns:
             bool: True if directory name is a year, False otherwise.
         """
-        if not self.date_folder_config.get('enabled', True):
-            return False
-        
-        pattern = self.date_folder_config.get('year_pattern', r'^\d{4}$')
-        return bool(re.match(pattern, dirname))
+        return self.classify_folder(dirname)[0]
     
     def is_full_date_folder(self, dirname: str) -> bool:
         """
@@ -134,11 +166,7 @@ class DirectoryProcessor:
         Returns:
             bool: True if directory name is a full date, False otherwise.
         """
-        if not self.date_folder_config.get('enabled', True):
-            return False
-        
-        pattern = self.date_folder_config.get('full_date_pattern', r'^\d{2}\.\d{2}\.\d{4}$|^\d{4}\.\d{2}\.\d{2}$')
-        return bool(re.match(pattern, dirname))
+        return self.classify_folder(dirname)[1]
     
     def parse_date_from_folder(self, dirname: str) -> Optional[datetime]:
         """
@@ -150,23 +178,7 @@ class DirectoryProcessor:
         Returns:
             datetime: Parsed date object, or None if parsing fails.
         """
-        try:
-            # Handle DD.MM.YYYY format
-            if re.match(r'^\d{2}\.\d{2}\.\d{4}$', dirname):
-                return datetime.strptime(dirname, '%d.%m.%Y')
-            
-            # Handle YYYY.MM.DD format
-            elif re.match(r'^\d{4}\.\d{2}\.\d{2}$', dirname):
-                return datetime.strptime(dirname, '%Y.%m.%d')
-            
-            # Handle YYYY format (convert to January 1st of that year)
-            elif re.match(r'^\d{4}$', dirname):
-                return datetime.strptime(f'{dirname}-01-01', '%Y-%m-%d')
-            
-        except ValueError:
-            pass
-        
-        return None
+        return self.classify_folder(dirname)[2]
     
     def should_include_directory_in_filename(self, dirname: str) -> bool:
         """
@@ -190,6 +202,73 @@ class DirectoryProcessor:
         
         return True
     
+    def folder_context(self, parent_path: Path) -> Dict:
+        """
+        Compute the folder context shared by every file in a directory.
+        
+        Args:
+            parent_path: Directory path relative to the root.
+            
+        Returns:
+            Dict: folder_only_string, year_folders, date_folders, folder_date and
+            category/category_id (exact category mapping match of the first
+            folder below the person folder, "" if none); the same dict is
+            returned for every file of the directory; do not modify it.
+        """
+        key = Path(parent_path).as_posix()
+        cached = self._context_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        year_folders = []
+        date_folders = []
+        folder_date = None
+        parts = Path(parent_path).parts
+        
+        # Process each directory in the path
+        for part in parts:
+            is_year, is_full_date, parsed_date = self.classify_folder(part)
+            if is_year:
+                year_folders.append(part)
+            elif is_full_date:
+                date_folders.append(part)
+                if parsed_date:
+                    folder_date = parsed_date
+        
+        category, category_id = match_category_directory(parts[1], self.config) if len(parts) > 1 else ("", "")
+        
+        if len(self._context_cache) >= FOLDER_CACHE_SIZE:
+            self._context_cache.clear()
+        context = self._context_cache[key] = {
+            'folder_only_string': '/'.join(parts),
+            'year_folders': year_folders,
+            'date_folders': date_folders,
+            'folder_date': folder_date,
+            'category': category,
+            'category_id': category_id,
+        }
+        return context
+    
+    def folder_date_matches(self, dirname: str) -> str:
+        """
+        Memoized extract_date_matches for folder names.
+        
+        Every file of a directory asks for the dates in the same folder name;
+        the extraction runs once per distinct name.
+        
+        Args:
+            dirname: Folder name.
+            
+        Returns:
+            str: extract_date_matches output (extracted_dates|remainder|matched).
+        """
+        result = self._folder_dates.get(dirname)
+        if result is None:
+            if len(self._folder_dates) >= FOLDER_CACHE_SIZE:
+                self._folder_dates.clear()
+            result = self._folder_dates[dirname] = extract_date_matches(dirname)
+        return result
+    
     def extract_folder_path_components(self, filepath: Path, root_path: Path) -> Dict:
         """
         Extract folder path components for a file.
@@ -209,46 +288,6 @@ class DirectoryProcessor:
         try:
             # Get relative path from root
             relative_path = filepath.relative_to(root_path)
-            parent_path = relative_path.parent
-            
-            year_folders = []
-            date_folders = []
-            folder_date = None
-            
-            # Build the full path string for name/date extraction
-            path_parts = []
-            
-            # Process each directory in the path
-            for part in parent_path.parts:
-                path_parts.append(part)
-                
-                if self.is_year_folder(part):
-                    year_folders.append(part)
-                elif self.is_full_date_folder(part):
-                    date_folders.append(part)
-                    parsed_date = self.parse_date_from_folder(part)
-                    if parsed_date:
-                        folder_date = parsed_date
-            
-            # Add the filename to the path
-            path_parts.append(filepath.name)
-            
-            # Create the full path string (folders + filename)
-            full_path_string = '/'.join(path_parts)
-            
-            # Create folder-only string for remainder processing (without filename)
-            folder_only_parts = path_parts[:-1]  # Exclude the filename
-            folder_only_string = '/'.join(folder_only_parts) if folder_only_parts else ""
-            
-            return {
-                'full_path_string': full_path_string,
-                'folder_only_string': folder_only_string,
-                'year_folders': year_folders,
-                'date_folders': date_folders,
-                'folder_date': folder_date,
-                'relative_path': str(relative_path)
-            }
-            
         except ValueError:
             # File is not relative to root path
             return {
@@ -259,55 +298,94 @@ class DirectoryProcessor:
                 'folder_date': None,
                 'relative_path': str(filepath)
             }
+        return self._file_info(relative_path)
     
-    def get_files_recursive(self, root_path: Path, max_depth: Optional[int] = None) -> List[Tuple[Path, Dict]]:
+    def _file_info(self, relative_path: Path) -> Dict:
+        """Combine the shared folder context of a file with its own path fields."""
+        context = self.folder_context(relative_path.parent)
+        folder_only_string = context['folder_only_string']
+        info = dict(context)
+        info['full_path_string'] = f"{folder_only_string}/{relative_path.name}" if folder_only_string else relative_path.name
+        info['relative_path'] = str(relative_path)
+        return info
+    
+    def skip_dir(self, relative_path: Path) -> bool:
         """
-        Get all files recursively from a directory, respecting ignore patterns.
+        Directory pruning callable for walk_files (ignore rules and max_depth).
         
         Args:
-            root_path: Root directory to scan.
-            max_depth: Maximum depth to scan (None for unlimited).
+            relative_path: Directory path relative to the root.
             
         Returns:
-            List[Tuple[Path, Dict]]: List of (filepath, folder_info) tuples.
+            bool: True if nothing below the directory is processed.
         """
-        files = []
-        
-        if max_depth is None:
-            max_depth = self.dir_structure_config.get('max_depth', 0)
+        if self.max_depth > 0 and len(Path(relative_path).parts) >= self.max_depth:
+            return True
+        return self.ignore.skip_dir(relative_path)
+    
+    def include(self, relative_path: Path) -> bool:
+        """
+        File inclusion callable (ignore rules and max_depth).
         
-        for filepath in root_path.rglob('*'):
-            # Check depth limit
-            if max_depth > 0:
-                depth = len(filepath.relative_to(root_path).parts)
-                if depth > max_depth:
-                    continue
-            
-            # Skip if it's a directory
-            if filepath.is_dir():
-                continue
-            
-            # Check if file should be ignored
-            if self.should_ignore_file(filepath):
-                continue
+        Args:
+            relative_path: File path relative to the root.
             
-            # Check if any parent directory should be ignored
-            should_skip = False
-            for parent in filepath.parents:
-                if parent == root_path:
-                    break
-                if self.should_ignore_directory(parent):
-                    should_skip = True
-                    break
+        Returns:
+            bool: True if the file is processed.
+        """
+        if self.max_depth > 0 and len(Path(relative_path).parts) > self.max_depth:
+            return False
+        return self.ignore.include(relative_path)
+    
+    def walk_entries(self, root_path: Path, skip_dir: Optional[Callable[[Path], bool]] = None) -> Iterator[WalkEntry]:
+        """
+        Walk a tree with the ignore and depth rules applied while descending.
+        
+        Args:
+            root_path: Root directory to scan.
+            skip_dir: Optional additional directory pruning callable (e.g. sharding).
             
-            if should_skip:
-                continue
+        Yields:
+            WalkEntry for each file that is not ignored.
+        """
+        prune = (lambda relative_path: self.skip_dir(relative_path) or skip_dir(relative_path)) if skip_dir else self.skip_dir
+        for entry in walk_files(Path(root_path), prune):
+            if self.include(entry.relative_path):
+                yield entry
+    
+    def walk(self, root_path: Path, skip_dir: Optional[Callable[[Path], bool]] = None) -> Iterator[Tuple[Path, Dict]]:
+        """
+        Walk a tree yielding files with their folder information.
+        
+        Args:
+            root_path: Root directory to scan.
+            skip_dir: Optional additional directory pruning callable.
             
-            # Extract folder path information
-            folder_info = self.extract_folder_path_components(filepath, root_path)
-            files.append((filepath, folder_info))
+        Yields:
+            Tuple[Path, Dict]: (filepath, folder_info) per file.
+        """
+        for entry in self.walk_entries(root_path, skip_dir):
+            yield entry.path, self._file_info(entry.relative_path)
+    
+    def get_files_recursive(self, root_path: Path, max_depth: Optional[int] = None) -> List[Tuple[Path, Dict]]:
+        """
+        Get all files recursively from a directory, respecting ignore patterns.
         
-        return files
+        Args:
+            root_path: Root directory to scan.
+            max_depth: Maximum depth to scan (None for DirectoryStructure.max_depth).
+            
+        Returns:
+            List[Tuple[Path, Dict]]: List of (filepath, folder_info) tuples.
+        """
+        if max_depth is None or max_depth == self.max_depth:
+            return list(self.walk(root_path))
+        configured = self.max_depth
+        self.max_depth = max_depth
+        try:
+            return list(self.walk(root_path))
+        finally:
+            self.max_depth = configured
     
     def get_priority_date(self, folder_date: Optional[datetime], filename_date: Optional[datetime], 
                          modified_date: Optional[datetime], created_date: Optional[datetime]) -> Optional[datetime]:
@@ -373,7 +451,7 @@ class DirectoryProcessor:
         for part in folder_parts:
             part = part.strip()
             # Handle year folders (4 digits)
-            if re.match(r'^\d{4}$', part):
+            if _FOUR_DIGITS.match(part):
                 if preserve_year_folders:
                     processed_parts.append(part)
                 continue
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+
+"""
+Document Metadata Date Reader for VisualCare File Migration Renamer.
+
+This module reads creation dates stored inside documents (rather than the file
+system timestamps, which on migrated shares are usually just the copy time).
+Reads are limited to small byte ranges so large files are never loaded whole.
+
+File Path: core/utils/document_dates.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Supported Sources:
+- PDF Info dictionary (/CreationDate) and XMP packet (xmp:CreateDate)
+- Office Open XML docProps/core.xml (dcterms:created) for .docx/.xlsx/.pptx
+- JPEG and TIFF EXIF (DateTimeOriginal, DateTimeDigitized, DateTime)
+
+Features:
+- Seek-limited reads of the head/tail windows only
+- Thread pool prefetching so reads overlap with extraction; a read is
+  released (cancelled if not started) once its file has been handled, whichever
+  date source was used, so memory stays bounded by the prefetch window
+- Plugs into Date.date_priority_order as the 'document' source
+
+Configuration:
+- MetadataDates.enabled: Turn the stage on (default: false)
+- MetadataDates.max_read_bytes: Size of each byte window read from a file
+- MetadataDates.max_workers: Thread pool size for prefetching
+- MetadataDates.prefetch_window: Number of files submitted ahead of processing
+"""
+
+import re
+import struct
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+
+PDF_EXTENSIONS = {'.pdf'}
+OOXML_EXTENSIONS = {'.docx', '.docm', '.xlsx', '.xlsm', '.pptx', '.pptm'}
+EXIF_EXTENSIONS = {'.jpg', '.jpeg', '.tif', '.tiff'}
+SUPPORTED_EXTENSIONS = PDF_EXTENSIONS | OOXML_EXTENSIONS | EXIF_EXTENSIONS
+
+_PDF_CREATION_DATE = re.compile(rb'/CreationDate\s*\(\s*(?:D:)?(\d{4})(\d{2})(\d{2})')
+_XMP_CREATE_DATE = re.compile(rb'xmp:CreateDate(?:>|\s*=\s*["\'])\s*(\d{4})-(\d{2})-(\d{2})')
+_OOXML_CREATED = re.compile(rb'<dcterms:created[^>]*>\s*(\d{4})-(\d{2})-(\d{2})')
+_EXIF_DATE = re.compile(rb'^(\d{4}):(\d{2}):(\d{2})')
+
+# EXIF tag ids in preference order
+_TAG_DATETIME_ORIGINAL = 0x9003
+_TAG_DATETIME_DIGITIZED = 0x9004
+_TAG_DATETIME = 0x0132
+_TAG_EXIF_IFD = 0x8769
+
+
+def _to_datetime(year: bytes, month: bytes, day: bytes) -> Optional[datetime]:
+    """Convert matched date components to a datetime, rejecting impossible values."""
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _read_range(f, offset: int, size: int) -> bytes:
+    """Read at most size bytes starting at offset."""
+    f.seek(offset)
+    return f.read(size)
+
+
+def read_pdf_date(path: Path, max_read_bytes: int) -> Optional[datetime]:
+    """
+    Read the creation date from a PDF's Info dictionary or XMP packet.
+
+    Only the first and last max_read_bytes of the file are inspected; the Info
+    dictionary is normally referenced from the trailer and XMP packets are
+    normally near the start of linearised files.
+
+    Args:
+        path: Path to the PDF.
+        max_read_bytes: Size of the head and tail windows.
+
+    Returns:
+        datetime: Creation date, or None if not found.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(max_read_bytes)
+        if not head.startswith(b'%PDF'):
+            return None
+        size = f.seek(0, 2)
+        tail = b''
+        if size > max_read_bytes:
+            tail = _read_range(f, max(max_read_bytes, size - max_read_bytes), max_read_bytes)
+
+    for window in (tail, head):
+        for pattern in (_PDF_CREATION_DATE, _XMP_CREATE_DATE):
+            match = pattern.search(window)
+            if match:
+                date = _to_datetime(*match.groups())
+                if date:
+                    return date
+    return None
+
+
+def read_ooxml_date(path: Path, max_read_bytes: int) -> Optional[datetime]:
+    """
+    Read dcterms:created from docProps/core.xml of an Office Open XML file.
+
+    zipfile only reads the central directory and the single requested member,
+    so the document body is never touched.
+
+    Args:
+        path: Path to the .docx/.xlsx/.pptx file.
+        max_read_bytes: Maximum number of bytes read from core.xml.
+
+    Returns:
+        datetime: Creation date, or None if not found.
+    """
+    try:
+        with zipfile.ZipFile(path) as archive:
+            with archive.open('docProps/core.xml') as member:
+                core = member.read(max_read_bytes)
+    except (KeyError, zipfile.BadZipFile):
+        return None
+
+    match = _OOXML_CREATED.search(core)
+    return _to_datetime(*match.groups()) if match else None
+
+
+def _read_tiff_date(read_at: Callable[[int, int], bytes], base: int) -> Optional[datetime]:
+    """
+    Walk a TIFF structure (standalone or embedded in a JPEG APP1 segment).
+
+    Args:
+        read_at: Callable returning size bytes from an absolute file offset.
+        base: Absolute offset of the TIFF header.
+
+    Returns:
+        datetime: Best available EXIF date, or None.
+    """
+    header = read_at(base, 8)
+    if len(header) < 8:
+        return None
+    if header[:2] == b'II':
+        endian = '<'
+    elif header[:2] == b'MM':
+        endian = '>'
+    else:
+        return None
+    if struct.unpack(endian + 'H', header[2:4])[0] != 42:
+        return None
+
+    def read_ifd(offset: int) -> Dict[int, bytes]:
+        """Return raw ASCII values and pointers for the tags we care about."""
+        count_bytes = read_at(base + offset, 2)
+        if len(count_bytes) < 2:
+            return {}
+        count = min(struct.unpack(endian + 'H', count_bytes)[0], 512)
+        entries = read_at(base + offset + 2, count * 12)
+        values = {}
+        for i in range(len(entries) // 12):
+            tag, field_type, n, value = struct.unpack(endian + 'HHI4s', entries[i * 12:(i + 1) * 12])
+            if tag == _TAG_EXIF_IFD:
+                values[tag] = value
+            elif tag in (_TAG_DATETIME_ORIGINAL, _TAG_DATETIME_DIGITIZED, _TAG_DATETIME) and field_type == 2:
+                pointer = struct.unpack(endian + 'I', value)[0]
+                values[tag] = read_at(base + pointer, min(n, 32)) if n > 4 else value
+        return values
+
+    ifd0_offset = struct.unpack(endian + 'I', header[4:8])[0]
+    tags = read_ifd(ifd0_offset)
+    if _TAG_EXIF_IFD in tags:
+        exif_offset = struct.unpack(endian + 'I', tags[_TAG_EXIF_IFD])[0]
+        tags.update(read_ifd(exif_offset))
+
+    for tag in (_TAG_DATETIME_ORIGINAL, _TAG_DATETIME_DIGITIZED, _TAG_DATETIME):
+        raw = tags.get(tag)
+        if raw:
+            match = _EXIF_DATE.match(raw)
+            if match:
+                date = _to_datetime(*match.groups())
+                if date:
+                    return date
+    return None
+
+
+def read_exif_date(path: Path, max_read_bytes: int) -> Optional[datetime]:
+    """
+    Read the EXIF date of a JPEG or TIFF file.
+
+    For JPEG files only segment headers are read until the APP1 Exif segment is
+    found (never past max_read_bytes); TIFF files are read tag by tag.
+
+    Args:
+        path: Path to the image.
+        max_read_bytes: Upper bound on the offset scanned for the APP1 segment.
+
+    Returns:
+        datetime: Capture date, or None if not found.
+    """
+    with open(path, 'rb') as f:
+        read_at = lambda offset, size: _read_range(f, offset, size)
+        start = read_at(0, 4)
+        if start[:2] in (b'II', b'MM'):
+            return _read_tiff_date(read_at, 0)
+        if start[:2] != b'\xff\xd8':
+            return None
+
+        offset = 2
+        while offset < max_read_bytes:
+            marker = read_at(offset, 4)
+            if len(marker) < 4 or marker[0] != 0xFF:
+                return None
+            segment_length = struct.unpack('>H', marker[2:4])[0]
+            if marker[1] == 0xE1 and read_at(offset + 4, 6) == b'Exif\x00\x00':
+                return _read_tiff_date(read_at, offset + 10)
+            if marker[1] in (0xDA, 0xD9):
+                # Start of scan / end of image: no metadata beyond this point
+                return None
+            offset += 2 + segment_length
+    return None
+
+
+def read_document_date(file_path: str, max_read_bytes: int = 65536) -> Optional[datetime]:
+    """
+    Read the creation date embedded in a document, dispatching on extension.
+
+    Args:
+        file_path: Path to the file.
+        max_read_bytes: Size of each byte window read from the file.
+
+    Returns:
+        datetime: Embedded creation date, or None if unavailable.
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    try:
+        if suffix in PDF_EXTENSIONS:
+            return read_pdf_date(path, max_read_bytes)
+        if suffix in OOXML_EXTENSIONS:
+            return read_ooxml_date(path, max_read_bytes)
+        if suffix in EXIF_EXTENSIONS:
+            return read_exif_date(path, max_read_bytes)
+    except (OSError, struct.error, ValueError):
+        return None
+    return None
+
+
+class DocumentDateReader:
+    """Thread-pooled reader of embedded document dates."""
+
+    def __init__(self, config: Dict):
+        """
+        Initialize the reader.
+
+        Args:
+            config: Configuration dictionary containing MetadataDates settings.
+        """
+        settings = config.get('MetadataDates', {})
+        self.max_read_bytes = settings.get('max_read_bytes', 65536)
+        self.prefetch_window = max(1, settings.get('prefetch_window', 64))
+        self.normalized_format = config.get('Date', {}).get('normalized_format', '%Y-%m-%d')
+        self._executor = ThreadPoolExecutor(max_workers=settings.get('max_workers', 8),
+                                            thread_name_prefix='document-dates')
+        self._futures: Dict[str, Future] = {}
+
+    def submit(self, file_path: str) -> Future:
+        """
+        Schedule a background read for a file (no-op if already scheduled).
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            Future: Future resolving to a datetime or None.
+        """
+        key = str(file_path)
+        future = self._futures.get(key)
+        if future is None:
+            future = self._executor.submit(read_document_date, key, self.max_read_bytes)
+            self._futures[key] = future
+        return future
+
+    def get(self, file_path: str) -> str:
+        """
+        Return the normalized embedded date for a file, waiting for a prefetched read.
+
+        The entry is released once consumed so memory stays bounded by the
+        prefetch window.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            str: Date formatted with Date.normalized_format, or empty string.
+        """
+        key = str(file_path)
+        future = self._futures.pop(key, None) or self._executor.submit(
+            read_document_date, key, self.max_read_bytes)
+        date = future.result()
+        return date.strftime(self.normalized_format) if date else ""
+
+    def prefetch(self, items: Iterable, key: Callable = lambda item: item) -> Iterator:
+        """
+        Pass items through while keeping prefetch_window reads in flight ahead.
+
+        Args:
+            items: Iterable of file paths (or walker entries) in processing order.
+            key: Callable returning the Path of an item.
+
+        Yields:
+            The same items, in order. An item's read is released when the
+            next item is requested, i.e. after the caller handled it.
+        """
+        window = deque()
+        for item in items:
+            path = key(item)
+            if path.suffix.lower() in SUPPORTED_EXTENSIONS:
+                self.submit(str(path))
+            window.append((item, path))
+            if len(window) >= self.prefetch_window:
+                item, path = window.popleft()
+                yield item
+                self.release(path)
+        while window:
+            item, path = window.popleft()
+            yield item
+            self.release(path)
+
+    def release(self, file_path: str):
+        """
+        Drop the read of a handled file, cancelling it if it has not started.
+
+        Files dated by their name or folder never reach get(); releasing them
+        here keeps the pending reads limited to the prefetch window.
+
+        Args:
+            file_path: Path to the file.
+        """
+        future = self._futures.pop(str(file_path), None)
+        if future is not None:
+            future.cancel()
+
+    def close(self):
+        """Shut down the thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._futures.clear()
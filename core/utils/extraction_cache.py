@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+"""
+Persistent Extraction Cache for VisualCare File Migration Renamer.
+
+This module provides an optional SQLite-backed cache of per-path extraction
+results so repeated runs over the same source tree (for example while tuning
+components.yaml or the mapping CSVs) can skip the extraction pipeline for
+files whose inputs have not changed.
+
+File Path: core/utils/extraction_cache.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Entries keyed by relative path plus content hashes of the configuration
+  file, the user mapping CSV and the category mapping CSV
+- Any change to one of those files turns every affected lookup into a miss
+- Source size and mtime are stored with each entry so edited files are re-extracted
+- WAL journal mode and per-thread connections for concurrent workers
+- Batched commits to keep write overhead low on large runs
+
+Configuration:
+- ExtractionCache.enabled: Enable the cache without passing --cache
+- ExtractionCache.path: Database location (relative paths resolve from project root)
+- ExtractionCache.commit_interval: Number of writes between commits
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    relative_path TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (relative_path, fingerprint)
+)
+"""
+
+
+def hash_file(path: Optional[Path]) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        path: File to hash, or None.
+
+    Returns:
+        str: Hex digest of the file contents, or "missing" if it cannot be read.
+    """
+    if path is None:
+        return "missing"
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    except OSError:
+        return "missing"
+    return digest.hexdigest()
+
+
+def resolve_mapping_path(config: Dict, section: str, env_var: str, default: str) -> Path:
+    """
+    Resolve a mapping CSV path the same way the extractors do.
+
+    Args:
+        config: Configuration dictionary.
+        section: Config section holding mapping_test_file (e.g. 'UserMapping').
+        env_var: Environment variable that overrides the configured path.
+        default: Fallback path when neither is set.
+
+    Returns:
+        Path: Absolute path to the mapping file.
+    """
+    mapping_file = os.environ.get(env_var) or config.get(section, {}).get('mapping_test_file', default)
+    mapping_path = Path(mapping_file)
+    if not mapping_path.is_absolute():
+        mapping_path = PROJECT_ROOT / mapping_path
+    return mapping_path
+
+
+class ExtractionCache:
+    """SQLite-backed cache of per-path extraction results."""
+
+    def __init__(self, db_path: str, fingerprint: str, commit_interval: int = 500):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            fingerprint: Combined hash of every input that affects extraction.
+            commit_interval: Number of writes to buffer before committing.
+        """
+        self.db_path = Path(db_path)
+        self.fingerprint = fingerprint
+        self.commit_interval = max(1, commit_interval)
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection()
+        conn.execute(_SCHEMA)
+        conn.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict, config_path: str, db_path: Optional[str] = None,
+                    variant: str = "") -> 'ExtractionCache':
+        """
+        Build a cache whose fingerprint covers the config and both mapping files.
+
+        Args:
+            config: Loaded configuration dictionary.
+            config_path: Path of the configuration file that was loaded.
+            db_path: Database path override (defaults to ExtractionCache.path).
+            variant: Extra options that change output (e.g. CLI flags).
+
+        Returns:
+            ExtractionCache: Ready-to-use cache instance.
+        """
+        cache_config = config.get('ExtractionCache', {})
+        if db_path is None:
+            db_path = cache_config.get('path', '.vcmigrate/extraction_cache.sqlite')
+        resolved = Path(db_path)
+        if not resolved.is_absolute():
+            resolved = PROJECT_ROOT / resolved
+
+        user_mapping_path = resolve_mapping_path(
+            config, 'UserMapping', 'VC_USER_MAPPING_FILE', 'config/user_mapping.csv')
+        category_mapping_path = resolve_mapping_path(
+            config, 'Category', 'VC_CATEGORY_MAPPING_FILE', 'tests/fixtures/04_category_mapping.csv')
+
+        parts = [
+            hash_file(Path(config_path)),
+            hash_file(user_mapping_path),
+            hash_file(category_mapping_path),
+            variant,
+        ]
+        fingerprint = hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+        return cls(str(resolved), fingerprint, cache_config.get('commit_interval', 500))
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pending = 0
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def get(self, relative_path: str, stat: os.stat_result) -> Optional[Dict]:
+        """
+        Look up a cached extraction result.
+
+        Args:
+            relative_path: Path relative to the input root.
+            stat: Current stat result of the source file.
+
+        Returns:
+            Dict: Cached result, or None on a miss or stale entry.
+        """
+        row = self._connection().execute(
+            'SELECT size, mtime_ns, result FROM extractions WHERE relative_path = ? AND fingerprint = ?',
+            (relative_path, self.fingerprint)
+        ).fetchone()
+        if row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[2])
+
+    def put(self, relative_path: str, stat: os.stat_result, result: Dict):
+        """
+        Store an extraction result.
+
+        Args:
+            relative_path: Path relative to the input root.
+            stat: Stat result of the source file at extraction time.
+            result: JSON-serialisable extraction result.
+        """
+        conn = self._connection()
+        conn.execute(
+            'INSERT OR REPLACE INTO extractions (relative_path, fingerprint, size, mtime_ns, result) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (relative_path, self.fingerprint, stat.st_size, stat.st_mtime_ns, json.dumps(result))
+        )
+        self._local.pending += 1
+        if self._local.pending >= self.commit_interval:
+            conn.commit()
+            self._local.pending = 0
+
+    def prune(self) -> int:
+        """
+        Delete entries written under a different fingerprint.
+
+        Returns:
+            int: Number of rows removed.
+        """
+        conn = self._connection()
+        cursor = conn.execute('DELETE FROM extractions WHERE fingerprint != ?', (self.fingerprint,))
+        conn.commit()
+        return cursor.rowcount
+
+    def close(self):
+        """Commit pending writes and close every connection opened by this cache."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.commit()
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
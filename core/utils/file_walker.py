@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Streaming File Walker for VisualCare File Migration Renamer.
+
+This module provides an os.scandir based directory walker that yields each
+file together with the stat result captured during the walk, so later stages
+(date extraction, timestamp restoration, caching) never need to stat again.
+
+File Path: core/utils/file_walker.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Lazy, depth-first traversal with constant memory per directory level
+- One stat per file, reused by every downstream stage
+- Deterministic (name-sorted) order within each directory
+- Symlinked files are followed; symlinked directories are not descended into
+- Creation time via st_birthtime where the platform exposes it
+"""
+
+import os
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple, Optional
+
+
+class WalkEntry(NamedTuple):
+    """A file discovered by the walker."""
+    path: Path
+    relative_path: Path
+    stat: os.stat_result
+
+
+def walk_files(root: Path, skip_dir: Optional[Callable[[Path], bool]] = None) -> Iterator[WalkEntry]:
+    """
+    Walk a directory tree yielding files with their stat results.
+
+    Args:
+        root: Root directory to walk.
+        skip_dir: Optional callable given a directory's relative path; return
+            True to prune it (and everything below it) from the walk.
+
+    Yields:
+        WalkEntry: One entry per regular file (or symlink to one).
+    """
+    root = Path(root)
+    stack = [(root, Path())]
+    while stack:
+        directory, relative = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if skip_dir is None or not skip_dir(relative / entry.name):
+                        subdirectories.append((Path(entry.path), relative / entry.name))
+                elif entry.is_file():
+                    yield WalkEntry(Path(entry.path), relative / entry.name, entry.stat())
+            except OSError:
+                continue
+
+        # Reverse so the stack pops subdirectories in name order
+        stack.extend(reversed(subdirectories))
+
+
+def file_birthtime(stat: os.stat_result) -> Optional[float]:
+    """
+    Return the creation time recorded in a stat result.
+
+    st_birthtime is used where the platform reports it (macOS, BSD, Windows);
+    otherwise st_ctime is the closest value available without another syscall.
+
+    Args:
+        stat: Stat result captured by the walker.
+
+    Returns:
+        float: Creation timestamp, or None if unavailable.
+    """
+    birthtime = getattr(stat, 'st_birthtime', None)
+    if birthtime:
+        return birthtime
+    return stat.st_ctime or None
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+"""
+Compiled Filename Formatter for VisualCare File Migration Renamer.
+
+One formatter assembles every output filename (format_filename, the output
+name builder, format_filename_with_id and the category placement), so all of
+them agree on component order, separator and empty-component handling. The
+component order is compiled once into a tuple of field names; formatting a
+file is a single join that skips empty components.
+
+File Path: core/utils/filename_formatter.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Component order and separator read once per formatter, unknown components
+  dropped at compile time
+- Empty components skipped, separators at the edges of a component trimmed
+  and doubled separators inside one collapsed with plain string operations
+  (same output as the former join + regex collapse + strip)
+- Orders given as a template ("{id}_{name}_{date}") compiled to the same form
+- Templates compiled with their literal text ("{id}-{name} {date}") keep
+  their own separators; runs of the component separator are collapsed and
+  trimmed from the edges (FilenameFormat.skip_empty_components,
+  FilenameFormat.cleanup_separators)
+- join() for callers that add a component to an existing name (category placement)
+
+Configuration:
+- Global.component_order: Components of the output filename, in order
+- Global.component_separator: Separator placed between components
+- FilenameFormat.skip_empty_components: Trim separators left at the edges by
+  empty template components
+- FilenameFormat.cleanup_separators: Collapse repeated separators in templates
+"""
+
+from string import Formatter
+from typing import Dict, Iterable, List, Optional
+
+
+COMPONENTS = ('id', 'name', 'remainder', 'date', 'category', 'management')
+
+# Template placeholders that differ from the component name
+TEMPLATE_ALIASES = {'management_flag': 'management'}
+
+
+def template_order(template: str) -> List[str]:
+    """
+    Component order of a filename template.
+
+    Args:
+        template: Template such as "{id}_{name}_{remainder}_{date}".
+
+    Returns:
+        List[str]: Component names in the order of their placeholders.
+    """
+    return [TEMPLATE_ALIASES.get(field, field)
+            for _, field, _, _ in Formatter().parse(template) if field]
+
+
+class FilenameFormatter:
+    """Join filename components in the configured order."""
+
+    def __init__(self, config: Dict, component_order: Optional[Iterable[str]] = None,
+                 template: Optional[str] = None):
+        """
+        Compile the component layout.
+
+        Args:
+            config: Configuration dictionary (Global component settings).
+            component_order: Order overriding Global.component_order.
+            template: Template ("{id}_{name}_{date}") whose placeholders and
+                literal text make up the filename, instead of a component order.
+        """
+        global_config = config.get('Global', {})
+        if template is not None:
+            component_order = template_order(template)
+        if component_order is None:
+            component_order = global_config.get('component_order', COMPONENTS)
+        self.component_order = list(component_order)
+        self.separator = global_config.get('component_separator', '_')
+        self._fields = tuple(component for component in self.component_order if component in COMPONENTS)
+        self._double = self.separator * 2
+        self._template = None
+        if template is not None:
+            self._template = tuple((literal, TEMPLATE_ALIASES.get(field, field) if field else None)
+                                   for literal, field, _, _ in Formatter().parse(template))
+            format_config = config.get('FilenameFormat', {})
+            self._strip_edges = format_config.get('skip_empty_components', True)
+            self._collapse = self._strip_edges or format_config.get('cleanup_separators', True)
+
+    def _clean(self, value: str) -> str:
+        """Trim separators from a component and collapse doubled ones."""
+        if not value or not self.separator:
+            return value
+        while self._double in value:
+            value = value.replace(self._double, self.separator)
+        return value.strip(self.separator)
+
+    def join(self, values: Iterable[str]) -> str:
+        """
+        Join values with the separator, skipping empty ones.
+
+        Args:
+            values: Component values in output order.
+
+        Returns:
+            str: Joined name.
+        """
+        clean = self._clean
+        return self.separator.join(value for value in map(clean, values) if value)
+
+    def format(self, components: Dict[str, str]) -> str:
+        """
+        Format a filename (without extension) from its components.
+
+        Args:
+            components: Component name -> value; missing or empty components are left out.
+
+        Returns:
+            str: Formatted filename.
+        """
+        get = components.get
+        if self._template is not None:
+            return self._fill(get)
+        return self.join(get(field, '') for field in self._fields)
+
+    def _fill(self, get) -> str:
+        """Fill the compiled template, then collapse and trim separators."""
+        value = ''.join(literal + (get(field, '') if field else '') for literal, field in self._template)
+        if not self.separator:
+            return value
+        if self._collapse:
+            while self._double in value:
+                value = value.replace(self._double, self.separator)
+        if self._strip_edges:
+            value = value.strip(self.separator)
+        return value
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""
+Target File System Sanitizer for VisualCare File Migration Renamer.
+
+Output names must be legal on the Windows/SharePoint destination. This module
+replaces characters the destination rejects, trims trailing dots and spaces
+and renames reserved device names (CON, NUL, COM1, ...) while the plan is
+computed, so no second pass over the output tree is needed.
+
+File Path: core/utils/filename_sanitizer.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- One str.translate call per component with a table built from the
+  configuration (control characters are always replaced)
+- Optional per-character replacements (e.g. ":" -> "-")
+- Runs of the replacement collapsed and trimmed only when something changed
+- Reserved names checked with a set lookup on the part before the first dot,
+  case-insensitively, as Windows does
+
+Configuration:
+- FilenameSanitizer.enabled: Sanitize output names
+- FilenameSanitizer.illegal_characters: Characters the destination rejects
+- FilenameSanitizer.replacement: Text used for illegal characters ("" removes them)
+- FilenameSanitizer.character_map: Per-character replacements overriding replacement
+- FilenameSanitizer.strip_trailing: Characters removed from the end of a name
+- FilenameSanitizer.reserved_names: Names the destination reserves
+- FilenameSanitizer.reserved_suffix: Appended to a reserved name
+"""
+
+from typing import Dict
+
+
+ILLEGAL_CHARACTERS = '<>:"/\\|?*'
+
+RESERVED_NAMES = (['CON', 'PRN', 'AUX', 'NUL']
+                  + [f'COM{number}' for number in range(1, 10)]
+                  + [f'LPT{number}' for number in range(1, 10)])
+
+
+class FilenameSanitizer:
+    """Make names legal on the destination file system."""
+
+    def __init__(self, config: Dict):
+        """
+        Build the translation table and reserved name set.
+
+        Args:
+            config: Configuration dictionary (FilenameSanitizer settings).
+        """
+        settings = config.get('FilenameSanitizer', {})
+        self.enabled = settings.get('enabled', True)
+        self.replacement = settings.get('replacement', ' ')
+        self.strip_trailing = settings.get('strip_trailing', '. ')
+        self.reserved_suffix = settings.get('reserved_suffix', '_')
+        self.reserved_names = frozenset(name.upper() for name in settings.get('reserved_names', RESERVED_NAMES))
+
+        table = {code: self.replacement for code in range(32)}
+        table.update((char, self.replacement) for char in settings.get('illegal_characters', ILLEGAL_CHARACTERS))
+        table.update(settings.get('character_map', {}) or {})
+        self.table = str.maketrans(table)
+        self._double = self.replacement * 2
+
+    def replace_illegal(self, text: str) -> str:
+        """
+        Replace illegal characters (used on each filename component).
+
+        Args:
+            text: Component or name.
+
+        Returns:
+            str: Text without illegal characters.
+        """
+        if not self.enabled or not text:
+            return text
+        translated = text.translate(self.table)
+        if translated != text and self.replacement:
+            while self._double in translated:
+                translated = translated.replace(self._double, self.replacement)
+            translated = translated.strip(self.replacement)
+        return translated
+
+    def finish(self, filename: str) -> str:
+        """
+        Trim trailing dots and spaces and rename reserved device names ("CON.pdf" -> "CON_.pdf").
+
+        Args:
+            filename: Complete filename.
+
+        Returns:
+            str: Filename the destination accepts.
+        """
+        if not self.enabled:
+            return filename
+        filename = filename.rstrip(self.strip_trailing)
+        stem, dot, rest = filename.partition('.')
+        if stem.rstrip(' ').upper() not in self.reserved_names:
+            return filename
+        return stem.rstrip(' ') + self.reserved_suffix + dot + rest
+
+    def sanitize(self, name: str) -> str:
+        """
+        Make a complete name legal (illegal characters, trailing characters, reserved names).
+
+        Args:
+            name: File or folder name.
+
+        Returns:
+            str: Sanitized name.
+        """
+        return self.finish(self.replace_illegal(name))
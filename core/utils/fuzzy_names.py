@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+
+"""
+Typo-Tolerant Name Resolution for VisualCare File Migration Renamer.
+
+Person folders are typed by hand ("Jon Doe", "John  Do"); when the exact
+registry lookup misses, the file loses its user ID. This module finds the
+registered names within a small Damerau-Levenshtein distance (optimal string
+alignment: insertions, deletions, substitutions and adjacent transpositions)
+of a folder name, using a trigram index so only a handful of registry names
+are compared per lookup.
+
+File Path: core/utils/fuzzy_names.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Trigram inverted index over the normalized registry names, built once
+- Candidate filtering without distance computations: length difference,
+  trigram and bigram count bounds (an edit destroys at most 4 trigrams and
+  3 bigrams)
+- Bit-parallel OSA distance (Hyyrö 2003) for the remaining candidates
+- Distance threshold capped per name length, so short names need closer matches
+- Ambiguous matches (several people at the best distance) are reported and,
+  by default, not resolved; every planned file of an approximately resolved
+  folder carries the match as a warning
+- Results memoized per folder name
+
+Configuration:
+- FuzzyNames.enabled: Try approximate matching when the exact lookup misses
+  (off by default: the user ID of a record would come from a guess)
+- FuzzyNames.max_distance: Largest OSA distance accepted
+- FuzzyNames.max_ratio: Largest distance as a fraction of the name length
+- FuzzyNames.min_length: Names shorter than this are never matched approximately
+- FuzzyNames.ambiguity: "skip" (leave unresolved) or "first" (take the first registered)
+- FuzzyNames.cache_size: Memoized folder names
+"""
+
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from core.utils.text_normalization import TextNormalizer
+
+
+class FuzzyMatch(NamedTuple):
+    """The registry entry closest to a name that has no exact match."""
+    query: str
+    name: str
+    value: str
+    distance: int
+    ambiguous: bool = False
+    alternatives: Tuple[str, ...] = ()
+
+    def describe(self) -> str:
+        """
+        Human readable summary for plan warnings.
+
+        Returns:
+            str: Description of the match or of the ambiguity.
+        """
+        if self.ambiguous:
+            return (f"Ambiguous person folder: '{self.query}' is {self.distance} edit(s) from "
+                    f"{', '.join(repr(name) for name in (self.name,) + self.alternatives)}")
+        return f"Approximate person match: '{self.query}' resolved to '{self.name}' ({self.distance} edit(s))"
+
+
+def _bigrams(text: str) -> FrozenSet[str]:
+    """Distinct bigrams of a space padded text."""
+    padded = f" {text} "
+    return frozenset(padded[i:i + 2] for i in range(len(padded) - 1))
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    """Distinct trigrams of a space padded text."""
+    padded = f" {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of every character of a pattern."""
+    masks = {}
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _osa(masks: Dict[str, int], length: int, text: str) -> int:
+    """
+    Bit-parallel optimal string alignment distance (Hyyrö 2003).
+
+    Args:
+        masks: Character position masks of the pattern (see _pattern_masks).
+        length: Pattern length (at least 1).
+        text: Text compared with the pattern.
+
+    Returns:
+        int: OSA distance between pattern and text.
+    """
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    vp, vn, d0, previous, distance = full, 0, 0, 0, length
+    get = masks.get
+    for char in text:
+        pm = get(char, 0)
+        transposed = (((~d0) & pm) << 1) & previous
+        d0 = ((((pm & vp) + vp) ^ vp) | pm | vn | transposed)
+        hp = vn | (~(d0 | vp) & full)
+        hn = d0 & vp
+        if hp & last:
+            distance += 1
+        elif hn & last:
+            distance -= 1
+        hp = ((hp << 1) | 1) & full
+        vp = ((hn << 1) & full) | (~(d0 | hp) & full)
+        vn = hp & d0
+        previous = pm
+    return distance
+
+
+def osa_distance(first: str, second: str) -> int:
+    """
+    Optimal string alignment (restricted Damerau-Levenshtein) distance.
+
+    Args:
+        first: First string.
+        second: Second string.
+
+    Returns:
+        int: Minimum number of insertions, deletions, substitutions and
+        adjacent transpositions (no substring edited twice).
+    """
+    if not first:
+        return len(second)
+    return _osa(_pattern_masks(first), len(first), second)
+
+
+class FuzzyNameIndex:
+    """Approximate lookup of names in a registry."""
+
+    def __init__(self, config: Dict, items: Iterable[Tuple[str, str]] = (),
+                 normalizer: Optional[TextNormalizer] = None):
+        """
+        Index registry names.
+
+        Args:
+            config: Configuration dictionary (FuzzyNames and TextNormalization settings).
+            items: (name, value) pairs; the first value for a normalized name wins.
+            normalizer: Normalizer shared with the exact index (default: built from config).
+        """
+        settings = config.get('FuzzyNames', {})
+        self.enabled = settings.get('enabled', False)
+        self.max_distance = settings.get('max_distance', 2)
+        self.max_ratio = settings.get('max_ratio', 0.25)
+        self.min_length = settings.get('min_length', 5)
+        self.ambiguity = settings.get('ambiguity', 'skip')
+        self.normalizer = normalizer or TextNormalizer(config)
+
+        self.names: List[str] = []
+        self.values: List[str] = []
+        self._keys: List[str] = []
+        self._bigrams: List[FrozenSet[str]] = []
+        self._seen = set()
+        postings = defaultdict(list)
+        for name, value in items:
+            key = self.normalizer.key(name)
+            if not key or key in self._seen:
+                continue
+            self._seen.add(key)
+            entry = len(self._keys)
+            self.names.append(name)
+            self.values.append(value)
+            self._keys.append(key)
+            self._bigrams.append(_bigrams(key))
+            for gram in _trigrams(key):
+                postings[gram].append(entry)
+        self._postings = {gram: tuple(entries) for gram, entries in postings.items()}
+        self.match = lru_cache(maxsize=settings.get('cache_size', 65536))(self._match)
+
+    def threshold(self, key: str) -> int:
+        """
+        Largest distance accepted for a normalized name.
+
+        Args:
+            key: Normalized name.
+
+        Returns:
+            int: Threshold (0 disables approximate matching for this name).
+        """
+        if len(key) < self.min_length:
+            return 0
+        return min(self.max_distance, int(len(key) * self.max_ratio))
+
+    def candidates(self, key: str, limit: int) -> List[Tuple[int, int]]:
+        """
+        Find every registry entry within a distance of a normalized name.
+
+        Args:
+            key: Normalized name.
+            limit: Largest distance.
+
+        Returns:
+            List of (distance, entry) pairs, closest first, then in registry order.
+        """
+        trigrams = _trigrams(key)
+        counts = Counter(chain.from_iterable(self._postings.get(gram, ()) for gram in trigrams))
+        need_trigrams = len(trigrams) - 4 * limit
+        if need_trigrams <= 0:
+            # Too short for the count filter to prune; compare with every entry
+            counts = dict.fromkeys(range(len(self._keys)), 0)
+        bigrams = _bigrams(key)
+        need_bigrams = len(bigrams) - 3 * limit
+        masks = _pattern_masks(key)
+        length = len(key)
+        found = []
+        for entry, shared in counts.items():
+            candidate = self._keys[entry]
+            if shared < need_trigrams or abs(len(candidate) - length) > limit:
+                continue
+            if len(bigrams & self._bigrams[entry]) < need_bigrams:
+                continue
+            distance = _osa(masks, length, candidate)
+            if distance <= limit:
+                found.append((distance, entry))
+        found.sort()
+        return found
+
+    def _match(self, name: str) -> Optional[FuzzyMatch]:
+        """
+        Find the registry name closest to a name (memoized as match).
+
+        Args:
+            name: Name without an exact registry match (e.g. a person folder).
+
+        Returns:
+            FuzzyMatch, or None when nothing is within the threshold.
+        """
+        if not self.enabled:
+            return None
+        key = self.normalizer.key(name)
+        limit = self.threshold(key)
+        if not limit or key in self._seen:
+            return None
+        found = self.candidates(key, limit)
+        if not found:
+            return None
+        best, entry = found[0]
+        others = tuple(self.names[other] for distance, other in found[1:]
+                       if distance == best and self.values[other] != self.values[entry])
+        return FuzzyMatch(name, self.names[entry], self.values[entry], best,
+                          bool(others) and self.ambiguity != 'first', others)
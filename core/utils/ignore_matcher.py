@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+"""
+Compiled Ignore Matcher for VisualCare File Migration Renamer.
+
+This module merges the file exclusion rules of Global.file_exclusions and the
+FileIgnore section into one matcher compiled when the configuration is
+loaded. Files are checked with a set lookup, one startswith/endswith call on
+tuples of prefixes and suffixes and a single combined regex for the remaining
+glob patterns; directories are checked while walking so ignored subtrees are
+never enumerated.
+
+File Path: core/utils/ignore_matcher.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Literal names, "prefix*", "*suffix" and "*part*" rules without regular expressions
+- Any other glob (?, [...], inner *) compiled into one alternation with fnmatch
+  semantics, so dots and other regex characters are matched literally
+- FileIgnore wildcards keep their case-insensitive matching
+- Directory rules applied at descent time through walk_files(skip_dir=...)
+- Optional hidden file/directory rule
+
+Configuration:
+- Global.file_exclusions: File name rules (case-sensitive)
+- Global.directory_exclusions: Directory name rules, pruned from every walk
+- FileIgnore.ignore_files: Additional file name rules (wildcards case-insensitive)
+- FileIgnore.ignore_directories: Additional directory names
+- FileIgnore.ignore_hidden_files: Ignore names starting with "."
+"""
+
+import fnmatch
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+_GLOB_CHARS = frozenset('*?[')
+
+
+class _Rules:
+    """One compiled set of name rules."""
+
+    def __init__(self, exact: Iterable[str] = (), folded: Iterable[str] = ()):
+        """
+        Compile rules.
+
+        Args:
+            exact: Case-sensitive rules.
+            folded: Rules whose wildcards match case-insensitively (exact names stay exact).
+        """
+        literals, prefixes, suffixes, contains, globs = set(), [], [], [], []
+        for pattern, ignore_case in [(p, False) for p in exact] + [(p, True) for p in folded]:
+            if not pattern:
+                continue
+            if not _GLOB_CHARS & set(pattern):
+                literals.add(pattern)
+                continue
+            inner = pattern.strip('*')
+            simple = inner and not _GLOB_CHARS & set(inner) and not ignore_case
+            if simple and pattern == f"*{inner}*":
+                contains.append(inner)
+            elif simple and pattern == f"*{inner}":
+                suffixes.append(inner)
+            elif simple and pattern == f"{inner}*":
+                prefixes.append(inner)
+            else:
+                translated = fnmatch.translate(pattern)
+                globs.append(f"(?i:{translated})" if ignore_case else translated)
+        self.literals = frozenset(literals)
+        self.prefixes = tuple(prefixes)
+        self.suffixes = tuple(suffixes)
+        self.contains = tuple(contains)
+        self.glob = re.compile('|'.join(globs)) if globs else None
+
+    def match(self, name: str) -> bool:
+        """
+        Check a name against the rules.
+
+        Args:
+            name: File or directory name (no path).
+
+        Returns:
+            bool: True if any rule matches.
+        """
+        if name in self.literals:
+            return True
+        if self.prefixes and name.startswith(self.prefixes):
+            return True
+        if self.suffixes and name.endswith(self.suffixes):
+            return True
+        if any(part in name for part in self.contains):
+            return True
+        return bool(self.glob and self.glob.match(name))
+
+
+class IgnoreMatcher:
+    """Decide which files and directories are left out of a migration."""
+
+    def __init__(self, config: Dict, ignore_hidden: Optional[bool] = None):
+        """
+        Compile the rules of a configuration.
+
+        Args:
+            config: Configuration dictionary (Global and FileIgnore settings).
+            ignore_hidden: Default for FileIgnore.ignore_hidden_files when it is not set.
+        """
+        global_config = config.get('Global', {})
+        file_ignore = config.get('FileIgnore', {})
+        self.files = _Rules(global_config.get('file_exclusions', []), file_ignore.get('ignore_files', []))
+        self.directories = _Rules(list(global_config.get('directory_exclusions', []))
+                                  + list(file_ignore.get('ignore_directories', [])))
+        self.ignore_hidden = file_ignore.get('ignore_hidden_files', bool(ignore_hidden))
+
+    def ignores_file(self, name: str) -> bool:
+        """
+        Check whether a file is excluded.
+
+        Args:
+            name: File name (no path).
+
+        Returns:
+            bool: True if the file must be skipped.
+        """
+        return (self.ignore_hidden and name.startswith('.')) or self.files.match(name)
+
+    def ignores_directory(self, name: str) -> bool:
+        """
+        Check whether a directory is excluded.
+
+        Args:
+            name: Directory name (no path).
+
+        Returns:
+            bool: True if the directory and everything below it must be skipped.
+        """
+        return (self.ignore_hidden and name.startswith('.')) or self.directories.match(name)
+
+    def skip_dir(self, relative_path: Path) -> bool:
+        """
+        Directory pruning callable for walk_files.
+
+        Args:
+            relative_path: Directory path relative to the walk root.
+
+        Returns:
+            bool: True if the directory must not be descended into.
+        """
+        return self.ignores_directory(Path(relative_path).name)
+
+    def include(self, relative_path: Path) -> bool:
+        """
+        File inclusion callable (the counterpart of skip_dir for files).
+
+        Args:
+            relative_path: File path relative to the walk root.
+
+        Returns:
+            bool: True if the file is processed.
+        """
+        return not self.ignores_file(Path(relative_path).name)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+
+"""
+Run Metrics for VisualCare File Migration Renamer.
+
+This module collects counters and histograms for a migration run and exposes
+them in the Prometheus text format, either as a node_exporter textfile
+collector file refreshed periodically or on a local HTTP endpoint, so runs can
+be watched on the same dashboards as other batch jobs.
+
+File Path: core/utils/metrics.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Metrics:
+- vcmigrate_files_processed_total{result}: Files finished, by success/error
+- vcmigrate_bytes_copied_total: Bytes copied or moved
+- vcmigrate_errors_total{stage}: Errors by pipeline stage
+- vcmigrate_extraction_seconds{stage}: Latency of each normalize_filename stage
+- vcmigrate_transfer_seconds: Latency of each copy/move
+- vcmigrate_cache_lookups_total{result}: Extraction cache hits and misses
+- vcmigrate_unmapped_total{kind}: Files without a user ID or category
+
+Configuration:
+- Metrics.enabled: Collect metrics without passing an exporter option
+- Metrics.textfile: Path of the textfile collector file ("" = disabled)
+- Metrics.textfile_interval: Seconds between textfile refreshes
+- Metrics.http_port: Port of the HTTP endpoint (0 = disabled)
+- Metrics.http_address: Address the HTTP endpoint binds to
+"""
+
+import bisect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labelnames: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    """Render a label set as {a="x",b="y"}."""
+    pairs = [f'{name}="{str(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Initialize the counter.
+
+        Args:
+            name: Metric name.
+            documentation: HELP text.
+            labelnames: Label names, in order.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        """
+        Increment the counter.
+
+        Args:
+            amount: Amount to add.
+            **labels: Label values.
+        """
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> str:
+        """Render in Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), 0)]
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value:g}")
+        return "\n".join(lines)
+
+
+class Histogram:
+    """Cumulative histogram with optional labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name.
+            documentation: HELP text.
+            labelnames: Label names, in order.
+            buckets: Upper bounds of the buckets, ascending.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value (seconds for latency histograms).
+            **labels: Label values.
+        """
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket counts, then +Inf count and sum
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> str:
+        """Render in Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                labels = _format_labels(self.labelnames, key, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {series[-1]:g}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return "\n".join(lines)
+
+
+class StageTimer:
+    """Time consecutive stages of one extraction by marking stage boundaries."""
+
+    def __init__(self, registry: 'MetricsRegistry'):
+        """
+        Start timing.
+
+        Args:
+            registry: Registry receiving the observations.
+        """
+        self.registry = registry
+        self._last = time.perf_counter() if registry.enabled else 0.0
+
+    def lap(self, stage: str):
+        """
+        Record the time since the previous boundary against a stage.
+
+        Args:
+            stage: Name of the stage that just finished.
+        """
+        if not self.registry.enabled:
+            return
+        now = time.perf_counter()
+        self.registry.extraction_seconds.observe(now - self._last, stage=stage)
+        self._last = now
+
+
+class MetricsRegistry:
+    """The metrics collected during a migration run."""
+
+    def __init__(self):
+        """Create the run metrics (collection starts disabled)."""
+        self.enabled = False
+        self.files_processed = Counter('vcmigrate_files_processed_total', 'Files processed.', ('result',))
+        self.bytes_copied = Counter('vcmigrate_bytes_copied_total', 'Bytes copied or moved.')
+        self.errors = Counter('vcmigrate_errors_total', 'Errors by pipeline stage.', ('stage',))
+        self.extraction_seconds = Histogram('vcmigrate_extraction_seconds',
+                                            'Latency of each filename extraction stage.', ('stage',))
+        self.transfer_seconds = Histogram('vcmigrate_transfer_seconds', 'Latency of each copy or move.')
+        self.cache_lookups = Counter('vcmigrate_cache_lookups_total', 'Extraction cache lookups.', ('result',))
+        self.unmapped = Counter('vcmigrate_unmapped_total', 'Files without a user ID or category.', ('kind',))
+        self.truncated = Counter('vcmigrate_names_truncated_total', 'Output names shortened to fit the length limits.')
+        self._metrics = (self.files_processed, self.bytes_copied, self.errors, self.extraction_seconds,
+                         self.transfer_seconds, self.cache_lookups, self.unmapped, self.truncated)
+
+    def timer(self) -> StageTimer:
+        """
+        Start a stage timer for one extraction.
+
+        Returns:
+            StageTimer: Timer whose laps feed vcmigrate_extraction_seconds.
+        """
+        return StageTimer(self)
+
+    def render(self) -> str:
+        """
+        Render every metric in Prometheus text format.
+
+        Returns:
+            str: Exposition text ending with a newline.
+        """
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+
+# Process-wide registry used by the extraction pipeline and the copy loop
+METRICS = MetricsRegistry()
+
+
+class TextfileExporter:
+    """Periodically write the registry to a node_exporter textfile collector file."""
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval: float = 15):
+        """
+        Start the writer thread.
+
+        Args:
+            registry: Registry to export.
+            path: Destination .prom file.
+            interval: Seconds between refreshes.
+        """
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='metrics-textfile', daemon=True)
+        self._thread.start()
+
+    def write(self):
+        """Write the file atomically so the collector never reads a partial file."""
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write(self.registry.render())
+        os.replace(temporary, self.path)
+
+    def _run(self):
+        """Refresh until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                pass
+
+    def close(self):
+        """Stop refreshing and write the final values."""
+        self._stop.set()
+        self._thread.join()
+        self.write()
+
+
+class HttpExporter:
+    """Serve the registry on a local HTTP endpoint for the duration of the run."""
+
+    def __init__(self, registry: MetricsRegistry, port: int, address: str = '127.0.0.1'):
+        """
+        Start the HTTP server thread.
+
+        Args:
+            registry: Registry to export.
+            port: Port to listen on.
+            address: Address to bind to.
+        """
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((address, port), Handler)
+        self._thread = threading.Thread(target=self.server.serve_forever, name='metrics-http', daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop serving."""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def start_exporters(config: Dict, textfile: Optional[str] = None, port: Optional[int] = None,
+                    registry: MetricsRegistry = METRICS) -> list:
+    """
+    Enable collection and start the configured exporters.
+
+    Args:
+        config: Configuration dictionary containing Metrics settings.
+        textfile: Textfile path overriding Metrics.textfile.
+        port: HTTP port overriding Metrics.http_port.
+        registry: Registry to export.
+
+    Returns:
+        list: Started exporters (call close() on each at the end of the run).
+    """
+    settings = config.get('Metrics', {})
+    textfile = textfile or settings.get('textfile') or None
+    port = port if port is not None else settings.get('http_port', 0)
+    exporters = []
+    if textfile or port or settings.get('enabled', False):
+        registry.enabled = True
+    if textfile:
+        exporters.append(TextfileExporter(registry, textfile, settings.get('textfile_interval', 15)))
+    if port:
+        exporters.append(HttpExporter(registry, port, settings.get('http_address', '127.0.0.1')))
+    return exporters
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+"""
+Migration Plan Utilities for VisualCare File Migration Renamer.
+
+This module holds the per-file plan records produced while walking an input
+tree, plus helpers to detect destination collisions and to stream the plan as
+a preview (dry run) without touching the file system.
+
+File Path: core/utils/migration_plan.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Compact plan entries (named tuples) computed one file at a time
+- Destination collision detection using fixed-size digests (thread-safe,
+  shared by parallel work units)
+- Streaming table or JSONL preview output with inline warnings
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple, Optional, TextIO, Tuple
+
+
+class PlanEntry(NamedTuple):
+    """The planned migration of a single source file."""
+    source_path: Path
+    relative_path: str
+    person: str = ""
+    new_filename: str = ""
+    user_id: str = ""
+    stat: Optional[os.stat_result] = None
+    warnings: Tuple[str, ...] = ()
+    error: str = ""
+
+    @property
+    def destination(self) -> str:
+        """Destination path relative to the output directory."""
+        return f"{self.person}/{self.new_filename}" if self.new_filename else ""
+
+
+class CollisionTracker:
+    """
+    Detect destinations that more than one source file maps to.
+
+    Only an 8-byte digest of each (case-folded) destination is kept, so the
+    memory cost stays small even for very large plans; Windows and SharePoint
+    targets are case-insensitive, hence the case folding. Checks are atomic,
+    so worker threads can share one tracker.
+    """
+
+    def __init__(self):
+        """Initialize an empty tracker."""
+        self._seen = set()
+        self._lock = threading.Lock()
+        self.collisions = 0
+
+    def check(self, destination: str) -> bool:
+        """
+        Record a destination and report whether it was already planned.
+
+        Args:
+            destination: Destination path relative to the output directory.
+
+        Returns:
+            bool: True if an earlier source maps to the same destination.
+        """
+        digest = hashlib.blake2b(destination.casefold().encode('utf-8'), digest_size=8).digest()
+        with self._lock:
+            if digest in self._seen:
+                self.collisions += 1
+                return True
+            self._seen.add(digest)
+            return False
+
+
+class PlanWriter:
+    """Stream plan entries as a table or JSONL."""
+
+    def __init__(self, stream: TextIO, output_format: str = 'table'):
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Text stream to write to.
+            output_format: 'table' or 'jsonl'.
+        """
+        self.stream = stream
+        self.output_format = output_format
+        self.count = 0
+        if output_format == 'table':
+            self.stream.write("SOURCE -> DESTINATION\n")
+
+    def write(self, entry: PlanEntry):
+        """
+        Write a single plan entry.
+
+        Args:
+            entry: Plan entry to write.
+        """
+        self.count += 1
+        if self.output_format == 'jsonl':
+            record = {
+                'source': entry.relative_path,
+                'destination': entry.destination,
+                'person': entry.person,
+                'user_id': entry.user_id,
+            }
+            if entry.warnings:
+                record['warnings'] = list(entry.warnings)
+            if entry.error:
+                record['error'] = entry.error
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return
+
+        if entry.error:
+            self.stream.write(f"{entry.relative_path} -> ERROR: {entry.error}\n")
+        else:
+            self.stream.write(f"{entry.relative_path} -> {entry.destination}\n")
+        for warning in entry.warnings:
+            self.stream.write(f"  ! {warning}\n")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+"""
+Misfiled Document Audit for VisualCare File Migration Renamer.
+
+normalize_filename always takes the person from the first directory of a
+path, so a document in "John Doe/" whose name mentions "Jane Smith" is
+silently filed as John's. This audit scans every path below the person folder
+against the whole user registry (one Aho-Corasick scan per path, see
+name_index) and reports files naming a different registered person.
+
+File Path: core/utils/misfiled_audit.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Walk-only pass: no extraction subprocesses, runs at directory scan speed
+- Checks sub-folders and filename below the person folder
+- Person folders resolved like the rename does (prefix and management suffix
+  removed, then the audited registry, then resolve_person_name), once per folder
+- Hits overlapping a variant of the folder's own person are ignored (e.g.
+  "Jane Wilson" inside "Mary Jane Wilson")
+- CSV report with one row per conflicting name found
+
+Configuration:
+- MisfiledAudit.kinds: Name variant kinds that count as a conflict
+  (person, shorthand, initials, name_part)
+"""
+
+import csv
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from core.utils.file_walker import walk_files
+from core.utils.name_index import NameIndex
+from core.utils.text_normalization import NormalizedIndex, TextNormalizer
+from core.utils.user_mapping import clean_person_folder, resolve_person_name
+
+
+REPORT_FIELDS = ['relative_path', 'folder_person', 'folder_user_id', 'matched_name', 'matched_user_id',
+                 'matched_text', 'kind']
+
+
+class MisfiledFinding(NamedTuple):
+    """A file naming a registered person other than the one it is filed under."""
+    relative_path: str
+    folder_person: str
+    folder_user_id: str
+    matched_name: str
+    matched_user_id: str
+    matched_text: str
+    kind: str
+
+
+class MisfiledReport:
+    """CSV report of misfiled findings, written as they are found."""
+
+    def __init__(self, path: str):
+        """
+        Open the report.
+
+        Args:
+            path: Path of the CSV file to write.
+        """
+        self.path = path
+        self.count = 0
+        self._stream = open(path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._stream)
+        self._writer.writerow(REPORT_FIELDS)
+
+    def write(self, finding: MisfiledFinding):
+        """
+        Append a finding.
+
+        Args:
+            finding: Finding to write.
+        """
+        self._writer.writerow(finding)
+        self.count += 1
+
+    def close(self):
+        """Flush and close the file."""
+        self._stream.close()
+
+
+class MisfiledAudit:
+    """Flag files whose embedded person name differs from their person folder."""
+
+    def __init__(self, config: Dict, user_mapping: Dict[str, str], category_mapping: Optional[Dict[str, str]] = None):
+        """
+        Build the name index over the full user registry.
+
+        Args:
+            config: Configuration dictionary (MisfiledAudit and NameIndex settings).
+            user_mapping: Full name -> user ID.
+            category_mapping: Category name -> category ID (indexed so category
+                words are not mistaken for names).
+        """
+        settings = config.get('MisfiledAudit', {})
+        self.kinds = frozenset(settings.get('kinds', ['person', 'shorthand']))
+        self.index = NameIndex.from_mappings(config, user_mapping, category_mapping or {})
+        self.config = config
+        self.user_ids = NormalizedIndex(TextNormalizer(config), user_mapping.items())
+        self._folder_ids: Dict[str, str] = {}
+        self.files = 0
+
+    def folder_user_id(self, folder_person: str) -> str:
+        """
+        User ID of a person folder.
+
+        Args:
+            folder_person: Person folder name (may carry the prefix or management suffix).
+
+        Returns:
+            str: User ID, or "" when the folder matches nobody.
+        """
+        if folder_person not in self._folder_ids:
+            user_id = self.user_ids.get(clean_person_folder(folder_person, self.config))
+            if user_id is None:
+                user_id = resolve_person_name(folder_person, self.config)[0]
+            self._folder_ids[folder_person] = user_id or ""
+        return self._folder_ids[folder_person]
+
+    def check(self, relative_path: Path) -> List[MisfiledFinding]:
+        """
+        Check one file.
+
+        Args:
+            relative_path: Path relative to the input directory (person folder first).
+
+        Returns:
+            List[MisfiledFinding]: One finding per conflicting name occurrence.
+        """
+        parts = Path(relative_path).parts
+        if len(parts) < 2:
+            return []
+        self.files += 1
+        folder_person = parts[0]
+        folder_user_id = self.folder_user_id(folder_person)
+        text = Path(*parts[1:]).as_posix()
+        hits = self.index.scan(text)
+        own = [(hit.start, hit.end) for hit in hits if folder_user_id and hit.key == folder_user_id
+               and hit.kind != 'category']
+        findings = []
+        seen = set()
+        for hit in hits:
+            if hit.kind not in self.kinds or hit.key == folder_user_id:
+                continue
+            if any(start < hit.end and hit.start < end for start, end in own):
+                continue
+            if (hit.key, hit.start, hit.end) in seen:
+                continue
+            seen.add((hit.key, hit.start, hit.end))
+            findings.append(MisfiledFinding(Path(relative_path).as_posix(), folder_person, folder_user_id,
+                                            hit.name, hit.key, hit.text, hit.kind))
+        return findings
+
+    def run(self, input_dir: str, report: MisfiledReport, skip_dir: Optional[Callable[[Path], bool]] = None,
+            include: Optional[Callable[[Path], bool]] = None) -> int:
+        """
+        Audit every file of an input tree.
+
+        Args:
+            input_dir: Input directory.
+            report: Report receiving the findings.
+            skip_dir: Optional directory pruning callable (see walk_files).
+            include: Optional callable given a relative path; False skips the file.
+
+        Returns:
+            int: Number of findings.
+        """
+        before = report.count
+        for entry in walk_files(Path(input_dir), skip_dir):
+            if include is None or include(entry.relative_path):
+                for finding in self.check(entry.relative_path):
+                    report.write(finding)
+        return report.count - before
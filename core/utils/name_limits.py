@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+"""
+Length-Aware Output Name Builder for VisualCare File Migration Renamer.
+
+This module assembles output filenames from their components (like
+format_filename) and keeps them within the limits of the Windows/SharePoint
+document store the migration targets: a name may be too long for a single
+path component in characters or bytes, or push the full destination past the
+SharePoint URL limit. Such names are shortened while the plan is computed
+instead of failing at upload time.
+
+File Path: core/utils/name_limits.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Components joined by the shared compiled formatter (see filename_formatter);
+  limits read once per builder
+- Only the remainder is shortened; id, name, date, category, management flag
+  and extension are kept intact
+- Deterministic shortening: the remainder is cut and tagged with a short hash
+  of the full remainder, so the same input always yields the same name and
+  different long remainders stay distinct
+- Character and UTF-8 byte limits for the filename, character limit for the
+  full destination path (path prefix + person folder + filename)
+- Truncations and names that cannot be made to fit are reported as warnings
+- Components made legal on the destination first (see filename_sanitizer), so
+  limits are measured on the name that is actually written; person folder
+  names are sanitized the same way (folder_name)
+- OutputNameBuilder.check is the single definition of the limits (also used by
+  the bundled filename validation plugin)
+
+Configuration:
+- OutputLimits.enabled: Enforce the limits
+- OutputLimits.max_component_chars: Longest filename or folder name in characters
+- OutputLimits.max_component_bytes: Longest filename or folder name in UTF-8 bytes
+- OutputLimits.max_path_chars: Longest destination path in characters, prefix included
+- OutputLimits.path_prefix: Destination path in front of the person folder
+  (e.g. the SharePoint site and library path)
+- OutputLimits.truncation_marker: Text placed between the cut remainder and its hash
+- OutputLimits.hash_length: Hex digits of the remainder hash
+"""
+
+import hashlib
+from typing import Dict, List, NamedTuple
+
+from core.utils.filename_formatter import FilenameFormatter
+from core.utils.filename_sanitizer import FilenameSanitizer
+
+
+class LimitedName(NamedTuple):
+    """An output filename and whether limits changed it."""
+    filename: str
+    truncated: bool = False
+    warnings: tuple = ()
+
+
+class OutputNameBuilder:
+    """Format output filenames and keep them within the configured length limits."""
+
+    def __init__(self, config: Dict):
+        """
+        Read the component layout and limits.
+
+        Args:
+            config: Configuration dictionary (Global component settings, OutputLimits,
+                FilenameSanitizer).
+        """
+        self.formatter = FilenameFormatter(config)
+        self.component_order = self.formatter.component_order
+        self.separator = self.formatter.separator
+
+        limits = config.get('OutputLimits', {})
+        self.enabled = limits.get('enabled', True)
+        self.max_component_chars = limits.get('max_component_chars', 255)
+        self.max_component_bytes = limits.get('max_component_bytes', 255)
+        self.max_path_chars = limits.get('max_path_chars', 400)
+        self.path_prefix = limits.get('path_prefix', '').rstrip('/')
+        self.marker = limits.get('truncation_marker', '~')
+        self.hash_length = limits.get('hash_length', 6)
+        self.sanitizer = FilenameSanitizer(config)
+
+    def format(self, components: Dict[str, str]) -> str:
+        """
+        Join components in the configured order (same output as format_filename).
+
+        Args:
+            components: Component name -> value; missing or empty components are left out.
+
+        Returns:
+            str: Formatted filename without extension.
+        """
+        return self.formatter.format(components)
+
+    def folder_name(self, name: str) -> str:
+        """
+        Make a person folder name legal on the destination.
+
+        Args:
+            name: Output folder name (the cleaned person name).
+
+        Returns:
+            str: Sanitized folder name.
+        """
+        return self.sanitizer.sanitize(name)
+
+    def _path_length(self, directory: str, filename: str) -> int:
+        """Length of the destination path as seen by the document store."""
+        length = len(filename)
+        if directory:
+            length += len(directory) + 1
+        if self.path_prefix:
+            length += len(self.path_prefix) + 1
+        return length
+
+    def check(self, directory: str, filename: str) -> List[str]:
+        """
+        List the limits a destination exceeds.
+
+        Args:
+            directory: Destination folder below the output root (the person folder).
+            filename: Destination filename.
+
+        Returns:
+            List[str]: One message per exceeded limit (empty when it fits).
+        """
+        if not self.enabled:
+            return []
+        problems = []
+        for label, name in (('Folder name', directory), ('Filename', filename)):
+            if len(name) > self.max_component_chars:
+                problems.append(f"{label} is {len(name)} characters (limit {self.max_component_chars})")
+            elif len(name.encode('utf-8')) > self.max_component_bytes:
+                problems.append(f"{label} is {len(name.encode('utf-8'))} bytes (limit {self.max_component_bytes})")
+        path_length = self._path_length(directory, filename)
+        if path_length > self.max_path_chars:
+            problems.append(f"Destination path is {path_length} characters (limit {self.max_path_chars})")
+        return problems
+
+    def build(self, components: Dict[str, str], extension: str = '', directory: str = '') -> LimitedName:
+        """
+        Sanitize the components and format a filename, shortening the remainder if it exceeds a limit.
+
+        Args:
+            components: Component name -> value (id, name, remainder, date, category, management).
+            extension: File extension including the dot.
+            directory: Destination folder below the output root (the person folder).
+
+        Returns:
+            LimitedName: Final filename, whether it was shortened and any warnings.
+        """
+        components = {component: self.sanitizer.replace_illegal(value) for component, value in components.items()}
+        filename = self.sanitizer.finish(self.format(components) + extension)
+        if not self.enabled or not self.check(directory, filename):
+            return LimitedName(filename)
+
+        remainder = components.get('remainder', '')
+        char_budget = min(self.max_component_chars, self.max_path_chars - self._path_length(directory, ''))
+        shortened = filename
+        if remainder:
+            tag = self.marker + hashlib.sha1(remainder.encode('utf-8')).hexdigest()[:self.hash_length]
+            fixed = self.format(dict(components, remainder=tag)) + extension
+            chars = char_budget - len(fixed)
+            size = self.max_component_bytes - len(fixed.encode('utf-8'))
+            cut = remainder[:max(chars, 0)].encode('utf-8')[:max(size, 0)].decode('utf-8', 'ignore')
+            cut = cut.rstrip(' ' + self.separator)
+            if chars >= 0 and size >= 0:
+                shortened = self.sanitizer.finish(self.format(dict(components, remainder=cut + tag)) + extension)
+            else:
+                shortened = self.sanitizer.finish(self.format(dict(components, remainder='')) + extension)
+
+        warnings = []
+        if shortened != filename:
+            warnings.append(f"Truncated: name shortened from {len(filename)} to {len(shortened)} characters "
+                            f"to fit the output limits")
+        warnings.extend(f"Over limit: {problem}" for problem in self.check(directory, shortened))
+        return LimitedName(shortened, shortened != filename, tuple(warnings))
@@ -44,10 +44,23 @@ def debug_print(*args, **kwargs):
     """Print debug messages to stderr."""
     print(*args, file=sys.stderr, **kwargs)
 
+# (config path, mtime_ns) -> parsed configuration
+_CONFIG_CACHE = {}
+
 def load_config():
-    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'config', 'components.yaml')
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    """Load configuration from components.yaml (or $VC_CONFIG_FILE), parsed once per file version (shared; do not modify)."""
+    config_path = os.environ.get('VC_CONFIG_FILE') or os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'config', 'components.yaml')
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    stamp = (str(config_path), mtime_ns)
+    if stamp not in _CONFIG_CACHE:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f)
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[stamp] = config
+    return _CONFIG_CACHE[stamp]
 
 def load_global_separators():
     config = load_config()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+"""
+Plugin Hook Pipeline for VisualCare File Migration Renamer.
+
+Plugins run in-process and receive records in batches, so a validation rule
+costs one Python call per batch of files instead of one shell process per
+file. Plugins are Python modules found in the plugin directories or installed
+packages advertising the "vcmigrate.plugins" entry point group. Only plugins
+named in Plugins.allowed are imported (by default the bundled
+validate_filenames); installed packages are not searched unless
+Plugins.entry_points is set.
+
+File Path: core/utils/plugin_manager.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Hooks: pre_extract (WalkEntry, before filename extraction), post_extract
+  (PlanEntry, after the plan of a file is computed), pre_write (PlanEntry,
+  before the copy or move) and post_write (FileResult)
+- A hook receives a list of records and returns None (unchanged) or the list
+  that replaces the batch, so plugins can drop records or attach warnings
+  (PlanEntry._replace)
+- Streams stay lazy: records are grouped into batches of
+  Plugins.batch_size on the way through; hooks without plugins cost nothing
+- Plugins register with a register(manager) function or by defining
+  functions named after the hooks
+- A failing hook is logged and counted; the batch passes through unchanged
+  unless Plugins.fail_on_error is set
+
+Configuration:
+- Plugins.enabled: Load plugins
+- Plugins.directories: Directories searched for *.py plugins (relative to the project root)
+- Plugins.allowed: Plugin names (file stem or entry point name) that may be
+  loaded; "*" allows every plugin found
+- Plugins.entry_points: Also load plugins from installed packages (default: off)
+- Plugins.disabled: Plugin names (file stem or entry point name) not loaded
+- Plugins.batch_size: Records per hook call
+- Plugins.fail_on_error: Abort the run when a hook raises
+"""
+
+import importlib.util
+import logging
+from importlib import metadata
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from core.utils.metrics import METRICS
+
+
+HOOKS = ('pre_extract', 'post_extract', 'pre_write', 'post_write')
+
+ENTRY_POINT_GROUP = 'vcmigrate.plugins'
+
+# Plugins shipped in plugins/ and loaded when Plugins.allowed is not set
+BUNDLED_PLUGINS = ('validate_filenames',)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+logger = logging.getLogger(__name__)
+
+
+class PluginManager:
+    """Registry of hook callables and the batched pipeline running them."""
+
+    def __init__(self, config: Dict):
+        """
+        Create an empty manager.
+
+        Args:
+            config: Configuration dictionary (Plugins settings); plugins may read it.
+        """
+        self.config = config
+        settings = config.get('Plugins', {})
+        self.batch_size = max(1, settings.get('batch_size', 1000))
+        self.fail_on_error = settings.get('fail_on_error', False)
+        self.disabled = frozenset(settings.get('disabled', []))
+        self.allowed = frozenset(settings.get('allowed', BUNDLED_PLUGINS))
+        self.hooks: Dict[str, List[Callable]] = {hook: [] for hook in HOOKS}
+        self.plugins: List[str] = []
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'PluginManager':
+        """
+        Create a manager and load the configured plugins.
+
+        Args:
+            config: Configuration dictionary.
+
+        Returns:
+            PluginManager: Manager with every enabled plugin registered.
+        """
+        manager = cls(config)
+        settings = config.get('Plugins', {})
+        if not settings.get('enabled', True):
+            return manager
+        for directory in settings.get('directories', ['plugins']):
+            manager.load_directory(directory)
+        if settings.get('entry_points', False):
+            manager.load_entry_points()
+        return manager
+
+    def is_allowed(self, name: str) -> bool:
+        """
+        Whether a plugin may be loaded.
+
+        Args:
+            name: Plugin name (file stem or entry point name).
+
+        Returns:
+            bool: True when the plugin is allowed and not disabled.
+        """
+        if name in self.disabled:
+            return False
+        return '*' in self.allowed or name in self.allowed
+
+    def register(self, hook: str, function: Callable[[list], Optional[list]]):
+        """
+        Register a hook callable.
+
+        Args:
+            hook: One of HOOKS.
+            function: Callable taking a list of records and returning None or the replacement list.
+        """
+        if hook not in self.hooks:
+            raise ValueError(f"Unknown plugin hook: {hook} (expected one of {', '.join(HOOKS)})")
+        self.hooks[hook].append(function)
+
+    def add_plugin(self, name: str, plugin):
+        """
+        Register a loaded plugin module or register callable.
+
+        Args:
+            name: Plugin name used in logs and Plugins.disabled.
+            plugin: Module (with register() or hook functions) or a register(manager) callable.
+        """
+        register = getattr(plugin, 'register', None)
+        if callable(register):
+            register(self)
+        elif callable(plugin) and not hasattr(plugin, '__file__'):
+            plugin(self)
+        else:
+            for hook in HOOKS:
+                function = getattr(plugin, hook, None)
+                if callable(function):
+                    self.register(hook, function)
+        self.plugins.append(name)
+        logger.debug(f"Loaded plugin: {name}")
+
+    def load_directory(self, directory: str):
+        """
+        Load the allowed *.py plugins of a directory (files starting with "_" are skipped).
+
+        Args:
+            directory: Plugin directory, absolute or relative to the project root.
+        """
+        path = Path(directory)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        if not path.is_dir():
+            return
+        for plugin_file in sorted(path.glob('*.py')):
+            name = plugin_file.stem
+            if name.startswith('_') or not self.is_allowed(name):
+                continue
+            spec = importlib.util.spec_from_file_location(f"vcmigrate_plugin_{name}", plugin_file)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.add_plugin(name, module)
+
+    def load_entry_points(self):
+        """Load the allowed plugins advertised by installed packages under ENTRY_POINT_GROUP."""
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, 'select'):
+            group = entry_points.select(group=ENTRY_POINT_GROUP)
+        else:
+            group = entry_points.get(ENTRY_POINT_GROUP, [])
+        for entry_point in sorted(group, key=lambda entry_point: entry_point.name):
+            if self.is_allowed(entry_point.name):
+                self.add_plugin(entry_point.name, entry_point.load())
+
+    def run(self, hook: str, records: list) -> list:
+        """
+        Run every callable of a hook over one batch.
+
+        Args:
+            hook: One of HOOKS.
+            records: Batch of records.
+
+        Returns:
+            list: Records after all callables ran.
+        """
+        for function in self.hooks[hook]:
+            try:
+                replaced = function(records)
+            except Exception as e:
+                if self.fail_on_error:
+                    raise
+                logger.error(f"Plugin hook {hook} ({getattr(function, '__module__', function)}) failed: {e}")
+                METRICS.errors.inc(stage='plugin')
+                continue
+            if replaced is not None:
+                records = list(replaced)
+        return records
+
+    def apply(self, hook: str, records: Iterable) -> Iterator:
+        """
+        Stream records through a hook in batches.
+
+        Args:
+            hook: One of HOOKS.
+            records: Any iterable of records (consumed lazily).
+
+        Returns:
+            Iterator over the records returned by the hook (the input itself
+            when no plugin uses the hook).
+        """
+        if not self.hooks[hook]:
+            return iter(records)
+        return self._batched(hook, iter(records))
+
+    def _batched(self, hook: str, records: Iterator) -> Iterator:
+        """Group records into batches, run the hook and yield the results."""
+        while True:
+            batch = list(islice(records, self.batch_size))
+            if not batch:
+                return
+            yield from self.run(hook, batch)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+"""
+Live Progress Reporting for VisualCare File Migration Renamer.
+
+This module renders a single, periodically refreshed progress line for long
+runs and optionally writes JSON status lines for monitoring. Updates are
+cheap counter increments; the terminal is only written when the refresh
+interval has elapsed.
+
+File Path: core/utils/progress.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Total file count taken from the work unit sizing when it already ran,
+  otherwise grown as the main walker yields entries (no second walk)
+- Files and bytes done, rolling throughput and ETA
+- Current person and per-person file counts
+- Throttled rendering (in-place on a terminal, plain lines otherwise)
+- Periodic JSON status lines for scrapers
+
+Configuration:
+- Progress.enabled: Show the progress line without passing --progress
+- Progress.count_total: Report the total once it is known (sizing, or the end of the walk)
+- Progress.refresh_interval: Seconds between terminal updates
+- Progress.status_interval: Seconds between JSON status lines
+- Progress.rate_window: Seconds of history used for the rolling throughput
+"""
+
+import json
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+
+from core.utils.results import FileResult
+
+
+MB = 1024 * 1024
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration as H:MM:SS.
+
+    Args:
+        seconds: Duration in seconds.
+
+    Returns:
+        str: Formatted duration.
+    """
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressReporter:
+    """Aggregate progress counters and render them at a throttled rate."""
+
+    def __init__(self, config: Dict, stream: Optional[TextIO] = sys.stderr, status_stream: Optional[TextIO] = None):
+        """
+        Initialize the reporter.
+
+        Args:
+            config: Configuration dictionary containing Progress settings.
+            stream: Stream for the human readable progress line (None to disable).
+            status_stream: Stream for JSON status lines (None to disable).
+        """
+        settings = config.get('Progress', {})
+        self.count_total = settings.get('count_total', True)
+        self.refresh_interval = settings.get('refresh_interval', 0.5)
+        self.status_interval = settings.get('status_interval', 30)
+        self.rate_window = settings.get('rate_window', 30)
+        self.stream = stream
+        self.status_stream = status_stream
+        self.interactive = bool(stream and hasattr(stream, 'isatty') and stream.isatty())
+
+        self.discovered = 0
+        self.total = None
+        self.files_done = 0
+        self.bytes_done = 0
+        self.errors = 0
+        self.person = ""
+        self.person_counts = {}
+
+        self._started = time.monotonic()
+        self._samples = deque([(self._started, 0, 0)])
+        self._next_render = self._started
+        self._next_status = self._started + self.status_interval
+        self._last_width = 0
+
+    def set_total(self, total: int):
+        """
+        Use a file total that is already known (e.g. from the work unit sizing).
+
+        Args:
+            total: Number of files the run will process.
+        """
+        self.discovered = total
+        if self.count_total:
+            self.total = total
+
+    def discover(self, entries: Iterable) -> Iterator:
+        """
+        Count walker entries as they pass; the total is known once the walk ends.
+
+        Args:
+            entries: Entries yielded by the input walker (consumed lazily).
+
+        Returns:
+            Iterator over the same entries.
+        """
+        for entry in entries:
+            self.discovered += 1
+            yield entry
+        if self.count_total:
+            self.total = self.discovered
+
+    def update(self, result: FileResult):
+        """
+        Account for a finished file and render if the refresh interval elapsed.
+
+        Args:
+            result: Result of the finished file.
+        """
+        self.files_done += 1
+        self.bytes_done += result.size
+        if result.error:
+            self.errors += 1
+        if result.person:
+            self.person = result.person
+            self.person_counts[result.person] = self.person_counts.get(result.person, 0) + 1
+
+        now = time.monotonic()
+        if now >= self._next_render:
+            self._next_render = now + (self.refresh_interval if self.interactive else self.status_interval)
+            self._sample(now)
+            self.render(now)
+        if self.status_stream and now >= self._next_status:
+            self._next_status = now + self.status_interval
+            self.write_status(now)
+
+    def _sample(self, now: float):
+        """Record a throughput sample and drop those outside the rate window."""
+        self._samples.append((now, self.files_done, self.bytes_done))
+        while len(self._samples) > 2 and now - self._samples[0][0] > self.rate_window:
+            self._samples.popleft()
+
+    def rates(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Compute rolling throughput and ETA.
+
+        Args:
+            now: Current monotonic time (default: now).
+
+        Returns:
+            Dict: files_per_second, bytes_per_second and eta_seconds (None if unknown).
+        """
+        now = now or time.monotonic()
+        since, files, size = self._samples[0]
+        elapsed = max(now - since, 1e-6)
+        files_per_second = (self.files_done - files) / elapsed
+        bytes_per_second = (self.bytes_done - size) / elapsed
+        eta = None
+        if self.total is not None and files_per_second > 0:
+            eta = max(0, self.total - self.files_done) / files_per_second
+        return {'files_per_second': files_per_second, 'bytes_per_second': bytes_per_second, 'eta_seconds': eta}
+
+    def render(self, now: Optional[float] = None):
+        """
+        Write the progress line.
+
+        Args:
+            now: Current monotonic time (default: now).
+        """
+        if not self.stream:
+            return
+        rates = self.rates(now)
+        if self.total is not None:
+            percent = 100.0 * self.files_done / self.total if self.total else 100.0
+            count = f"{self.files_done:,}/{self.total:,} {percent:5.1f}%"
+        else:
+            count = f"{self.files_done:,}/{self.discovered:,}+"
+        eta = format_duration(rates['eta_seconds']) if rates['eta_seconds'] is not None else "--:--:--"
+        line = (f"[{count}] {self.bytes_done / MB:,.1f} MB  {rates['files_per_second']:.1f} files/s  "
+                f"{rates['bytes_per_second'] / MB:.1f} MB/s  ETA {eta}  errors {self.errors}  {self.person}")
+        if self.interactive:
+            padding = " " * max(0, self._last_width - len(line))
+            self.stream.write(f"\r{line}{padding}")
+            self._last_width = len(line)
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+    def status(self, now: Optional[float] = None) -> Dict:
+        """
+        Build a JSON-serialisable status snapshot.
+
+        Args:
+            now: Current monotonic time (default: now).
+
+        Returns:
+            Dict: Status fields for monitoring.
+        """
+        now = now or time.monotonic()
+        rates = self.rates(now)
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'elapsed_seconds': round(now - self._started, 1),
+            'files_total': self.total,
+            'files_discovered': self.discovered,
+            'files_done': self.files_done,
+            'bytes_done': self.bytes_done,
+            'errors': self.errors,
+            'files_per_second': round(rates['files_per_second'], 2),
+            'mb_per_second': round(rates['bytes_per_second'] / MB, 2),
+            'eta_seconds': round(rates['eta_seconds']) if rates['eta_seconds'] is not None else None,
+            'person': self.person,
+            'person_counts': self.person_counts,
+        }
+
+    def write_status(self, now: Optional[float] = None):
+        """
+        Write one JSON status line.
+
+        Args:
+            now: Current monotonic time (default: now).
+        """
+        self.status_stream.write(json.dumps(self.status(now), ensure_ascii=False) + "\n")
+        self.status_stream.flush()
+
+    def close(self):
+        """Render the final state and finish the progress line."""
+        now = time.monotonic()
+        self._sample(now)
+        if self.stream:
+            self.render(now)
+            if self.interactive:
+                self.stream.write("\n")
+                self.stream.flush()
+        if self.status_stream:
+            self.write_status(now)
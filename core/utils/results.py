@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+"""
+Processing Results for VisualCare File Migration Renamer.
+
+This module defines the compact per-file result record yielded while a
+directory is processed, and a streaming aggregator that builds the end of run
+summary without keeping every result in memory.
+
+File Path: core/utils/results.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Compact result records (named tuples) instead of per-file dicts
+- Constant-memory counters with a bounded sample of error messages
+- Optional JSONL sink writing full per-file results as they are produced
+
+Configuration:
+- Results.max_error_samples: Number of error messages kept for the summary
+"""
+
+import json
+from typing import Dict, Iterable, NamedTuple, Optional
+
+
+class FileResult(NamedTuple):
+    """The outcome of processing a single file."""
+    original_filename: str
+    new_filename: str = ""
+    person: str = ""
+    success: bool = False
+    action: str = ""
+    error: str = ""
+    test_name: str = ""
+    size: int = 0
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to the legacy result dict shape (empty fields omitted).
+
+        Returns:
+            Dict: Result dict with an 'copied'/'moved' flag for the action taken.
+        """
+        result = {'original_filename': self.original_filename, 'success': self.success}
+        for field in ('new_filename', 'person', 'error', 'test_name', 'size'):
+            value = getattr(self, field)
+            if value:
+                result[field] = value
+        if self.action:
+            result[self.action] = True
+        return result
+
+    @classmethod
+    def from_dict(cls, result: Dict) -> 'FileResult':
+        """
+        Rebuild a record from the dict shape produced by to_dict.
+
+        Args:
+            result: Result dict (e.g. a line of a results file or journal).
+
+        Returns:
+            FileResult: The equivalent record.
+        """
+        action = next((name for name in ('copied', 'moved') if result.get(name)), "")
+        return cls(result.get('original_filename', ""), result.get('new_filename', ""), result.get('person', ""),
+                   result.get('success', False), action, result.get('error', ""), result.get('test_name', ""),
+                   result.get('size', 0))
+
+
+class ResultSink:
+    """Write full per-file results to a JSONL file as they are produced."""
+
+    def __init__(self, path: str):
+        """
+        Open the sink.
+
+        Args:
+            path: Path of the JSONL file to write.
+        """
+        self.path = path
+        self._stream = open(path, 'w', encoding='utf-8')
+
+    def write(self, result: FileResult):
+        """
+        Append a single result.
+
+        Args:
+            result: Result record to write.
+        """
+        self._stream.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+
+    def close(self):
+        """Flush and close the file."""
+        self._stream.close()
+
+
+class ResultAggregator:
+    """Streaming summary of processing results."""
+
+    def __init__(self, max_error_samples: int = 100, sink: Optional[ResultSink] = None):
+        """
+        Initialize an empty aggregator.
+
+        Args:
+            max_error_samples: Number of error messages kept for the summary.
+            sink: Optional sink receiving every result.
+        """
+        self.max_error_samples = max_error_samples
+        self.sinks = [sink] if sink else []
+        self.total = 0
+        self.successful = 0
+        self.errors = 0
+        self.error_samples = []
+        self.person_counts = {}
+        self.test_names = set()
+
+    @classmethod
+    def from_config(cls, config: Dict, sink: Optional[ResultSink] = None) -> 'ResultAggregator':
+        """
+        Create an aggregator from the Results configuration section.
+
+        Args:
+            config: Configuration dictionary.
+            sink: Optional sink receiving every result.
+
+        Returns:
+            ResultAggregator: Configured aggregator.
+        """
+        settings = config.get('Results', {})
+        return cls(settings.get('max_error_samples', 100), sink)
+
+    def add(self, result: FileResult):
+        """
+        Account for a single result.
+
+        Args:
+            result: Result record to add.
+        """
+        self.total += 1
+        if result.success:
+            self.successful += 1
+        if result.error:
+            self.errors += 1
+            if len(self.error_samples) < self.max_error_samples:
+                self.error_samples.append(result.error)
+        if result.person:
+            self.person_counts[result.person] = self.person_counts.get(result.person, 0) + 1
+        if result.test_name:
+            self.test_names.add(result.test_name)
+        for sink in self.sinks:
+            sink.write(result)
+
+    def add_sink(self, sink: ResultSink):
+        """
+        Send every further result to an additional sink.
+
+        Args:
+            sink: Sink to add.
+        """
+        self.sinks.append(sink)
+
+    def close(self):
+        """Close all sinks."""
+        for sink in self.sinks:
+            sink.close()
+        self.sinks = []
+
+    def consume(self, results: Iterable[FileResult]) -> 'ResultAggregator':
+        """
+        Add every result from an iterable (typically a processing generator).
+
+        Args:
+            results: Results to add.
+
+        Returns:
+            ResultAggregator: self, for chaining.
+        """
+        for result in results:
+            self.add(result)
+        return self
+
+    def print_summary(self):
+        """Print a summary of processing results."""
+        print(f"\n=== Processing Summary ===")
+        print(f"Total files: {self.total}")
+        print(f"Successful: {self.successful}")
+        print(f"Errors: {self.errors}")
+
+        if self.errors > 0:
+            print(f"\n=== Errors ===")
+            for error in self.error_samples:
+                print(f"- {error}")
+            if self.errors > len(self.error_samples):
+                print(f"... and {self.errors - len(self.error_samples)} more")
+
+        # Show person breakdown
+        if self.person_counts:
+            print(f"\n=== Person Breakdown ===")
+            for person, count in self.person_counts.items():
+                print(f"{person}: {count} files")
+
+            if self.test_names:
+                print(f"\nTest output directories: {', '.join(f'to-{name}' for name in self.test_names)}")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+"""
+Balanced Work Scheduler for VisualCare File Migration Renamer.
+
+This module partitions an input tree into work units along the person /
+category structure the extractors already assume (first directory = person,
+second directory = category) and runs them on a pool of workers largest
+first, so one very large person folder does not leave the other workers idle
+at the end of a run.
+
+File Path: core/utils/scheduler.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Single sizing walk recording file count and bytes per person and category
+- Oversized person folders split into one unit per category folder plus one
+  unit for files directly in the person folder
+- Largest-first (LPT) dispatch to a bounded thread pool
+- Results streamed back as workers produce them
+
+Configuration:
+- Execution.workers: Number of parallel workers (1 = no scheduling)
+- Scheduler.max_unit_files: Person folders with more files are split by category
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from core.utils.file_walker import WalkEntry, walk_files
+
+
+_DONE = object()
+
+
+class WorkUnit(NamedTuple):
+    """A person folder, or one category folder of it, scheduled as a unit."""
+    person: str
+    category: Optional[str] = None
+    files: int = 0
+    bytes: int = 0
+
+    def walk(self, input_path: Path, include: Optional[Callable[[Path], bool]] = None,
+             skip_dir: Optional[Callable[[Path], bool]] = None) -> Iterator[WalkEntry]:
+        """
+        Walk the files of this unit with paths relative to the input directory.
+
+        category None covers the whole person folder, "" only the files placed
+        directly in it, and any other value that category folder's subtree.
+
+        Args:
+            input_path: Input directory.
+            include: Optional callable given a relative path; False skips the file.
+            skip_dir: Optional directory pruning callable given a relative path.
+
+        Yields:
+            WalkEntry for each file of the unit.
+        """
+        person_path = Path(input_path) / self.person
+        if self.category == "":
+            try:
+                with os.scandir(person_path) as it:
+                    files = sorted((entry for entry in it if entry.is_file()), key=lambda e: e.name)
+                entries = (WalkEntry(Path(entry.path), Path(entry.name), entry.stat()) for entry in files)
+            except OSError:
+                return
+            prefix = Path(self.person)
+        else:
+            prefix = Path(self.person) if self.category is None else Path(self.person) / self.category
+            # skip_dir expects paths relative to the input directory, not to this unit
+            unit_skip = (lambda relative_path: skip_dir(prefix / relative_path)) if skip_dir else None
+            entries = walk_files(Path(input_path) / prefix, unit_skip)
+
+        for path, relative_path, stat in entries:
+            relative_path = prefix / relative_path
+            if include is None or include(relative_path):
+                yield WalkEntry(path, relative_path, stat)
+
+
+def size_tree(input_path: Path, skip_dir: Optional[Callable[[Path], bool]] = None,
+              include: Optional[Callable[[Path], bool]] = None) -> Dict[str, Dict[str, Tuple[int, int]]]:
+    """
+    Count files and bytes per person and category folder in one walk.
+
+    Args:
+        input_path: Input directory.
+        skip_dir: Optional directory pruning callable (see walk_files).
+        include: Optional callable given a relative path; False skips the file.
+
+    Returns:
+        Dict: person ("" for files at the top level) -> category ("" for files
+        directly in the person folder) -> (files, bytes).
+    """
+    sizes: Dict[str, Dict[str, List[int]]] = {}
+    for _, relative_path, stat in walk_files(Path(input_path), skip_dir):
+        if include and not include(relative_path):
+            continue
+        parts = relative_path.parts
+        # Files at the top level are grouped under person "" so they are still processed
+        person = parts[0] if len(parts) > 1 else ""
+        category = parts[1] if len(parts) > 2 else ""
+        counts = sizes.setdefault(person, {}).setdefault(category, [0, 0])
+        counts[0] += 1
+        counts[1] += stat.st_size
+    return {person: {category: tuple(counts) for category, counts in categories.items()}
+            for person, categories in sizes.items()}
+
+
+def plan_work_units(sizes: Dict[str, Dict[str, Tuple[int, int]]], max_unit_files: int = 5000) -> List[WorkUnit]:
+    """
+    Turn subtree sizes into work units ordered largest first.
+
+    Args:
+        sizes: Output of size_tree.
+        max_unit_files: Person folders with more files are split by category folder.
+
+    Returns:
+        List[WorkUnit]: Units sorted by file count, then bytes, descending.
+    """
+    units = []
+    for person, categories in sizes.items():
+        files = sum(count for count, _ in categories.values())
+        size = sum(size for _, size in categories.values())
+        if files > max_unit_files and len(categories) > 1:
+            units.extend(WorkUnit(person, category, count, category_size)
+                         for category, (count, category_size) in categories.items())
+        else:
+            # Top-level files (person "") are scanned without descending into person folders
+            units.append(WorkUnit(person, None if person else "", files, size))
+    units.sort(key=lambda unit: (unit.files, unit.bytes, unit.person, unit.category or ""), reverse=True)
+    return units
+
+
+def run_largest_first(units: Iterable[WorkUnit], worker: Callable[[WorkUnit], Iterable], workers: int,
+                      buffer_size: int = 1024) -> Iterator:
+    """
+    Run units on a thread pool in the given (largest-first) order, streaming results.
+
+    Args:
+        units: Units in dispatch order.
+        worker: Callable producing the results of one unit.
+        workers: Number of worker threads.
+        buffer_size: Results buffered before workers wait for the consumer.
+
+    Yields:
+        Results in the order workers produce them.
+    """
+    results = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+    failure = []
+
+    def run(unit: WorkUnit):
+        if stop.is_set():
+            return
+        try:
+            for result in worker(unit):
+                if stop.is_set():
+                    return
+                results.put(result)
+        except BaseException as e:
+            failure.append(e)
+            stop.set()
+
+    def dispatch():
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='scheduler') as pool:
+            for unit in units:
+                pool.submit(run, unit)
+        results.put(_DONE)
+
+    dispatcher = threading.Thread(target=dispatch, name='scheduler-dispatch', daemon=True)
+    dispatcher.start()
+    try:
+        while True:
+            result = results.get()
+            if result is _DONE:
+                break
+            yield result
+    finally:
+        stop.set()
+        while dispatcher.is_alive():
+            try:
+                results.get(timeout=0.1)
+            except queue.Empty:
+                pass
+    if failure:
+        raise failure[0]
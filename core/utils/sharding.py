@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+
+"""
+Sharded Execution for VisualCare File Migration Renamer.
+
+This module splits one migration across several hosts that mount the same
+share. Every host walks the same input tree and deterministically keeps only
+its own shard, writes a per-shard journal to shared storage, and a final
+reconcile step merges the journals into one summary and reports destinations
+that two shards both wrote. No network services are needed.
+
+File Path: core/utils/sharding.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Deterministic shard assignment by person directory (default) or by path
+  hash, using contiguous ranges of a stable 64-bit hash
+- Person sharding prunes other people's directories without walking them
+- Per-shard JSONL journals with a completion marker, written only when the
+  shard ran to the end
+- Reconcile: combined summary, missing/incomplete shards, cross-shard collisions;
+  only journals of the expected shard count are merged, so journals left by
+  a run with another count are ignored
+
+Configuration:
+- Sharding.mode: 'person' or 'hash'
+- Sharding.journal_dir: Directory for shard journals (must be shared storage)
+- Sharding.max_collision_samples: Collisions listed by the reconcile report
+"""
+
+import hashlib
+import json
+import socket
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from core.utils.results import FileResult, ResultAggregator, ResultSink
+
+
+SHARD_MODES = ('person', 'hash')
+
+
+def _stable_hash(key: str) -> int:
+    """64-bit hash that is identical on every host and Python process."""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class ShardSpec(NamedTuple):
+    """One shard of a sharded run (index is zero-based)."""
+    index: int
+    count: int
+    mode: str = 'person'
+
+    @classmethod
+    def parse(cls, value: str, mode: str = 'person') -> 'ShardSpec':
+        """
+        Parse a command line shard such as "2/4" (1-based).
+
+        Args:
+            value: Shard as "I/N" with 1 <= I <= N.
+            mode: 'person' or 'hash'.
+
+        Returns:
+            ShardSpec: Parsed shard.
+
+        Raises:
+            ValueError: If the value or mode is invalid.
+        """
+        try:
+            number, count = (int(part) for part in value.split('/'))
+        except ValueError:
+            raise ValueError(f"Invalid shard '{value}', expected I/N such as 1/4")
+        if count < 1 or not 1 <= number <= count:
+            raise ValueError(f"Invalid shard '{value}', expected 1 <= I <= N")
+        if mode not in SHARD_MODES:
+            raise ValueError(f"Invalid shard mode '{mode}', expected one of {', '.join(SHARD_MODES)}")
+        return cls(number - 1, count, mode)
+
+    @property
+    def label(self) -> str:
+        """Human readable shard, e.g. '2/4'."""
+        return f"{self.index + 1}/{self.count}"
+
+    def shard_for(self, key: str) -> int:
+        """
+        Map a key to its shard using contiguous ranges of the hash space.
+
+        Args:
+            key: Person directory or relative path.
+
+        Returns:
+            int: Zero-based shard index.
+        """
+        return (_stable_hash(key) * self.count) >> 64
+
+    def owns(self, relative_path: Path) -> bool:
+        """
+        Check whether a file belongs to this shard.
+
+        Args:
+            relative_path: Path relative to the input directory.
+
+        Returns:
+            bool: True if this shard processes the file.
+        """
+        parts = Path(relative_path).parts
+        if not parts:
+            return False
+        key = parts[0] if self.mode == 'person' else Path(*parts).as_posix()
+        return self.shard_for(key) == self.index
+
+    def skips_directory(self, relative_path: Path) -> bool:
+        """
+        Check whether a directory can be pruned from the walk.
+
+        Only top-level person directories of other shards are pruned (person mode).
+
+        Args:
+            relative_path: Directory path relative to the input directory.
+
+        Returns:
+            bool: True if nothing under the directory belongs to this shard.
+        """
+        parts = Path(relative_path).parts
+        return self.mode == 'person' and len(parts) == 1 and self.shard_for(parts[0]) != self.index
+
+
+class ShardJournal(ResultSink):
+    """Per-shard JSONL journal of results, finished with a completion marker."""
+
+    def __init__(self, journal_dir: str, shard: ShardSpec):
+        """
+        Open the journal for a shard, replacing any earlier attempt.
+
+        Args:
+            journal_dir: Directory holding the journals of all shards.
+            shard: Shard this host executes.
+        """
+        Path(journal_dir).mkdir(parents=True, exist_ok=True)
+        super().__init__(str(Path(journal_dir) / f"journal-{shard.index + 1:04d}-of-{shard.count:04d}.jsonl"))
+        self.shard = shard
+        self.files = 0
+        self.errors = 0
+        self._stream.write(json.dumps({'journal': {
+            'shard': shard.index + 1,
+            'count': shard.count,
+            'mode': shard.mode,
+            'host': socket.gethostname(),
+            'started': datetime.now().isoformat(timespec='seconds'),
+        }}) + "\n")
+
+    def write(self, result: FileResult):
+        """
+        Append a result with its destination.
+
+        Args:
+            result: Result record to write.
+        """
+        record = result.to_dict()
+        if result.new_filename:
+            record['destination'] = f"{result.person}/{result.new_filename}"
+        self.files += 1
+        self.errors += 1 if result.error else 0
+        self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def finish(self):
+        """
+        Write the completion marker.
+
+        Only called once the shard ran to the end; a journal closed without it
+        (error, interruption) is reported as incomplete by reconcile.
+        """
+        self._stream.write(json.dumps({'complete': {
+            'files': self.files,
+            'errors': self.errors,
+            'finished': datetime.now().isoformat(timespec='seconds'),
+        }}) + "\n")
+        self._stream.flush()
+
+
+class ReconcileReport:
+    """Outcome of merging the journals of a sharded run."""
+
+    def __init__(self, summary: ResultAggregator):
+        """
+        Initialize an empty report.
+
+        Args:
+            summary: Aggregator receiving every journaled result.
+        """
+        self.summary = summary
+        self.shard_count = 0
+        self.missing_shards: List[int] = []
+        self.incomplete_shards: List[int] = []
+        self.collisions = 0
+        self.collision_samples: List[str] = []
+
+    @property
+    def ok(self) -> bool:
+        """Whether every shard finished and no destination was written twice."""
+        return not (self.missing_shards or self.incomplete_shards or self.collisions)
+
+    def print_report(self):
+        """Print the combined summary followed by the reconcile findings."""
+        self.summary.print_summary()
+        print(f"\n=== Reconcile ===")
+        print(f"Shards: {self.shard_count}")
+        if self.missing_shards:
+            print(f"Missing shards: {', '.join(map(str, self.missing_shards))}")
+        if self.incomplete_shards:
+            print(f"Incomplete shards: {', '.join(map(str, self.incomplete_shards))}")
+        print(f"Cross-shard collisions: {self.collisions}")
+        for sample in self.collision_samples:
+            print(f"- {sample}")
+
+
+def journal_counts(journal_dir: str) -> List[int]:
+    """
+    Shard counts of the journals found in a directory.
+
+    Args:
+        journal_dir: Directory holding shard journals.
+
+    Returns:
+        List[int]: Distinct shard counts, ascending.
+    """
+    counts = set()
+    for journal in Path(journal_dir).glob('journal-*-of-*.jsonl'):
+        try:
+            counts.add(int(journal.stem.rsplit('-of-', 1)[1]))
+        except ValueError:
+            continue
+    return sorted(counts)
+
+
+def reconcile(journal_dir: str, config: Optional[Dict] = None, shard_count: Optional[int] = None) -> ReconcileReport:
+    """
+    Merge shard journals into a combined summary and detect cross-shard collisions.
+
+    Args:
+        journal_dir: Directory holding the shard journals.
+        config: Configuration dictionary (Results and Sharding settings).
+        shard_count: Shard count of the run to reconcile; only its journals are
+            merged (default: the only count found in journal_dir).
+
+    Returns:
+        ReconcileReport: Combined summary and findings.
+
+    Raises:
+        ValueError: If shard_count is not given and journals of several
+            shard counts share the directory.
+    """
+    config = config or {}
+    max_samples = config.get('Sharding', {}).get('max_collision_samples', 100)
+    if shard_count is None:
+        counts = journal_counts(journal_dir)
+        if len(counts) > 1:
+            raise ValueError(f"{journal_dir} holds journals of runs with {', '.join(map(str, counts))} shards; "
+                             f"pass the expected shard count")
+        shard_count = counts[0] if counts else 0
+    report = ReconcileReport(ResultAggregator.from_config(config))
+    report.shard_count = shard_count
+    # 8-byte destination digest -> shard number that wrote it
+    owners: Dict[bytes, int] = {}
+    seen_shards = set()
+
+    for journal in sorted(Path(journal_dir).glob(f'journal-*-of-{shard_count:04d}.jsonl')):
+        shard = None
+        complete = False
+        with open(journal, 'r', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if 'journal' in record:
+                    shard = record['journal']['shard']
+                    seen_shards.add(shard)
+                    continue
+                if 'complete' in record:
+                    complete = True
+                    continue
+                destination = record.pop('destination', '')
+                report.summary.add(FileResult.from_dict(record))
+                if not destination:
+                    continue
+                digest = hashlib.blake2b(destination.casefold().encode('utf-8'), digest_size=8).digest()
+                owner = owners.setdefault(digest, shard)
+                if owner != shard:
+                    report.collisions += 1
+                    if len(report.collision_samples) < max_samples:
+                        report.collision_samples.append(f"{destination} (shards {owner} and {shard})")
+        if shard is not None and not complete:
+            report.incomplete_shards.append(shard)
+
+    report.missing_shards = [n for n in range(1, report.shard_count + 1) if n not in seen_shards]
+    return report
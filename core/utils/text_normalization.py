@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+"""
+Unicode Text Normalization for VisualCare File Migration Renamer.
+
+Folder names come from several platforms: macOS stores decomposed (NFD)
+characters, Windows composed (NFC) ones, and names typed in Office documents
+often carry non-breaking spaces. This module reduces names to one canonical
+lookup key so "Zoë Müller" matches however it was written, and provides an
+index that normalizes registry keys once at load time and keeps every lookup
+a single hashed dict access.
+
+File Path: core/utils/text_normalization.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Unicode normalization (NFC by default) before any comparison
+- Case folding (str.casefold, so "ß" matches "ss"), optional
+- Whitespace canonicalization: every Unicode space (NBSP, thin and ideographic
+  spaces, tabs) becomes one ASCII space, runs are collapsed and ends trimmed;
+  zero-width characters are removed
+- Keys memoized per normalizer, so each distinct path component is
+  normalized once per run
+- NormalizedIndex: name -> value dict keyed by the normalized name
+
+Configuration:
+- TextNormalization.form: Unicode normalization form (NFC, NFKC, NFD, NFKD)
+- TextNormalization.casefold: Fold case in lookup keys
+- TextNormalization.cache_size: Memoized keys per normalizer
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+
+_WHITESPACE = re.compile(r'\s+')
+_ZERO_WIDTH = dict.fromkeys(map(ord, '\u200b\u200c\u200d\u2060\ufeff'))
+
+
+class TextNormalizer:
+    """Canonical forms of names for matching."""
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Read the normalization settings.
+
+        Args:
+            config: Configuration dictionary (TextNormalization settings).
+        """
+        settings = (config or {}).get('TextNormalization', {})
+        self.form = settings.get('form', 'NFC')
+        self.casefold = settings.get('casefold', True)
+        cache_size = settings.get('cache_size', 65536)
+        self.canonical = lru_cache(maxsize=cache_size)(self._canonical)
+        self.key = lru_cache(maxsize=cache_size)(self._key)
+
+    def _canonical(self, text: str) -> str:
+        """
+        Normalize Unicode form and whitespace, keeping case.
+
+        Args:
+            text: Name or path component.
+
+        Returns:
+            str: Canonical text.
+        """
+        text = unicodedata.normalize(self.form, text).translate(_ZERO_WIDTH)
+        return _WHITESPACE.sub(' ', text).strip()
+
+    def _key(self, text: str) -> str:
+        """
+        Lookup key of a name: canonical text, case folded when configured.
+
+        Args:
+            text: Name or path component.
+
+        Returns:
+            str: Key to compare or hash.
+        """
+        canonical = self.canonical(text)
+        return canonical.casefold() if self.casefold else canonical
+
+
+class NormalizedIndex:
+    """Mapping from names to values, looked up by normalized key."""
+
+    def __init__(self, normalizer: TextNormalizer, items: Iterable[Tuple[str, str]] = ()):
+        """
+        Build the index; keys are normalized once here.
+
+        Args:
+            normalizer: Normalizer producing the keys.
+            items: (name, value) pairs; the first value for a key wins.
+        """
+        self.normalizer = normalizer
+        self._index: Dict[str, str] = {}
+        for name, value in items:
+            self.add(name, value)
+
+    def add(self, name: str, value: str):
+        """
+        Add a name unless its key is already present.
+
+        Args:
+            name: Name as written in the registry.
+            value: Value returned for the name.
+        """
+        key = self.normalizer.key(name)
+        if key:
+            self._index.setdefault(key, value)
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a name.
+
+        Args:
+            name: Name as found in a path.
+            default: Returned when the name is not indexed.
+
+        Returns:
+            Value of the name, or default.
+        """
+        return self._index.get(self.normalizer.key(name), default)
+
+    def __contains__(self, name: str) -> bool:
+        return self.normalizer.key(name) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self) -> Iterator[str]:
+        """Normalized keys, in insertion order."""
+        return iter(self._index)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """(normalized key, value) pairs, in insertion order."""
+        return iter(self._index.items())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+
+"""
+Transfer Throttling for VisualCare File Migration Renamer.
+
+This module limits how hard a migration hits the storage it reads from and
+writes to, so it can run during business hours on a shared NAS without
+slowing down everyone else's file access.
+
+File Path: core/utils/throttle.py
+
+@package VisualCare\\FileMigration\\Utils
+@since   1.0.0
+
+Features:
+- Token buckets limiting files per second and MB per second
+- Adaptive concurrency (additive increase, multiplicative decrease) that
+  backs off when per-transfer latency rises above its observed baseline
+- Limits adjustable mid-run via a YAML control file or SIGHUP
+
+Configuration:
+- Throttle.files_per_second: Maximum files started per second (0 = unlimited)
+- Throttle.mb_per_second: Maximum MB transferred per second (0 = unlimited)
+- Throttle.adaptive: Enable adaptive concurrency
+- Throttle.max_concurrency / Throttle.min_concurrency: Bounds for adaptive concurrency
+- Throttle.latency_tolerance: Latency increase (vs. baseline) that triggers a back-off
+- Throttle.control_file: YAML file re-read when it changes or on SIGHUP
+- Throttle.control_poll_interval: Seconds between control file checks
+"""
+
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import yaml
+
+
+MB = 1024 * 1024
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers may go into debt for large requests."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (0 or less disables the limit).
+            burst: Bucket capacity (default: one second's worth of tokens).
+        """
+        self._lock = threading.Lock()
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate: float, burst: Optional[float] = None):
+        """
+        Change the refill rate.
+
+        Args:
+            rate: Tokens added per second (0 or less disables the limit).
+            burst: Bucket capacity (default: one second's worth of tokens).
+        """
+        with self._lock:
+            self.rate = max(0.0, float(rate or 0))
+            self.burst = float(burst) if burst else self.rate
+            self._tokens = min(self._tokens, self.burst)
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Take tokens, sleeping until the bucket is no longer in debt.
+
+        Args:
+            amount: Number of tokens to take.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            if self.rate <= 0:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrency:
+    """Concurrency limit that adapts to observed transfer latency (AIMD)."""
+
+    def __init__(self, maximum: int, minimum: int = 1, latency_tolerance: float = 2.0, enabled: bool = True):
+        """
+        Initialize the limiter at its maximum.
+
+        Args:
+            maximum: Upper bound on concurrent transfers.
+            minimum: Lower bound on concurrent transfers.
+            latency_tolerance: Ratio of smoothed to baseline latency that triggers a back-off.
+            enabled: If False the limit stays fixed at maximum.
+        """
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.latency_tolerance = latency_tolerance
+        self.enabled = enabled
+        self.limit = self.maximum
+        self.active = 0
+        self._condition = threading.Condition()
+        self._smoothed = None
+        self._baseline = None
+        self._completed = 0
+
+    def set_maximum(self, maximum: int):
+        """
+        Change the upper bound (the current limit is clamped to it).
+
+        Args:
+            maximum: New upper bound on concurrent transfers.
+        """
+        with self._condition:
+            self.maximum = max(self.minimum, maximum)
+            self.limit = min(self.limit, self.maximum) if self.enabled else self.maximum
+            self._condition.notify_all()
+
+    def acquire(self):
+        """Block until a transfer slot is free."""
+        with self._condition:
+            while self.active >= self.limit:
+                self._condition.wait()
+            self.active += 1
+
+    def release(self, latency: float):
+        """
+        Free a transfer slot and feed back the transfer's latency.
+
+        Args:
+            latency: Normalised latency of the finished transfer in seconds.
+        """
+        with self._condition:
+            self.active -= 1
+            if self.enabled:
+                self._observe(latency)
+            self._condition.notify_all()
+
+    def _observe(self, latency: float):
+        """Update the smoothed latency and adjust the limit once per window."""
+        self._smoothed = latency if self._smoothed is None else 0.8 * self._smoothed + 0.2 * latency
+        self._completed += 1
+        if self._completed < self.limit:
+            return
+        self._completed = 0
+        if self._baseline is None or self._smoothed < self._baseline:
+            self._baseline = self._smoothed
+        if self._smoothed > self._baseline * self.latency_tolerance:
+            self.limit = max(self.minimum, self.limit // 2)
+        else:
+            self.limit = min(self.maximum, self.limit + 1)
+
+
+class Throttle:
+    """Rate and concurrency limits applied around every file transfer."""
+
+    def __init__(self, config: Dict):
+        """
+        Initialize the throttle.
+
+        Args:
+            config: Configuration dictionary containing Throttle settings.
+        """
+        settings = config.get('Throttle', {})
+        self.files = TokenBucket(settings.get('files_per_second', 0))
+        self.bytes = TokenBucket(settings.get('mb_per_second', 0) * MB)
+        self.concurrency = AdaptiveConcurrency(
+            settings.get('max_concurrency', 8),
+            settings.get('min_concurrency', 1),
+            settings.get('latency_tolerance', 2.0),
+            settings.get('adaptive', False)
+        )
+        self.control_file = settings.get('control_file') or None
+        self.control_poll_interval = settings.get('control_poll_interval', 5)
+        self._control_mtime = None
+        self._next_poll = 0.0
+        self._reload_requested = threading.Event()
+
+    @property
+    def active(self) -> bool:
+        """Whether any limit is in effect."""
+        return bool(self.files.rate or self.bytes.rate or self.concurrency.enabled or self.control_file)
+
+    def apply(self, limits: Dict):
+        """
+        Apply new limits (keys missing from the dict are left unchanged).
+
+        Args:
+            limits: Any of files_per_second, mb_per_second, max_concurrency.
+        """
+        if 'files_per_second' in limits:
+            self.files.set_rate(limits['files_per_second'])
+        if 'mb_per_second' in limits:
+            self.bytes.set_rate((limits['mb_per_second'] or 0) * MB)
+        if 'max_concurrency' in limits:
+            self.concurrency.set_maximum(int(limits['max_concurrency']))
+
+    def install_signal_handler(self):
+        """Re-read the control file on SIGHUP (main thread, POSIX only; no-op without a control file)."""
+        if self.control_file and hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda signum, frame: self._reload_requested.set())
+
+    def poll(self):
+        """Reload the control file if it changed or a reload was requested."""
+        if not self.control_file:
+            return
+        now = time.monotonic()
+        if not self._reload_requested.is_set() and now < self._next_poll:
+            return
+        self._next_poll = now + self.control_poll_interval
+        force = self._reload_requested.is_set()
+        self._reload_requested.clear()
+        try:
+            mtime = os.stat(self.control_file).st_mtime_ns
+            if not force and mtime == self._control_mtime:
+                return
+            self._control_mtime = mtime
+            with open(self.control_file, 'r') as f:
+                limits = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError):
+            return
+        if isinstance(limits, dict):
+            self.apply(limits)
+
+    @contextmanager
+    def transfer(self, size: int) -> Iterator[None]:
+        """
+        Wrap a single file transfer in the configured limits.
+
+        Args:
+            size: Size of the file in bytes.
+        """
+        self.poll()
+        self.concurrency.acquire()
+        started = None
+        try:
+            self.files.acquire(1)
+            self.bytes.acquire(size)
+            started = time.monotonic()
+            yield
+        finally:
+            elapsed = time.monotonic() - started if started is not None else 0.0
+            # Normalise by size so large files do not read as a latency spike
+            self.concurrency.release(elapsed / max(1.0, size / MB))
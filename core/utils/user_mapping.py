@@ -15,6 +15,11 @@ File Path: core/utils/user_mapping.py
 Features:
 - CSV-based user ID to name mapping
 - Fuzzy name matching with case-insensitive lookup
+- Name lookups through a normalized index (NFC, case folded, canonical
+  whitespace) built once per mapping file version
+- Configuration parsed once per config file version, so lookups cost no
+  YAML parsing
+- Typo-tolerant fallback (Damerau-Levenshtein) when the exact lookup misses
 - Template-based filename formatting
 - Configurable component ordering and separators
 - Empty component handling and cleanup
@@ -39,12 +44,54 @@ import yaml
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+try:
+    from core.utils.filename_formatter import FilenameFormatter
+    from core.utils.fuzzy_names import FuzzyMatch, FuzzyNameIndex
+    from core.utils.text_normalization import NormalizedIndex, TextNormalizer
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.utils.filename_formatter import FilenameFormatter
+    from core.utils.fuzzy_names import FuzzyMatch, FuzzyNameIndex
+    from core.utils.text_normalization import NormalizedIndex, TextNormalizer
+
+
+# (mapping path, mtime_ns, settings) -> indexes of the mapping file ('exact', 'fuzzy')
+_USER_INDEX = {}
+
+# (config path, mtime_ns) -> parsed configuration ('config') and template formatter ('formatter')
+_CONFIG_CACHE = {}
+
+DEFAULT_TEMPLATE = '{id}_{name}_{remainder}_{date}'
+
 
 def load_config() -> Dict:
-    """Load configuration from components.yaml."""
-    config_path = Path(__file__).parent.parent.parent / 'config' / 'components.yaml'
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    """
+    Load configuration from components.yaml (or $VC_CONFIG_FILE).
+    
+    The file is parsed once per version (path, mtime); the returned dictionary
+    is shared, do not modify it.
+    
+    Returns:
+        Configuration dictionary
+    """
+    return _cached_config()['config']
+
+
+def _cached_config() -> Dict:
+    """Cache entry of the current config file version."""
+    config_path = Path(os.environ.get('VC_CONFIG_FILE') or Path(__file__).parent.parent.parent / 'config' / 'components.yaml')
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    stamp = (str(config_path), mtime_ns)
+    if stamp not in _CONFIG_CACHE:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f)
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[stamp] = {'config': config}
+    return _CONFIG_CACHE[stamp]
 
 
 def load_user_mapping() -> Dict[str, str]:
@@ -56,18 +103,9 @@ def load_user_mapping() -> Dict[str, str]:
     """
     config = load_config()
     user_config = config.get('UserMapping', {})
-    
-    # Allow override via environment variable for real runs
-    mapping_file = os.environ.get('VC_USER_MAPPING_FILE') or user_config.get('mapping_test_file', 'config/user_mapping.csv')
     id_column = user_config.get('id_column', 'user_id')
     name_column = user_config.get('name_column', 'full_name')
-    
-    # Resolve relative path from project root
-    project_root = Path(__file__).parent.parent.parent
-    # Support absolute or relative mapping file paths
-    mapping_path = Path(mapping_file)
-    if not mapping_path.is_absolute():
-        mapping_path = project_root / mapping_path
+    mapping_path = get_user_mapping_path(config)
     
     if not mapping_path.exists():
         if user_config.get('create_if_missing', True):
@@ -88,6 +126,81 @@ def load_user_mapping() -> Dict[str, str]:
     return user_mapping
 
 
+def get_user_mapping_path(config: Dict) -> Path:
+    """
+    Resolve the user mapping CSV path.
+    
+    Args:
+        config: Configuration dictionary containing UserMapping settings
+        
+    Returns:
+        Absolute path of the mapping file
+    """
+    user_config = config.get('UserMapping', {})
+    # Allow override via environment variable for real runs
+    mapping_file = os.environ.get('VC_USER_MAPPING_FILE') or user_config.get('mapping_test_file', 'config/user_mapping.csv')
+    # Support absolute or relative (to the project root) mapping file paths
+    mapping_path = Path(mapping_file)
+    if not mapping_path.is_absolute():
+        mapping_path = Path(__file__).parent.parent.parent / mapping_path
+    return mapping_path
+
+
+def load_user_index(config: Optional[Dict] = None) -> NormalizedIndex:
+    """
+    Load the name -> user ID index, normalizing every registry name once.
+    
+    The index is kept until the mapping file (or the normalization settings)
+    change, so repeated lookups cost one normalized dict access.
+    
+    Args:
+        config: Configuration dictionary (default: components.yaml)
+        
+    Returns:
+        NormalizedIndex mapping full names to user IDs (first row wins)
+    """
+    indexes = _user_indexes(config or load_config())
+    if 'exact' not in indexes:
+        indexes['exact'] = NormalizedIndex(TextNormalizer(indexes['config']),
+                                           ((name, user_id) for user_id, name in load_user_mapping().items()))
+    return indexes['exact']
+
+
+def load_fuzzy_user_index(config: Optional[Dict] = None) -> FuzzyNameIndex:
+    """
+    Load the approximate name -> user ID index (built on the first exact miss).
+    
+    Args:
+        config: Configuration dictionary (default: components.yaml)
+        
+    Returns:
+        FuzzyNameIndex over the registry names, sharing the exact index normalizer
+    """
+    config = config or load_config()
+    indexes = _user_indexes(config)
+    if 'fuzzy' not in indexes:
+        exact = load_user_index(config)
+        indexes['fuzzy'] = FuzzyNameIndex(config, ((name, user_id) for user_id, name in load_user_mapping().items()),
+                                          exact.normalizer)
+    return indexes['fuzzy']
+
+
+def _user_indexes(config: Dict) -> Dict:
+    """Index cache entry of the current mapping file version and settings."""
+    mapping_path = get_user_mapping_path(config)
+    try:
+        mtime_ns = mapping_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    settings = tuple(sorted(config.get('TextNormalization', {}).items())) + \
+        tuple(sorted(config.get('FuzzyNames', {}).items()))
+    stamp = (str(mapping_path), mtime_ns, settings)
+    if stamp not in _USER_INDEX:
+        _USER_INDEX.clear()
+        _USER_INDEX[stamp] = {'config': config}
+    return _USER_INDEX[stamp]
+
+
 def create_default_mapping(mapping_path: Path, id_column: str, name_column: str):
     """Create a default user mapping file."""
     mapping_path.parent.mkdir(parents=True, exist_ok=True)
@@ -106,36 +219,70 @@ def create_default_mapping(mapping_path: Path, id_column: str, name_column: str)
         writer.writerows(default_mapping)
 
 
-def get_user_id_by_name(full_name: str) -> Optional[str]:
+def get_user_id_by_name(full_name: str, config: Optional[Dict] = None) -> Optional[str]:
     """
     Get user ID by full name, handling optional prefix/suffix removal.
     
     Args:
         full_name: The full name to look up (may include prefix/suffix)
+        config: Configuration dictionary (default: components.yaml)
         
     Returns:
         User ID if found, None otherwise
     """
-    config = load_config()
-    user_config = config.get('UserMapping', {})
-    user_mapping = load_user_mapping()
+    return resolve_person_name(full_name, config)[0]
+
+
+def clean_person_folder(folder_name: str, config: Dict) -> str:
+    """
+    Remove the configured prefix and management suffix from a person folder name.
     
-    # Remove prefix and management_suffix if configured
+    Args:
+        folder_name: Person folder name (e.g. "VC - John Doe Management")
+        config: Configuration dictionary containing UserMapping settings
+        
+    Returns:
+        The person's name as written in the folder
+    """
+    user_config = config.get('UserMapping', {})
     prefix = user_config.get('prefix', '')
     management_suffix = user_config.get('management_suffix', '')
     
-    cleaned_name = full_name
+    cleaned_name = folder_name
     if prefix and cleaned_name.startswith(prefix):
         cleaned_name = cleaned_name[len(prefix):].strip()
     if management_suffix and cleaned_name.endswith(management_suffix):
         cleaned_name = cleaned_name[:-len(management_suffix)].strip()
+    return cleaned_name
+
+
+def resolve_person_name(full_name: str, config: Optional[Dict] = None) -> Tuple[Optional[str], Optional[FuzzyMatch]]:
+    """
+    Resolve a person folder name to a user ID, falling back to approximate matching.
     
-    # Direct lookup (case-insensitive)
-    for user_id, name in user_mapping.items():
-        if name.lower() == cleaned_name.lower():
-            return user_id
-    
-    return None
+    Args:
+        full_name: The full name to look up (may include prefix/suffix)
+        config: Configuration dictionary (default: components.yaml)
+        
+    Returns:
+        Tuple of the user ID (None if unresolved) and the approximate match
+        used or found ambiguous (None after an exact match or no match)
+    """
+    config = config or load_config()
+    cleaned_name = clean_person_folder(full_name, config)
+    
+    # Direct lookup (Unicode normalized, case-insensitive)
+    user_id = load_user_index(config).get(cleaned_name)
+    if user_id is not None or not cleaned_name:
+        return user_id, None
+    
+    # Typo-tolerant lookup (opt-in), memoized per folder name
+    if not config.get('FuzzyNames', {}).get('enabled', False):
+        return None, None
+    match = load_fuzzy_user_index(config).match(cleaned_name)
+    if match is None:
+        return None, None
+    return (None if match.ambiguous else match.value), match
 
 
 def get_name_by_user_id(user_id: str) -> Optional[str]:
@@ -209,35 +356,19 @@ def format_filename_with_id(user_id: str, name: str, date: str, remainder: str,
     Returns:
         Formatted filename string
     """
-    config = load_config()
-    format_config = config.get('FilenameFormat', {})
-    
-    template = format_config.get('template', '{id}_{name}_{remainder}_{date}')
-    skip_empty = format_config.get('skip_empty_components', True)
-    cleanup_separators = format_config.get('cleanup_separators', True)
-    
-    # Replace placeholders in template
-    formatted = template.format(
-        id=user_id,
-        name=name,
-        date=date,
-        remainder=remainder,
-        category=category,
-        management_flag=management_flag
-    )
-    
-    if skip_empty:
-        # Remove empty components and their separators
-        import re
-        # Remove patterns like "_" or "__" that result from empty components
-        formatted = re.sub(r'_+', '_', formatted)
-        # Remove leading/trailing underscores
-        formatted = formatted.strip('_')
-    
-    if cleanup_separators:
-        # Clean up multiple consecutive separators
-        import re
-        formatted = re.sub(r'_+', '_', formatted)
+    # FilenameFormat.template compiled once per config file version
+    cached = _cached_config()
+    if 'formatter' not in cached:
+        template = cached['config'].get('FilenameFormat', {}).get('template', DEFAULT_TEMPLATE)
+        cached['formatter'] = FilenameFormatter(cached['config'], template=template)
+    formatted = cached['formatter'].format({
+        'id': user_id,
+        'name': name,
+        'remainder': remainder,
+        'date': date,
+        'category': category,
+        'management': management_flag
+    })
     
     return formatted
 
@@ -283,7 +414,7 @@ def extract_user_from_path(full_path: str) -> str:
         raw_remainder = ""
     
     # Get user mapping info
-    user_id = get_user_id_by_name(person_directory) or ""
+    user_id = get_user_id_by_name(person_directory, config) or ""
     raw_name = person_directory
     
     # Get cleaned name (with prefix/management_suffix removed)
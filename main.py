@@ -26,14 +26,40 @@ import logging
 import os
 import shutil
 import sys
+import time
 import yaml
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import re
 
-from core.utils.user_mapping import extract_user_from_path
+from core.utils.user_mapping import extract_user_from_path, load_user_mapping, resolve_person_name
 from core.utils.date_matcher import extract_date_matches
+from core.utils.async_executor import AsyncTransferExecutor
+from core.utils.extraction_cache import ExtractionCache
+from core.utils.category_processor import CategoryProcessor
+from core.utils.destination_dirs import DestinationDirectoryManager
+from core.utils.directory_processor import DirectoryProcessor
+from core.utils.document_dates import DocumentDateReader
+from core.utils.file_walker import WalkEntry
+from core.utils.filename_formatter import FilenameFormatter
+from core.utils.fuzzy_names import FuzzyMatch
+from core.utils.ignore_matcher import IgnoreMatcher
+from core.utils.metrics import METRICS, start_exporters
+from core.utils.migration_plan import CollisionTracker, PlanEntry, PlanWriter
+from core.utils.misfiled_audit import MisfiledAudit, MisfiledReport
+from core.utils.name_limits import OutputNameBuilder
+from core.utils.plugin_manager import PluginManager
+from core.utils.progress import ProgressReporter
+from core.utils.results import FileResult, ResultAggregator, ResultSink
+from core.utils.scheduler import plan_work_units, run_largest_first, size_tree
+from core.utils.sharding import SHARD_MODES, ShardJournal, ShardSpec, reconcile
+from core.utils.throttle import Throttle
+
+# (config path, mtime_ns) -> parsed configuration ('config'), filename formatter ('formatter')
+# and output name builder ('builder')
+_CONFIG_CACHE = {}
 
 
 class FileMigrationRenamer:
@@ -44,10 +70,26 @@ class FileMigrationRenamer:
         Initialize the FileMigrationRenamer.
         
         Args:
-            config_path: Optional path to configuration file
+            config_path: Optional path to configuration file (default: $VC_CONFIG_FILE,
+                then config/components.yaml)
         """
+        if config_path is None:
+            config_path = str(get_config_path())
+        self.config_path = config_path
         self.config = self._load_config(config_path)
         self.logger = self._setup_logging()
+        # Per-file INFO lines are opt-in; on large runs they cost measurable time
+        self.log_files = self.config.get('Progress', {}).get('log_files', False)
+        # File and directory exclusions, compiled once
+        self.ignore = IgnoreMatcher(self.config)
+        # Traversal and folder context (ignore rules, max_depth, per-folder memos)
+        self.directory_processor = DirectoryProcessor(self.config, self.ignore)
+        # Output filename assembly within the Windows/SharePoint length limits
+        self.name_builder = OutputNameBuilder(self.config)
+        # In-process plugin hooks (plugins directory and vcmigrate.plugins entry points)
+        self.plugins = PluginManager.from_config(self.config)
+        # Person folder name -> approximate registry match (None when exact or unresolved)
+        self.person_matches: Dict[str, Optional[FuzzyMatch]] = {}
         
     def _load_config(self, config_path: Optional[str] = None) -> Dict:
         """
@@ -77,284 +119,437 @@ class FileMigrationRenamer:
         )
         return logging.getLogger(__name__)
     
-    def process_directory(self, input_dir: str, output_dir: str, user_mapping: Dict[str, str], 
-                         category_mapping: Dict[str, str], duplicate: bool = True, exclude_management_flag: bool = False) -> List[Dict]:
+    def walk_filters(self, shard: Optional[ShardSpec] = None) -> Tuple[Callable[[Path], bool], Callable[[Path], bool]]:
         """
-        Process all files in a directory with multi-level support.
+        Build the directory pruning and file inclusion callables for walks of the input tree.
+        
+        Args:
+            shard: Optional shard; other shards' directories and files are left out
+        
+        Returns:
+            Tuple: (skip_dir, include) taking paths relative to the input directory
+        """
+        processor = self.directory_processor
+        if not shard:
+            return processor.skip_dir, processor.include
+        skip_dir = lambda relative_path: processor.skip_dir(relative_path) or shard.skips_directory(relative_path)
+        include = lambda relative_path: processor.include(relative_path) and shard.owns(relative_path)
+        return skip_dir, include
+    
+    def plan_directory(self, input_dir: str, user_mapping: Dict[str, str], category_mapping: Dict[str, str],
+                       exclude_management_flag: bool = False, cache: Optional[ExtractionCache] = None,
+                       collisions: Optional[CollisionTracker] = None,
+                       shard: Optional[ShardSpec] = None,
+                       entries: Optional[Iterable[WalkEntry]] = None,
+                       progress: Optional[ProgressReporter] = None) -> Iterator[PlanEntry]:
+        """
+        Walk an input directory and compute the destination of every file, one at a time.
+        
+        Nothing is written to the output location; entries are produced as they
+        are computed (in batches of Plugins.batch_size when plugin hooks are
+        registered) so callers can preview or execute in constant memory.
         
         Args:
             input_dir: Input directory path
-            output_dir: Output directory path
             user_mapping: Dictionary mapping full names to user IDs
             category_mapping: Dictionary mapping category names to category IDs
-            duplicate: If True, copy files; if False, move files
+            exclude_management_flag: Whether to exclude the management flag from filenames
+            cache: Optional extraction cache reused across runs
+            collisions: Optional tracker shared with the caller to count collisions
+            shard: Optional shard; only files belonging to it are planned
+            entries: Optional walker entries to plan instead of walking input_dir
+                (used by the scheduler to plan one work unit)
+            progress: Optional progress reporter counting the files of the walk
             
         Returns:
-            List of processing results
+            Iterator of PlanEntry for each file that is not excluded, after the
+            pre_extract and post_extract plugin hooks
         """
-        results = []
+        return self.plugins.apply('post_extract', self._plan_entries(
+            input_dir, user_mapping, category_mapping, exclude_management_flag, cache, collisions, shard, entries,
+            progress))
+    
+    def _plan_entries(self, input_dir: str, user_mapping: Dict[str, str], category_mapping: Dict[str, str],
+                      exclude_management_flag: bool, cache: Optional[ExtractionCache],
+                      collisions: Optional[CollisionTracker], shard: Optional[ShardSpec],
+                      entries: Optional[Iterable[WalkEntry]],
+                      progress: Optional[ProgressReporter] = None) -> Iterator[PlanEntry]:
+        """Generator behind plan_directory (same arguments)."""
         input_path = Path(input_dir)
-        output_path = Path(output_dir)
+        collisions = collisions if collisions is not None else CollisionTracker()
+        unmapped_people = set()
         
-        if not input_path.exists():
-            results.append({'error': f"Input directory not found: {input_dir}"})
-            return results
-        
-        # Create output directory if it doesn't exist
-        output_path.mkdir(parents=True, exist_ok=True)
+        # Read embedded document dates on a thread pool ahead of extraction
+        document_reader = None
+        if entries is None:
+            entries = self.directory_processor.walk_entries(input_path, shard.skips_directory if shard else None)
+            if shard:
+                entries = (entry for entry in entries if shard.owns(entry.relative_path))
+        if progress:
+            entries = progress.discover(entries)
+        entries = self.plugins.apply('pre_extract', entries)
+        if self.config.get('MetadataDates', {}).get('enabled', False):
+            document_reader = DocumentDateReader(self.config)
+            entries = document_reader.prefetch(entries, key=lambda entry: entry.path)
         
-        # Get all files recursively
-        for filepath in input_path.rglob('*'):
-            if filepath.is_file():
+        try:
+            # Get all files recursively, with the stat captured during the walk
+            for filepath, relative_path, orig_stat in entries:
                 # Check if file should be excluded
                 filename = filepath.name
-                should_exclude = False
-                
-                # Load config to get exclusions
-                config = load_config()
-                exclusions = config.get('Global', {}).get('file_exclusions', [])
-                
-                for exclusion in exclusions:
-                    if exclusion.startswith('*') and exclusion.endswith('*'):
-                        # Pattern like "*tmp*"
-                        pattern = exclusion[1:-1]
-                        if pattern in filename:
-                            should_exclude = True
-                            break
-                    elif exclusion.startswith('*'):
-                        # Pattern like "*.tmp"
-                        pattern = exclusion[1:]
-                        if filename.endswith(pattern):
-                            should_exclude = True
-                            break
-                    elif exclusion.endswith('*'):
-                        # Pattern like "~$*"
-                        pattern = exclusion[:-1]
-                        if filename.startswith(pattern):
-                            should_exclude = True
-                            break
-                    else:
-                        # Exact match
-                        if filename == exclusion:
-                            should_exclude = True
-                            break
-                
-                if should_exclude:
-                    self.logger.info(f"Skipping excluded file: {filename}")
+                if self.ignore.ignores_file(filename):
+                    if self.log_files:
+                        self.logger.info(f"Skipping excluded file: {filename}")
                     continue
-            
-                # Debug: Log files that are being processed
-                if filename == "desktop.ini":
-                    self.logger.warning(f"Processing desktop.ini file: {filepath}")
-                    self.logger.warning(f"Exclusions: {exclusions}")
-                    self.logger.warning(f"Filename: '{filename}'")
-                
-                # Get relative path from input directory
-                relative_path = filepath.relative_to(input_path)
                 
                 # Use the real normalize_filename function
                 try:
-                    # Extract person name and management status from the original path
-                    person_directory = relative_path.parts[0] if relative_path.parts else ""
-                    
-                    # Use the user_mapping function to get cleaned name and management status
-                    from core.utils.user_mapping import extract_user_from_path
-                    user_result = extract_user_from_path(str(relative_path))
-                    user_parts = user_result.split('|')
-                    cleaned_person_name = user_parts[2] if len(user_parts) > 2 else person_directory
-                    is_management_folder = user_parts[5] == 'True' if len(user_parts) > 5 else False
-                    
-                    normalized_filename = normalize_filename(str(relative_path), user_mapping, category_mapping, str(filepath), is_management_folder, exclude_management_flag)
-                    
-                    result = {
-                        'original_filename': str(relative_path),
-                        'new_filename': normalized_filename,
-                        'person': cleaned_person_name,
-                        'success': True
-                    }
-            
-                    try:
-                        # Create person subdirectory in output using cleaned name
-                        person_output_dir = output_path / cleaned_person_name
-                        person_output_dir.mkdir(parents=True, exist_ok=True)
+                    cached = cache.get(str(relative_path), orig_stat) if cache else None
+                    if cache:
+                        METRICS.cache_lookups.inc(result='hit' if cached else 'miss')
+                    warnings = []
+                    if cached:
+                        cleaned_person_name = cached['person']
+                        normalized_filename = cached['new_filename']
+                        user_id = cached.get('user_id', '')
+                        warnings.extend(cached.get('warnings', []))
+                    else:
+                        # Extract person name and management status from the original path
+                        person_directory = relative_path.parts[0] if relative_path.parts else ""
                         
-                        # Capture original file times before processing
-                        orig_stat = filepath.stat()
-                        orig_mtime = orig_stat.st_mtime
-                        orig_atime = orig_stat.st_atime
+                        # Use the user_mapping function to get cleaned name and management status
+                        user_result = extract_user_from_path(str(relative_path))
+                        user_parts = user_result.split('|')
+                        user_id = user_parts[0]
+                        cleaned_person_name = user_parts[2] if len(user_parts) > 2 else person_directory
+                        is_management_folder = user_parts[5] == 'True' if len(user_parts) > 5 else False
                         
-                        # Process file (copy or move)
-                        new_filepath = person_output_dir / normalized_filename
-                        if duplicate:
-                            shutil.copy2(filepath, new_filepath)
-                            result['copied'] = True
-                            self.logger.info(f"Copied: {relative_path} -> {cleaned_person_name}/{normalized_filename}")
-                        else:
-                            filepath.rename(new_filepath)
-                            result['moved'] = True
-                            self.logger.info(f"Moved: {relative_path} -> {cleaned_person_name}/{normalized_filename}")
+                        # Flag every file of a person folder resolved approximately (or ambiguous)
+                        if person_directory not in self.person_matches:
+                            self.person_matches[person_directory] = resolve_person_name(person_directory, self.config)[1]
+                        match = self.person_matches[person_directory]
+                        if match:
+                            warnings.append(match.describe())
                         
-                        # Restore original times on the new file (ignore errors for Windows files)
-                        try:
-                            os.utime(new_filepath, (orig_atime, orig_mtime))
-                        except OSError as e:
-                            # Windows files might not allow timestamp modification, but that's okay
-                            self.logger.warning(f"Could not restore timestamps for {relative_path}: {e}")
-                            # Continue processing - the file was still copied/moved successfully
-                    except Exception as e:
-                        result['error'] = f"Failed to process {relative_path}: {e}"
-                        result['success'] = False
-                        self.logger.error(result['error'])
-                    
-                    results.append(result)
-                    
+                        normalized_filename = normalize_filename(str(relative_path), user_mapping, category_mapping, str(filepath), is_management_folder, exclude_management_flag, document_reader=document_reader, file_stat=orig_stat, folder_date_matches=self.directory_processor.folder_date_matches, name_builder=self.name_builder, warnings=warnings, folder_context=self.directory_processor.folder_context(relative_path.parent))
+                        
+                        if cache:
+                            cache.put(str(relative_path), orig_stat, {
+                                'person': cleaned_person_name,
+                                'new_filename': normalized_filename,
+                                'user_id': user_id,
+                                'warnings': warnings
+                            })
                 except Exception as e:
-                    result = {
-                        'original_filename': str(relative_path),
-                        'error': f"Failed to normalize filename: {e}",
-                        'success': False
-                    }
-                    results.append(result)
                     self.logger.error(f"Error processing {relative_path}: {e}")
+                    METRICS.errors.inc(stage='extraction')
+                    yield PlanEntry(filepath, str(relative_path), stat=orig_stat,
+                                    error=f"Failed to normalize filename: {e}")
+                    continue
+                
+                # The person folder is an output path component too
+                cleaned_person_name = self.name_builder.folder_name(cleaned_person_name)
+                if not user_id and cleaned_person_name not in unmapped_people:
+                    unmapped_people.add(cleaned_person_name)
+                    warnings.append(f"Unmapped person: '{cleaned_person_name}' has no user ID")
+                if collisions.check(f"{cleaned_person_name}/{normalized_filename}"):
+                    warnings.append(f"Collision: another file is already planned for {cleaned_person_name}/{normalized_filename}")
+                
+                yield PlanEntry(filepath, str(relative_path), cleaned_person_name, normalized_filename,
+                                user_id, orig_stat, tuple(warnings))
+        finally:
+            if document_reader:
+                document_reader.close()
+    
+    def process_directory(self, input_dir: str, output_dir: str, user_mapping: Dict[str, str], 
+                         category_mapping: Dict[str, str], duplicate: bool = True, exclude_management_flag: bool = False,
+                         cache: Optional[ExtractionCache] = None, backend: Optional[str] = None,
+                         throttle: Optional[Throttle] = None, shard: Optional[ShardSpec] = None,
+                         workers: Optional[int] = None,
+                         progress: Optional[ProgressReporter] = None) -> Iterator[FileResult]:
+        """
+        Process all files in a directory with multi-level support.
         
-        return results
+        Args:
+            input_dir: Input directory path
+            output_dir: Output directory path
+            user_mapping: Dictionary mapping full names to user IDs
+            category_mapping: Dictionary mapping category names to category IDs
+            duplicate: If True, copy files; if False, move files
+            cache: Optional extraction cache reused across runs
+            backend: 'serial' or 'async' (default: Execution.backend)
+            throttle: Optional rate and concurrency limits applied to each transfer
+            shard: Optional shard; only files belonging to it are processed
+            workers: Parallel workers for person/category work units (default: Execution.workers)
+            progress: Optional progress reporter; its total comes from the walk already performed
+            
+        Returns:
+            Iterator of FileResult for each processed file, after the post_write plugin hook
+        """
+        return self.plugins.apply('post_write', self._process_entries(
+            input_dir, output_dir, user_mapping, category_mapping, duplicate, cache, backend, throttle, shard,
+            workers, exclude_management_flag, progress))
+    
+    def _process_entries(self, input_dir: str, output_dir: str, user_mapping: Dict[str, str],
+                         category_mapping: Dict[str, str], duplicate: bool, cache: Optional[ExtractionCache],
+                         backend: Optional[str], throttle: Optional[Throttle], shard: Optional[ShardSpec],
+                         workers: Optional[int], exclude_management_flag: bool,
+                         progress: Optional[ProgressReporter] = None) -> Iterator[FileResult]:
+        """Generator behind process_directory (same arguments)."""
+        input_path = Path(input_dir)
+        output_path = Path(output_dir)
+        
+        if not input_path.exists():
+            yield FileResult('', error=f"Input directory not found: {input_dir}")
+            return
+        
+        # Create output directory if it doesn't exist and note the person folders already there
+        directories = DestinationDirectoryManager(output_path)
+        directories.scan()
+        
+        transfer = lambda entry: self.execute_entry(entry, output_path, duplicate, directories, throttle)
+        
+        # Balanced parallel processing: size the tree once, then run person/category units largest first
+        workers = workers or self.config.get('Execution', {}).get('workers', 1)
+        if workers > 1:
+            skip_dir, include = self.walk_filters(shard)
+            sizes = size_tree(input_path, skip_dir, include)
+            if progress:
+                progress.set_total(sum(files for categories in sizes.values() for files, _ in categories.values()))
+            units = plan_work_units(sizes, self.config.get('Scheduler', {}).get('max_unit_files', 5000))
+            self.logger.info(f"Scheduling {len(units)} work units on {workers} workers")
+            collisions = CollisionTracker()
+            
+            def run_unit(unit):
+                unit_entries = unit.walk(input_path, include, skip_dir)
+                planned = self.plan_directory(input_dir, user_mapping, category_mapping, exclude_management_flag,
+                                              cache, collisions, entries=unit_entries)
+                for entry in self.plugins.apply('pre_write', planned):
+                    yield transfer(entry)
+            
+            yield from run_largest_first(units, run_unit, workers)
+            return
+        
+        entries = self.plan_directory(input_dir, user_mapping, category_mapping, exclude_management_flag, cache,
+                                      shard=shard, progress=progress)
+        entries = self.plugins.apply('pre_write', entries)
+        backend = backend or self.config.get('Execution', {}).get('backend', 'serial')
+        if backend == 'async':
+            yield from AsyncTransferExecutor(self.config).run(entries, transfer)
+        else:
+            for entry in entries:
+                yield transfer(entry)
+    
+    def execute_entry(self, entry: PlanEntry, output_path: Path, duplicate: bool,
+                      directories: Optional[DestinationDirectoryManager] = None,
+                      throttle: Optional[Throttle] = None) -> FileResult:
+        """
+        Carry out the planned migration of a single file.
+        
+        Args:
+            entry: Plan entry produced by plan_directory
+            output_path: Output directory path
+            duplicate: If True, copy the file; if False, move it
+            directories: Optional manager remembering which output folders exist
+            throttle: Optional rate and concurrency limits applied to the transfer
+            
+        Returns:
+            FileResult describing the outcome
+        """
+        relative_path = entry.relative_path
+        if entry.error:
+            METRICS.files_processed.inc(result='error')
+            return FileResult(relative_path, error=entry.error)
+        for warning in entry.warnings:
+            self.logger.warning(f"{relative_path}: {warning}")
+        
+        cleaned_person_name = entry.person
+        normalized_filename = entry.new_filename
+        
+        try:
+            # Create person subdirectory in output using cleaned name
+            person_output_dir = output_path / cleaned_person_name
+            if directories:
+                directories.ensure(person_output_dir)
+            else:
+                person_output_dir.mkdir(parents=True, exist_ok=True)
+            
+            orig_mtime = entry.stat.st_mtime
+            orig_atime = entry.stat.st_atime
+            
+            # Process file (copy or move)
+            new_filepath = person_output_dir / normalized_filename
+            with throttle.transfer(entry.stat.st_size) if throttle else nullcontext():
+                started = time.perf_counter()
+                if duplicate:
+                    shutil.copy2(entry.source_path, new_filepath)
+                    action = 'copied'
+                else:
+                    entry.source_path.rename(new_filepath)
+                    action = 'moved'
+                METRICS.transfer_seconds.observe(time.perf_counter() - started)
+            if self.log_files:
+                self.logger.info(f"{action.capitalize()}: {relative_path} -> {cleaned_person_name}/{normalized_filename}")
+            
+            # Restore original times on the new file (ignore errors for Windows files)
+            try:
+                os.utime(new_filepath, (orig_atime, orig_mtime))
+            except OSError as e:
+                # Windows files might not allow timestamp modification, but that's okay
+                METRICS.errors.inc(stage='timestamps')
+                self.logger.warning(f"Could not restore timestamps for {relative_path}: {e}")
+                # Continue processing - the file was still copied/moved successfully
+        except Exception as e:
+            error = f"Failed to process {relative_path}: {e}"
+            self.logger.error(error)
+            METRICS.errors.inc(stage='transfer')
+            METRICS.files_processed.inc(result='error')
+            return FileResult(relative_path, normalized_filename, cleaned_person_name, error=error)
+        
+        METRICS.files_processed.inc(result='success')
+        METRICS.bytes_copied.inc(entry.stat.st_size)
+        return FileResult(relative_path, normalized_filename, cleaned_person_name, True, action, size=entry.stat.st_size)
+    
+    def preview_directory(self, input_dir: str, user_mapping: Dict[str, str], category_mapping: Dict[str, str],
+                          writer: PlanWriter, exclude_management_flag: bool = False,
+                          cache: Optional[ExtractionCache] = None, shard: Optional[ShardSpec] = None) -> Dict[str, int]:
+        """
+        Stream the migration plan for a directory without writing to the file system.
+        
+        Args:
+            input_dir: Input directory path
+            user_mapping: Dictionary mapping full names to user IDs
+            category_mapping: Dictionary mapping category names to category IDs
+            writer: PlanWriter receiving each entry as it is computed
+            exclude_management_flag: Whether to exclude the management flag from filenames
+            cache: Optional extraction cache reused across runs
+            shard: Optional shard; only files belonging to it are planned
+            
+        Returns:
+            Dict of counters: total, errors, warnings, collisions
+        """
+        counts = {'total': 0, 'errors': 0, 'warnings': 0, 'collisions': 0}
+        if not Path(input_dir).exists():
+            counts['errors'] += 1
+            self.logger.error(f"Input directory not found: {input_dir}")
+            return counts
+        
+        collisions = CollisionTracker()
+        for entry in self.plan_directory(input_dir, user_mapping, category_mapping, exclude_management_flag,
+                                         cache, collisions, shard):
+            writer.write(entry)
+            counts['total'] += 1
+            counts['errors'] += 1 if entry.error else 0
+            counts['warnings'] += len(entry.warnings)
+        counts['collisions'] = collisions.collisions
+        return counts
     
-    def process_test_files(self, duplicate: bool = False, person_filter: Optional[str] = None, test_name: str = "basic", exclude_management_flag: bool = False) -> List[Dict]:
+    def process_test_files(self, duplicate: bool = False, person_filter: Optional[str] = None, test_name: str = "basic", exclude_management_flag: bool = False) -> Iterator[FileResult]:
         """
         Process files using the tests/test-files structure with multi-level support.
         Args:
             duplicate: If True, duplicate (copy) the file before renaming; if False, move/rename the original.
             person_filter: If specified, only process files for this person
             test_name: Name of the test (determines input directory: from-<test_name> and output directory: to-<test_name>)
-        Returns:
-            List of processing results
+        Yields:
+            FileResult for each processed file
         """
         import shutil
         import os
-        results = []
         test_files_dir = Path(__file__).parent / 'tests' / 'test-files'
         from_dir = test_files_dir / f'from-{test_name}'
         to_dir = test_files_dir / f'to-{test_name}'
         if not from_dir.exists():
-            results.append({'error': f"Test files directory not found: {from_dir}"})
-            return results
+            yield FileResult('', error=f"Test files directory not found: {from_dir}")
+            return
         person_dirs = [d for d in from_dir.iterdir() if d.is_dir()]
         if person_filter:
             person_dirs = [d for d in person_dirs if person_filter.lower() in d.name.lower()]
+        
+        # Resolve every person's output folder up front so they are created once, in sorted order
+        from core.utils.user_mapping import extract_user_from_path
+        person_outputs = []
         for person_dir in person_dirs:
+            user_result = extract_user_from_path(person_dir.name)
+            user_parts = user_result.split('|')
+            cleaned_person_name = user_parts[2] if len(user_parts) > 2 else person_dir.name
+            person_outputs.append((person_dir, self.name_builder.folder_name(cleaned_person_name)))
+        directories = DestinationDirectoryManager(to_dir)
+        directories.prepare(to_dir / cleaned for _, cleaned in person_outputs)
+        
+        for person_dir, cleaned_person_name in person_outputs:
             person_name = person_dir.name
             self.logger.info(f"Processing person: {person_name}")
-            
-            # Get cleaned person name for output directory
-            from core.utils.user_mapping import extract_user_from_path
-            user_result = extract_user_from_path(person_name)
-            user_parts = user_result.split('|')
-            cleaned_person_name = user_parts[2] if len(user_parts) > 2 else person_name
-            
             output_person_dir = to_dir / cleaned_person_name
-            output_person_dir.mkdir(parents=True, exist_ok=True)
             
-            # Process all files in the person directory
-            for filepath in person_dir.rglob('*'):
-                if filepath.is_file():
-                    # Get relative path from person directory
-                    relative_path = filepath.relative_to(person_dir)
-                    full_relative_path = f"{person_name}/{relative_path}"
+            # Process all files in the person directory (ignore rules and max_depth
+            # apply relative to the input directory, as in a real run)
+            skip_other_people = lambda path: len(path.parts) == 1 and path.name != person_name
+            for filepath, full_relative_path, orig_stat in self.directory_processor.walk_entries(from_dir, skip_other_people):
+                if full_relative_path.parts[0] != person_name:
+                    continue
+                relative_path = full_relative_path.relative_to(person_name)
+                
+                try:
+                    # Extract person name and management status from the original path
+                    person_directory = person_name
+                    
+                    # Use the user_mapping function to get cleaned name and management status
+                    from core.utils.user_mapping import extract_user_from_path
+                    user_result = extract_user_from_path(str(full_relative_path))
+                    user_parts = user_result.split('|')
+                    cleaned_person_name = self.name_builder.folder_name(user_parts[2] if len(user_parts) > 2 else person_directory)
+                    is_management_folder = user_parts[5] == 'True' if len(user_parts) > 5 else False
+                    
+                    # Use the real normalize_filename function
+                    warnings = []
+                    normalized_filename = normalize_filename(str(full_relative_path), full_file_path=str(filepath), is_management_folder=is_management_folder, exclude_management_flag=exclude_management_flag, file_stat=orig_stat, folder_date_matches=self.directory_processor.folder_date_matches, name_builder=self.name_builder, warnings=warnings, folder_context=self.directory_processor.folder_context(full_relative_path.parent))
+                    for warning in warnings:
+                        self.logger.warning(f"{full_relative_path}: {warning}")
                     
                     try:
-                        # Extract person name and management status from the original path
-                        person_directory = person_name
-                        
-                        # Use the user_mapping function to get cleaned name and management status
-                        from core.utils.user_mapping import extract_user_from_path
-                        user_result = extract_user_from_path(str(full_relative_path))
-                        user_parts = user_result.split('|')
-                        cleaned_person_name = user_parts[2] if len(user_parts) > 2 else person_directory
-                        is_management_folder = user_parts[5] == 'True' if len(user_parts) > 5 else False
-                        
-                        # Use the real normalize_filename function
-                        normalized_filename = normalize_filename(str(full_relative_path), is_management_folder=is_management_folder, exclude_management_flag=exclude_management_flag)
-                        
-                        result = {
-                            'person': cleaned_person_name,
-                            'original_filename': str(relative_path),
-                            'new_filename': normalized_filename,
-                            'success': True,
-                            'test_name': test_name
-                        }
-                        
-                        try:
-                            new_filepath = output_person_dir / normalized_filename
-                            orig_stat = filepath.stat()
-                            orig_mtime = orig_stat.st_mtime
-                            orig_atime = orig_stat.st_atime
-                            if duplicate:
-                                shutil.copy2(filepath, new_filepath)
-                                result['copied'] = True
+                        new_filepath = output_person_dir / normalized_filename
+                        orig_mtime = orig_stat.st_mtime
+                        orig_atime = orig_stat.st_atime
+                        if duplicate:
+                            shutil.copy2(filepath, new_filepath)
+                            action = 'copied'
+                            if self.log_files:
                                 self.logger.info(f"Copied: {person_name}/{relative_path} -> {test_name}/{cleaned_person_name}/{normalized_filename}")
-                            else:
-                                filepath.rename(new_filepath)
-                                result['moved'] = True
+                        else:
+                            filepath.rename(new_filepath)
+                            action = 'moved'
+                            if self.log_files:
                                 self.logger.info(f"Moved: {person_name}/{relative_path} -> {test_name}/{cleaned_person_name}/{normalized_filename}")
-                            # Restore original times on the new file
-                            os.utime(new_filepath, (orig_atime, orig_mtime))
-                        except Exception as e:
-                            result['error'] = f"Failed to process {relative_path}: {e}"
-                            result['success'] = False
-                            self.logger.error(result['error'])
-                        
-                        results.append(result)
-                        
+                        # Restore original times on the new file
+                        os.utime(new_filepath, (orig_atime, orig_mtime))
                     except Exception as e:
-                        result = {
-                            'person': cleaned_person_name,
-                            'original_filename': str(relative_path),
-                            'error': f"Failed to normalize filename: {e}",
-                            'success': False,
-                            'test_name': test_name
-                        }
-                        results.append(result)
-                        self.logger.error(f"Error processing {relative_path}: {e}")
-        
-        return results
-    
-    def print_summary(self, results: List[Dict]):
-        """Print a summary of processing results."""
-        total = len(results)
-        successful = sum(1 for r in results if r.get('success', False))
-        errors = sum(1 for r in results if 'error' in r)
-        
-        print(f"\n=== Processing Summary ===")
-        print(f"Total files: {total}")
-        print(f"Successful: {successful}")
-        print(f"Errors: {errors}")
-        
-        if errors > 0:
-            print(f"\n=== Errors ===")
-            for result in results:
-                if 'error' in result:
-                    print(f"- {result['error']}")
-        
-        # Show person breakdown for test mode
-        if any('person' in result for result in results):
-            print(f"\n=== Person Breakdown ===")
-            person_counts = {}
-            test_names = set()
-            for result in results:
-                if 'person' in result:
-                    person = result['person']
-                    person_counts[person] = person_counts.get(person, 0) + 1
-                    if 'test_name' in result:
-                        test_names.add(result['test_name'])
-            
-            for person, count in person_counts.items():
-                print(f"{person}: {count} files")
-            
-            if test_names:
-                print(f"\nTest output directories: {', '.join(f'to-{name}' for name in test_names)}")
+                        error = f"Failed to process {relative_path}: {e}"
+                        self.logger.error(error)
+                        yield FileResult(str(relative_path), normalized_filename, cleaned_person_name,
+                                         error=error, test_name=test_name)
+                        continue
+                    
+                except Exception as e:
+                    self.logger.error(f"Error processing {relative_path}: {e}")
+                    yield FileResult(str(relative_path), person=cleaned_person_name,
+                                     error=f"Failed to normalize filename: {e}", test_name=test_name)
+                    continue
+                
+                yield FileResult(str(relative_path), normalized_filename, cleaned_person_name, True, action,
+                                 test_name=test_name, size=orig_stat.st_size)
+    
+    def print_summary(self, results: Iterable[FileResult]):
+        """
+        Print a summary of processing results.
+        
+        Args:
+            results: Iterable of results, consumed once
+        """
+        ResultAggregator.from_config(self.config).consume(results).print_summary()
 
 
-def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, category_mapping: Dict[str, str] = None, full_file_path: str = None, is_management_folder: bool = False, exclude_management_flag: bool = False) -> str:
+def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, category_mapping: Dict[str, str] = None, full_file_path: str = None, is_management_folder: bool = False, exclude_management_flag: bool = False, document_reader: Optional[DocumentDateReader] = None, file_stat: Optional[os.stat_result] = None, folder_date_matches: Optional[Callable[[str], str]] = None, name_builder: Optional[OutputNameBuilder] = None, warnings: Optional[List[str]] = None, folder_context: Optional[Dict] = None) -> str:
     """
     Normalize a filename from a full path using existing core functions.
     This is the main function for real-world applications.
@@ -369,6 +564,17 @@ def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, cate
         full_path: Full path to the file (e.g., "John Doe/report.pdf" or "VC - John Doe/document.pdf")
         user_mapping: Dictionary mapping full names to user IDs (optional)
         category_mapping: Dictionary mapping category names to category IDs (optional)
+        document_reader: Reader for dates embedded in documents (optional)
+        file_stat: Stat result captured by the walker; when given, every
+            date_priority_order source is honoured without further syscalls (optional)
+        folder_date_matches: Memoized date extraction for folder names, shared
+            by every file of a directory (optional)
+        name_builder: Builder sanitizing the name and enforcing the output length
+            limits; names that are too long get a shortened remainder (default:
+            built from the configuration)
+        warnings: List receiving truncation and over-limit messages (optional)
+        folder_context: DirectoryProcessor.folder_context of the file's directory;
+            the category is taken from it instead of a per-file extraction (optional)
         
     Returns:
         Normalized filename string
@@ -379,6 +585,9 @@ def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, cate
     import subprocess
     import os
     
+    # Per-stage latency for the run metrics
+    timer = METRICS.timer()
+    
     # Parse the path
     path_obj = Path(full_path)
     path_parts = path_obj.parts
@@ -422,8 +631,17 @@ def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, cate
         if file_extension and raw_remainder.endswith(file_extension):
             raw_remainder = raw_remainder[:-len(file_extension)]
     
+    timer.lap('user')
+    
     # STEP 2: Extract category using existing category_processor function
-    if raw_remainder:
+    if raw_remainder and folder_context is not None:
+        # Category of the first folder below the person, resolved once per directory
+        extracted_category = folder_context['category'] if len(path_parts) > 2 else ""
+        # As the category extractor: the path below the category folder, or the full path
+        raw_remainder = os.path.join(*path_parts[2:]) if extracted_category else full_path
+        if file_extension and raw_remainder.endswith(file_extension):
+            raw_remainder = raw_remainder[:-len(file_extension)]
+    elif raw_remainder:
         # Use the existing category_processor function
         project_root = Path(__file__).parent
         try:
@@ -442,17 +660,19 @@ def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, cate
             if file_extension and raw_remainder.endswith(file_extension):
                 raw_remainder = raw_remainder[:-len(file_extension)]
         except Exception:
+            METRICS.errors.inc(stage='category')
             extracted_category = ""
+    timer.lap('category')
     
     # STEP 3: Extract date from remainder using existing date_matcher function (BEFORE name extraction)
     extracted_date = ""
     if raw_remainder:
         # Prefer the single-date API that respects date_priority_order and exclusions
         from core.utils.date_matcher import extract_date_from_remainder
-        date_result = extract_date_from_remainder(raw_remainder)
+        date_result = extract_date_from_remainder(raw_remainder, file_stat, full_file_path, document_reader, folder_date_matches)
         date_parts = date_result.split('|')
         # date_parts: extracted_date|raw_remainder|cleaned_remainder|matched
-        if date_parts[0]:  # If date found
+        if date_parts[0]:  # If date found (from the path or, with file_stat, from metadata)
             extracted_date = date_parts[0]
             # Update remainder to remove the date (use raw remainder without the extracted date)
             if len(date_parts) > 1:
@@ -460,20 +680,22 @@ def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, cate
                 # Remove file extension from raw_remainder if it's still there
                 if file_extension and raw_remainder.endswith(file_extension):
                     raw_remainder = raw_remainder[:-len(file_extension)]
-        else:
-            # No date found in filename, try file metadata if we have the full path
+        elif file_stat is None:
+            # No date found in filename and no walker stat, try file metadata if we have the full path
             from core.utils.date_matcher import extract_date_with_metadata_fallback
             # Use the original filename (before name extraction) for metadata fallback
             original_filename = path_obj.name
             # Use full_file_path if provided, otherwise use full_path (which might be relative)
             file_path_for_metadata = full_file_path if full_file_path else full_path
-            metadata_result = extract_date_with_metadata_fallback(original_filename, file_path_for_metadata)
+            metadata_result = extract_date_with_metadata_fallback(original_filename, file_path_for_metadata, document_reader)
             metadata_parts = metadata_result.split('|')
             if metadata_parts[0]:  # If metadata date found
                 extracted_date = metadata_parts[0]
                 # Keep the original remainder since metadata date doesn't change the filename
                 # raw_remainder stays the same
     
+    timer.lap('date')
+    
     # STEP 4: Extract name from remainder using existing name_matcher function (AFTER date extraction)
     if raw_remainder and cleaned_name:
         from core.utils.name_matcher import extract_name_from_filename
@@ -488,11 +710,13 @@ def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, cate
             if file_extension and raw_remainder.endswith(file_extension):
                 raw_remainder = raw_remainder[:-len(file_extension)]
     
+    timer.lap('name')
+    
     # STEP 5: Clean the final remainder using existing name_matcher function
     cleaned_remainder = clean_filename_remainder_py(raw_remainder) if raw_remainder else ""
     
-    # Determine management flag based on configuration
-    config = load_config()
+    # Determine management flag based on configuration (parsed once per run)
+    config = get_config()
     management_flag = ""
     if is_management_folder:
         management_config = config.get('ManagementFlag', {})
@@ -503,20 +727,29 @@ def normalize_filename(full_path: str, user_mapping: Dict[str, str] = None, cate
         if management_config.get('enabled', True):
             management_flag = management_config.get('yes_flag', '_yes')
     
-    # Format the final filename using existing format_filename function
-    formatted = format_filename(
-        user_id=user_id,
-        name=cleaned_name,
-        remainder=cleaned_remainder,
-        date=extracted_date,
-        category=extracted_category,
-        management_flag=management_flag,
-        exclude_management_flag=exclude_management_flag
-    )
+    # Sanitize for the target file system and format within the output
+    # length limits (the extension is never shortened); every caller, including
+    # --extract-filename, gets the name a real run writes
+    name_builder = name_builder or get_name_builder()
+    built = name_builder.build({
+        'id': user_id,
+        'name': cleaned_name,
+        'remainder': cleaned_remainder,
+        'date': extracted_date,
+        'category': extracted_category,
+        'management': "" if exclude_management_flag else management_flag
+    }, file_extension, name_builder.folder_name(cleaned_name or (path_parts[0] if path_parts else "")))
+    formatted = built.filename
+    if built.truncated:
+        METRICS.truncated.inc()
+    if warnings is not None:
+        warnings.extend(built.warnings)
+    timer.lap('format')
     
-    # Add the file extension
-    if file_extension:
-        formatted += file_extension
+    if not user_id:
+        METRICS.unmapped.inc(kind='person')
+    if not extracted_category:
+        METRICS.unmapped.inc(kind='category')
     
     return formatted
 
@@ -537,51 +770,77 @@ def format_filename(user_id: str = "", name: str = "", remainder: str = "", date
     Returns:
         Formatted filename string
     """
-    config = load_config()
-    global_config = config.get('Global', {})
-    component_order = global_config.get('component_order', ['id', 'name', 'remainder', 'date', 'category', 'management'])
-    component_separator = global_config.get('component_separator', '_')
-    
-    # Build filename using component order
-    filename_parts = []
-    for component in component_order:
-        if component == 'id':
-            value = user_id
-        elif component == 'name':
-            value = name
-        elif component == 'remainder':
-            value = remainder
-        elif component == 'date':
-            value = date
-        elif component == 'category':
-            value = category
-        elif component == 'management':
-            # Skip management component if exclude_management_flag is True
-            if exclude_management_flag:
-                continue
-            value = management_flag
-        else:
-            value = ""
-        
-        # Only add non-empty components
-        if value:
-            filename_parts.append(value)
+    if exclude_management_flag:
+        management_flag = ""
+    # Same sanitizing and length limits as the names a run writes
+    return get_name_builder().build({
+        'id': user_id,
+        'name': name,
+        'remainder': remainder,
+        'date': date,
+        'category': category,
+        'management': management_flag
+    }).filename
+
+
+def get_filename_formatter() -> FilenameFormatter:
+    """
+    Filename formatter of the current configuration, compiled once per config file version.
     
-    # Join with component separator
-    formatted = component_separator.join(filename_parts)
+    Returns:
+        FilenameFormatter built from the Global component settings
+    """
+    cached = _cached_config()
+    if 'formatter' not in cached:
+        cached['formatter'] = FilenameFormatter(cached['config'])
+    return cached['formatter']
+
+
+def get_name_builder() -> OutputNameBuilder:
+    """
+    Output name builder of the current configuration, built once per config file version.
     
-    # Clean up any duplicate separators
-    import re
-    formatted = re.sub(f'{re.escape(component_separator)}+', component_separator, formatted)
-    formatted = formatted.strip(component_separator)
+    Returns:
+        OutputNameBuilder built from the Global, OutputLimits and FilenameSanitizer settings
+    """
+    cached = _cached_config()
+    if 'builder' not in cached:
+        cached['builder'] = OutputNameBuilder(cached['config'])
+    return cached['builder']
+
+
+def get_config() -> Dict:
+    """
+    Configuration parsed once per config file version (shared; do not modify).
     
-    return formatted
+    Returns:
+        Configuration dictionary
+    """
+    return _cached_config()['config']
+
+
+def _cached_config() -> Dict:
+    """Cache entry of the current config file version."""
+    config_path = get_config_path()
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    stamp = (str(config_path), mtime_ns)
+    if stamp not in _CONFIG_CACHE:
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[stamp] = {'config': load_config()}
+    return _CONFIG_CACHE[stamp]
+
+
+def get_config_path() -> Path:
+    """Configuration file in use: $VC_CONFIG_FILE, then config/components.yaml."""
+    return Path(os.environ.get('VC_CONFIG_FILE') or Path(__file__).parent / 'config' / 'components.yaml')
 
 
 def load_config() -> Dict:
-    """Load configuration from components.yaml."""
-    config_path = Path(__file__).parent / 'config' / 'components.yaml'
-    with open(config_path, 'r') as f:
+    """Load configuration from components.yaml (or $VC_CONFIG_FILE)."""
+    with open(get_config_path(), 'r') as f:
         return yaml.safe_load(f)
 
 
@@ -591,6 +850,12 @@ def main():
         description="VisualCare File Migration Renamer - Process and normalize files in directories"
     )
     
+    parser.add_argument(
+        '--config', '-c',
+        metavar='FILE',
+        help='Configuration file (default: $VC_CONFIG_FILE, then config/components.yaml)'
+    )
+    
     # Core arguments for directory processing
     parser.add_argument(
         '--input-dir',
@@ -623,6 +888,122 @@ def main():
         action='store_true',
         help='Enable detailed logging'
     )
+    parser.add_argument(
+        '--log-files',
+        action='store_true',
+        help='Log every copied, moved or skipped file at INFO (implied by --verbose)'
+    )
+    parser.add_argument(
+        '--progress',
+        action='store_true',
+        help='Show a live progress line with throughput and ETA on stderr'
+    )
+    parser.add_argument(
+        '--status-file',
+        metavar='FILE',
+        help='Append periodic JSON status lines to FILE for monitoring'
+    )
+    parser.add_argument(
+        '--metrics-textfile',
+        metavar='FILE',
+        help='Write Prometheus metrics to FILE (textfile collector), refreshed every Metrics.textfile_interval seconds'
+    )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        metavar='PORT',
+        help='Serve Prometheus metrics on http://127.0.0.1:PORT/metrics during the run'
+    )
+    parser.add_argument(
+        '--shard',
+        metavar='I/N',
+        help='Process only shard I of N (e.g. 2/4) so several hosts can split one migration'
+    )
+    parser.add_argument(
+        '--shard-by',
+        choices=list(SHARD_MODES),
+        help='Shard by person directory or by path hash (default: Sharding.mode, normally person)'
+    )
+    parser.add_argument(
+        '--journal-dir',
+        metavar='DIR',
+        help='Shared directory for per-shard journals (default: Sharding.journal_dir)'
+    )
+    parser.add_argument(
+        '--reconcile',
+        metavar='DIR',
+        help='Merge the shard journals in DIR into one summary and report cross-shard collisions'
+    )
+    parser.add_argument(
+        '--shard-count',
+        type=int,
+        metavar='N',
+        help='Shard count of the run to reconcile; other journals in DIR are ignored (default: the only count found)'
+    )
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='PATH',
+        help='Reuse extraction results across runs via an SQLite cache (default path from ExtractionCache.path)'
+    )
+    parser.add_argument(
+        '--backend',
+        choices=['serial', 'async'],
+        help='Execution backend for file operations (default: Execution.backend, normally serial)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Process person/category work units in parallel, largest first (default: Execution.workers)'
+    )
+    parser.add_argument(
+        '--max-files-per-second',
+        type=float,
+        help='Limit transfers to this many files per second (default: Throttle.files_per_second)'
+    )
+    parser.add_argument(
+        '--max-mb-per-second',
+        type=float,
+        help='Limit transfer bandwidth in MB per second (default: Throttle.mb_per_second)'
+    )
+    parser.add_argument(
+        '--adaptive-concurrency',
+        action='store_true',
+        help='Reduce concurrent transfers when transfer latency rises (async backend)'
+    )
+    parser.add_argument(
+        '--throttle-control',
+        metavar='FILE',
+        help='YAML file with files_per_second/mb_per_second/max_concurrency, re-read when changed or on SIGHUP'
+    )
+    parser.add_argument(
+        '--results-file',
+        metavar='FILE',
+        help='Write the full per-file results to FILE as JSONL while processing'
+    )
+    parser.add_argument(
+        '--dry-run', '-d',
+        action='store_true',
+        help='Preview the planned renames without creating or moving any files'
+    )
+    parser.add_argument(
+        '--dry-run-format',
+        choices=['table', 'jsonl'],
+        default='table',
+        help='Output format for --dry-run (default: table)'
+    )
+    parser.add_argument(
+        '--dry-run-output',
+        metavar='FILE',
+        help='Write the --dry-run plan to FILE instead of stdout'
+    )
+    parser.add_argument(
+        '--audit-misfiled',
+        metavar='FILE',
+        help='Write a CSV of files naming a different registered person than their person folder'
+    )
     
     # Test mode arguments
     parser.add_argument(
@@ -648,10 +1029,19 @@ def main():
     
     args = parser.parse_args()
     
+    if args.config:
+        if not Path(args.config).is_file():
+            print(f"Error: Configuration file not found: {args.config}")
+            sys.exit(1)
+        # Every loader (including extraction subprocesses) reads the same file
+        os.environ['VC_CONFIG_FILE'] = str(Path(args.config).resolve())
+    
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
     renamer = FileMigrationRenamer()
+    if args.verbose or args.log_files:
+        renamer.log_files = True
     
     # Handle single file extraction for testing
     if args.extract_filename:
@@ -688,14 +1078,44 @@ def main():
             print(f"Error extracting filename: {e}")
             sys.exit(1)
     
+    if args.reconcile:
+        try:
+            report = reconcile(args.reconcile, renamer.config, args.shard_count)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        report.print_report()
+        sys.exit(0 if report.ok else 1)
+    
+    # Resolve the shard this host executes
+    shard = None
+    sharding_config = renamer.config.get('Sharding', {})
+    if args.shard:
+        try:
+            shard = ShardSpec.parse(args.shard, args.shard_by or sharding_config.get('mode', 'person'))
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    
+    # Parallel work units transfer on their worker threads; the async backend drives a single stream
+    execution_config = renamer.config.get('Execution', {})
+    if (args.workers or execution_config.get('workers', 1)) > 1 and \
+            (args.backend or execution_config.get('backend', 'serial')) == 'async':
+        print("Error: --backend async cannot be combined with more than one worker (--workers / Execution.workers)")
+        sys.exit(1)
+    
     if args.test_mode:
         print(f"Processing test files using tests/test-files structure")
         print(f"Test name: {args.test_name}")
         if args.person_filter:
             print(f"Filtering to person: {args.person_filter}")
-        results = renamer.process_test_files(duplicate=args.duplicate, person_filter=args.person_filter, test_name=args.test_name, exclude_management_flag=args.exclude_management_flag)
-        renamer.print_summary(results)
-    elif args.input_dir and args.output_dir:
+        summary = ResultAggregator.from_config(renamer.config, ResultSink(args.results_file) if args.results_file else None)
+        try:
+            summary.consume(renamer.process_test_files(duplicate=args.duplicate, person_filter=args.person_filter, test_name=args.test_name, exclude_management_flag=args.exclude_management_flag))
+        finally:
+            summary.close()
+        summary.print_summary()
+    elif args.input_dir and (args.output_dir or args.dry_run or args.audit_misfiled):
         # Load user mapping if provided
         user_mapping = {}
         if args.user_mapping:
@@ -730,11 +1150,106 @@ def main():
             # Expose the provided category mapping path to the category extractor via env var
             os.environ['VC_CATEGORY_MAPPING_FILE'] = args.category_mapping
         
+        # Flag files naming another registered person before anything is planned or moved
+        if args.audit_misfiled:
+            # Without mapping arguments, audit against the configured registries
+            audit_users = user_mapping or {full_name: user_id for user_id, full_name in load_user_mapping().items()}
+            audit_categories = category_mapping or CategoryProcessor(renamer.config).get_all_categories()
+            audit = MisfiledAudit(renamer.config, audit_users, audit_categories)
+            report = MisfiledReport(args.audit_misfiled)
+            try:
+                findings = audit.run(args.input_dir, report, *renamer.walk_filters(shard))
+            finally:
+                report.close()
+            print(f"Misfiled audit: {audit.files} files checked, {findings} conflicts -> {args.audit_misfiled}",
+                  file=sys.stderr)
+            if not (args.output_dir or args.dry_run):
+                sys.exit(0)
+        
+        # Open the extraction cache once all mapping overrides are in place
+        cache = None
+        if args.cache is not None or renamer.config.get('ExtractionCache', {}).get('enabled', False):
+            cache = ExtractionCache.from_config(
+                renamer.config,
+                renamer.config_path,
+                db_path=args.cache or None,
+                variant=f"exclude_management_flag={args.exclude_management_flag}"
+            )
+        
+        if args.dry_run:
+            # Status goes to stderr so the streamed plan stays machine readable
+            print(f"Dry run: planning {args.input_dir} (no files will be written)", file=sys.stderr)
+            output = open(args.dry_run_output, 'w', encoding='utf-8') if args.dry_run_output else sys.stdout
+            try:
+                writer = PlanWriter(output, args.dry_run_format)
+                counts = renamer.preview_directory(args.input_dir, user_mapping, category_mapping, writer, args.exclude_management_flag, cache=cache, shard=shard)
+            finally:
+                if output is not sys.stdout:
+                    output.close()
+                if cache:
+                    cache.close()
+            print(f"Planned: {counts['total']}, errors: {counts['errors']}, "
+                  f"collisions: {counts['collisions']}, warnings: {counts['warnings']}", file=sys.stderr)
+            sys.exit(1 if counts['errors'] else 0)
+        
+        # Apply command line throttling on top of the Throttle config section
+        throttle_config = dict(renamer.config.get('Throttle', {}))
+        if args.max_files_per_second is not None:
+            throttle_config['files_per_second'] = args.max_files_per_second
+        if args.max_mb_per_second is not None:
+            throttle_config['mb_per_second'] = args.max_mb_per_second
+        if args.adaptive_concurrency:
+            throttle_config['adaptive'] = True
+        if args.throttle_control:
+            throttle_config['control_file'] = args.throttle_control
+        throttle = Throttle({'Throttle': throttle_config})
+        if throttle.active:
+            # SIGHUP keeps its default action unless there is a control file to reload
+            if throttle.control_file:
+                throttle.install_signal_handler()
+        else:
+            throttle = None
+        
+        # Live progress line and/or JSON status lines for monitoring
+        progress = None
+        status_stream = open(args.status_file, 'a', encoding='utf-8') if args.status_file else None
+        if args.progress or status_stream or renamer.config.get('Progress', {}).get('enabled', False):
+            show_progress = args.progress or renamer.config.get('Progress', {}).get('enabled', False)
+            progress = ProgressReporter(renamer.config, sys.stderr if show_progress else None, status_stream)
+        
+        exporters = start_exporters(renamer.config, args.metrics_textfile, args.metrics_port)
+        
         print(f"Processing directory: {args.input_dir} -> {args.output_dir}")
-        results = renamer.process_directory(args.input_dir, args.output_dir, user_mapping, category_mapping, args.duplicate, args.exclude_management_flag)
-        renamer.print_summary(results)
+        summary = ResultAggregator.from_config(renamer.config, ResultSink(args.results_file) if args.results_file else None)
+        journal = None
+        if shard:
+            journal_dir = args.journal_dir or sharding_config.get('journal_dir', '.vcmigrate/journals')
+            journal = ShardJournal(journal_dir, shard)
+            summary.add_sink(journal)
+            print(f"Shard {shard.label} (by {shard.mode}), journal: {journal_dir}")
+        try:
+            for result in renamer.process_directory(args.input_dir, args.output_dir, user_mapping, category_mapping, args.duplicate, args.exclude_management_flag, cache=cache, backend=args.backend, throttle=throttle, shard=shard, workers=args.workers, progress=progress):
+                summary.add(result)
+                if progress:
+                    progress.update(result)
+            # Mark the shard complete only when the run was not interrupted
+            if journal:
+                journal.finish()
+        finally:
+            if progress:
+                progress.close()
+            if status_stream:
+                status_stream.close()
+            summary.close()
+            if cache:
+                cache.close()
+            for exporter in exporters:
+                exporter.close()
+        summary.print_summary()
+        if cache:
+            print(f"Extraction cache: {cache.hits} hits, {cache.misses} misses")
     else:
-        print("Error: Must specify either --test-mode or both --input-dir and --output-dir")
+        print("Error: Must specify either --test-mode, both --input-dir and --output-dir, or --input-dir with --dry-run or --audit-misfiled")
         parser.print_help()
         sys.exit(1)
     
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""
+Filename Validation Plugin.
+
+Checks every planned output filename before anything is written and attaches
+a warning to plan entries whose name the destination would reject or that
+look malformed. Replaces the former per-file pre-process shell hook; one call
+validates a whole batch of plan entries.
+
+File Path: plugins/validate_filenames.py
+
+@package VisualCare\\FileMigration\\Plugins
+@since   1.0.0
+
+Checks:
+- Empty filename
+- Over the output limits, as defined by OutputNameBuilder.check (characters
+  and UTF-8 bytes per name, destination path length); problems the builder
+  already reported while planning are not repeated
+- Invalid characters (< > : " / \\ | ? *)
+- Leading or trailing whitespace
+- Consecutive whitespace
+"""
+
+import re
+from typing import List, Optional
+
+from core.utils.name_limits import OutputNameBuilder
+
+
+_PROBLEMS = (
+    ('invalid', "contains invalid characters"),
+    ('edge', "has leading or trailing spaces"),
+    ('double', "contains consecutive spaces"),
+)
+
+_CHECK = re.compile(r'(?P<invalid>[<>:"/\\|?*])|(?P<edge>^\s|\s$)|(?P<double>\s{2,})')
+
+
+def validate_filenames(filenames: List[str], limits: OutputNameBuilder,
+                       folders: Optional[List[str]] = None) -> List[List[str]]:
+    """
+    Validate a batch of filenames.
+
+    Args:
+        filenames: Filenames (no directories).
+        limits: Builder whose check() defines the output limits.
+        folders: Person folder of each filename (for the path length limit).
+
+    Returns:
+        List[List[str]]: Problems found, one list per filename (empty when valid).
+    """
+    results = []
+    for position, filename in enumerate(filenames):
+        if not filename:
+            results.append(["empty filename"])
+            continue
+        problems = [f"exceeds the output limits ({problem})"
+                    for problem in limits.check(folders[position] if folders else '', filename)]
+        found = {match.lastgroup for match in _CHECK.finditer(filename)}
+        problems.extend(message for group, message in _PROBLEMS if group in found)
+        results.append(problems)
+    return results
+
+
+def register(manager):
+    """
+    Register the post_extract validation hook.
+
+    Args:
+        manager: PluginManager loading this plugin.
+    """
+    limits = OutputNameBuilder(manager.config)
+
+    def post_extract(entries):
+        planned = [entry for entry in entries if not entry.error]
+        problems = validate_filenames([entry.new_filename for entry in planned], limits,
+                                      [entry.person for entry in planned])
+        checked = []
+        found = iter(problems)
+        for entry in entries:
+            if not entry.error:
+                reported = {warning[len("Over limit: "):] for warning in entry.warnings
+                            if warning.startswith("Over limit: ")}
+                messages = [message for message in next(found)
+                            if not any(problem in message for problem in reported)]
+                if messages:
+                    entry = entry._replace(warnings=entry.warnings + tuple(
+                        f"Invalid filename: '{entry.new_filename}' {message}" for message in messages))
+            checked.append(entry)
+        return checked
+
+    manager.register('post_extract', post_extract)
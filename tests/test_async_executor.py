@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+"""
+Async Execution Backend Tests.
+
+File Path: tests/test_async_executor.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Every planned entry is transferred exactly once
+- Per-destination in-flight limit is respected
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.async_executor import AsyncTransferExecutor
+from core.utils.migration_plan import PlanEntry
+from core.utils.results import FileResult
+
+
+def test_transfers_overlap_within_limits():
+    entries = [
+        PlanEntry(Path(f'/in/{person}/file{i}.pdf'), f'{person}/file{i}.pdf', person, f'file{i}.pdf')
+        for person in ('John Doe', 'Jane Smith') for i in range(10)
+    ]
+    lock = threading.Lock()
+    active = {'John Doe': 0, 'Jane Smith': 0}
+    peak = {'John Doe': 0, 'Jane Smith': 0}
+
+    def transfer(entry):
+        with lock:
+            active[entry.person] += 1
+            peak[entry.person] = max(peak[entry.person], active[entry.person])
+        time.sleep(0.01)
+        with lock:
+            active[entry.person] -= 1
+        return FileResult(entry.relative_path, entry.new_filename, entry.person, True, 'copied')
+
+    executor = AsyncTransferExecutor({'Execution': {'max_workers': 8, 'per_destination_limit': 2}})
+    results = list(executor.run(iter(entries), transfer))
+
+    assert sorted(r.original_filename for r in results) == sorted(e.relative_path for e in entries)
+    assert all(r.success for r in results)
+    assert max(peak.values()) <= 2
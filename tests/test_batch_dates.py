@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+"""
+Batch Date Extraction Tests.
+
+File Path: tests/test_batch_dates.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Batch results match extract_date_matches row for row
+- Impossible dates are rejected and the matched mask reflects it
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.batch_dates import BatchDateExtractor, extract_date_matches_batch
+from core.utils.date_matcher import extract_date_matches
+
+
+SAMPLE = [
+    "Report 2024-03-05.pdf",
+    "Medical_20230515_scan.pdf",
+    "15th Mar 2023 letter.docx",
+    "May 15, 2023 review",
+    "29.02.24 induction",
+    "31-02-2024 invoice",
+    "exp 2023-05-15 licence",
+    "2023-01-01 to 2023-12-31 plan",
+    "2023-05-15 and 2024-01-01",
+    "no date here.txt",
+]
+
+
+def test_batch_matches_scalar():
+    assert extract_date_matches_batch(SAMPLE) == [extract_date_matches(name) for name in SAMPLE]
+
+
+def test_invalid_dates_rejected():
+    result = BatchDateExtractor().extract(["31-02-2024 invoice", "29.02.23 x", "Report 2024-03-05.pdf"])
+    assert list(result.matched) == [False, False, True]
+    assert result.dates == ["", "", "20240305"]
+    assert result.remainders[0] == "31-02-2024 invoice"
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+"""
+Destination Directory Manager Tests.
+
+File Path: tests/test_destination_dirs.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Directories are created once and existing ones are never recreated
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.destination_dirs import DestinationDirectoryManager
+
+
+def test_directories_created_once(tmp_path):
+    output = tmp_path / 'out'
+    (output / 'Jane Smith').mkdir(parents=True)
+
+    directories = DestinationDirectoryManager(output)
+    directories.scan()
+    created_by_scan = directories.created
+
+    directories.prepare([output / 'John Doe', output / 'Jane Smith', output / 'John Doe'])
+    directories.ensure(output / 'John Doe')
+    directories.ensure(output / 'Jane Smith')
+
+    assert (output / 'John Doe').is_dir()
+    assert directories.created - created_by_scan == 1
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""
+Directory Processor Date Folder Tests.
+
+File Path: tests/test_directory_processor.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Year and full date folders are classified and parsed as before
+- Classification is memoized per folder name
+- The walk applies ignore rules and max_depth and shares folder context per directory
+- The folder context carries the category of the first folder below the person,
+  matching the per-file category extraction
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.directory_processor import DirectoryProcessor
+from main import normalize_filename
+
+
+def test_classification():
+    processor = DirectoryProcessor({})
+    assert processor.is_year_folder('2023')
+    assert not processor.is_year_folder('WHS')
+    assert processor.is_full_date_folder('01.06.2023')
+    assert processor.parse_date_from_folder('01.06.2023') == datetime(2023, 6, 1)
+    assert processor.parse_date_from_folder('2023.07.25') == datetime(2023, 7, 25)
+    assert processor.parse_date_from_folder('2023') == datetime(2023, 1, 1)
+    assert processor.parse_date_from_folder('31.02.2023') is None
+    assert not DirectoryProcessor({'DateFolderHandling': {'enabled': False}}).is_year_folder('2023')
+
+
+def test_classification_is_memoized():
+    processor = DirectoryProcessor({})
+    first = processor.classify_folder('01.06.2023')
+    assert processor.classify_folder('01.06.2023') is first
+    assert processor.process_folder_remainder('John Doe/2023/01.06.2023/Incidents', 'John Doe') == '2023 Incidents'
+
+
+def test_walk_shares_folder_context(tmp_path):
+    for relative in ("John Doe/2023/01.06.2023/a.pdf", "John Doe/2023/01.06.2023/b.pdf",
+                     "John Doe/.cache/c.pdf", "John Doe/2023/01.06.2023/deep/d.pdf"):
+        (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative).write_text('x')
+    processor = DirectoryProcessor({'DirectoryStructure': {'max_depth': 4}})
+    files = processor.get_files_recursive(tmp_path)
+    assert [info['relative_path'] for _, info in files] == ["John Doe/2023/01.06.2023/a.pdf",
+                                                          "John Doe/2023/01.06.2023/b.pdf"]
+    info = files[0][1]
+    assert info['full_path_string'] == "John Doe/2023/01.06.2023/a.pdf"
+    assert info['year_folders'] == ['2023'] and info['folder_date'] == datetime(2023, 6, 1)
+    assert processor.folder_context(Path("John Doe/2023/01.06.2023")) is processor.folder_context(Path("John Doe/2023/01.06.2023"))
+
+
+def test_folder_context_category():
+    config = {'Category': {'mapping_test_file': 'tests/fixtures/04_category_mapping.csv'}}
+    processor = DirectoryProcessor(config)
+    assert processor.folder_context(Path('John Doe/medical/2023'))['category'] == 'Medical'
+    assert processor.folder_context(Path('John Doe/support_plans'))['category_id'] == '4'
+    assert processor.folder_context(Path('John Doe/Holidays'))['category'] == ''
+    assert processor.folder_context(Path('John Doe'))['category'] == ''
+    for path in ('John Doe/WHS/2023/Incident report 01.06.2023.pdf', 'John Doe/Holidays/notes.pdf',
+                 'John Doe/notes 2023-05-01.pdf'):
+        context = processor.folder_context(Path(path).parent)
+        assert normalize_filename(path, folder_context=context) == normalize_filename(path)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+"""
+Document Metadata Date Tests.
+
+File Path: tests/test_document_dates.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- PDF Info dictionary creation dates
+- DOCX docProps/core.xml creation dates
+- JPEG EXIF DateTimeOriginal
+- Prefetched reads are released once their file is handled
+"""
+
+import struct
+import sys
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.document_dates import DocumentDateReader, read_document_date
+
+
+def test_pdf_creation_date(tmp_path):
+    pdf = tmp_path / 'plan.pdf'
+    pdf.write_bytes(b'%PDF-1.4\n' + b'0' * 200000 + b'\n<< /CreationDate (D:20230416101500+10\'00\') >>\n%%EOF')
+    assert read_document_date(str(pdf), 4096) == datetime(2023, 4, 16)
+
+
+def test_docx_core_properties(tmp_path):
+    docx = tmp_path / 'notes.docx'
+    with zipfile.ZipFile(docx, 'w') as archive:
+        archive.writestr('word/document.xml', '<w:document/>')
+        archive.writestr('docProps/core.xml',
+                         '<cp:coreProperties><dcterms:created xsi:type="dcterms:W3CDTF">'
+                         '2022-11-03T09:00:00Z</dcterms:created></cp:coreProperties>')
+    assert read_document_date(str(docx)) == datetime(2022, 11, 3)
+
+
+def test_jpeg_exif_date(tmp_path):
+    date = b'2021:07:25 14:30:00\x00'
+    # Little-endian TIFF: IFD0 with one ExifIFD pointer, Exif IFD with DateTimeOriginal
+    ifd0 = struct.pack('<H', 1) + struct.pack('<HHII', 0x8769, 4, 1, 26) + struct.pack('<I', 0)
+    exif_ifd = struct.pack('<H', 1) + struct.pack('<HHII', 0x9003, 2, len(date), 44) + struct.pack('<I', 0)
+    tiff = b'II' + struct.pack('<HI', 42, 8) + ifd0 + exif_ifd + date
+    app1 = b'Exif\x00\x00' + tiff
+    jpeg = b'\xff\xd8' + b'\xff\xe1' + struct.pack('>H', len(app1) + 2) + app1 + b'\xff\xda\x00\x02' + b'\xff\xd9'
+    image = tmp_path / 'photo.jpg'
+    image.write_bytes(jpeg)
+    assert read_document_date(str(image)) == datetime(2021, 7, 25)
+
+
+def test_unsupported_or_plain_files(tmp_path):
+    text = tmp_path / 'notes.pdf'
+    text.write_text('not really a pdf')
+    assert read_document_date(str(text)) is None
+    assert read_document_date(str(tmp_path / 'missing.docx')) is None
+
+
+def test_prefetch_releases_handled_files(tmp_path):
+    paths = []
+    for i in range(300):
+        pdf = tmp_path / f'2023-04-16 plan {i}.pdf'
+        pdf.write_bytes(b'%PDF-1.4\n<< /CreationDate (D:20230416) >>\n%%EOF')
+        paths.append(pdf)
+    reader = DocumentDateReader({'MetadataDates': {'prefetch_window': 16, 'max_workers': 2}})
+    try:
+        pending = []
+        for index, path in enumerate(reader.prefetch(paths)):
+            pending.append(len(reader._futures))
+            if index % 100 == 0:
+                assert reader.get(str(path)) == '2023-04-16'
+        assert max(pending) <= 16
+        assert reader._futures == {}
+    finally:
+        reader.close()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+"""
+Extraction Cache Tests.
+
+File Path: tests/test_extraction_cache.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Round trip of cached extraction results
+- Invalidation when the source file or fingerprint changes
+- Pruning of entries written under an old fingerprint
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.extraction_cache import ExtractionCache
+
+
+def test_round_trip_and_invalidation(tmp_path):
+    source = tmp_path / 'report.pdf'
+    source.write_text('v1')
+    stat = source.stat()
+
+    cache = ExtractionCache(str(tmp_path / 'cache.sqlite'), 'fp-1')
+    assert cache.get('John Doe/report.pdf', stat) is None
+    cache.put('John Doe/report.pdf', stat, {'person': 'John Doe', 'new_filename': '1001_John Doe_report.pdf'})
+    assert cache.get('John Doe/report.pdf', stat)['new_filename'] == '1001_John Doe_report.pdf'
+
+    # A modified source file is a miss even though the key matches
+    source.write_text('version two')
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get('John Doe/report.pdf', source.stat()) is None
+    cache.close()
+
+    # A new fingerprint (config or mapping change) never sees old entries
+    reopened = ExtractionCache(str(tmp_path / 'cache.sqlite'), 'fp-2')
+    assert reopened.get('John Doe/report.pdf', stat) is None
+    assert reopened.prune() == 1
+    reopened.close()
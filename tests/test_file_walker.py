@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+"""
+File Walker and Stat-Based Date Tests.
+
+File Path: tests/test_file_walker.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Walker yields files with relative paths and captured stat results
+- Remainder date extraction honours 'modified' from the walker stat
+"""
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.date_matcher import extract_date_from_remainder
+from core.utils.file_walker import walk_files
+
+
+def test_walk_files_yields_stat(tmp_path):
+    (tmp_path / 'John Doe' / 'WHS').mkdir(parents=True)
+    (tmp_path / 'John Doe' / 'WHS' / 'b.pdf').write_text('b')
+    (tmp_path / 'John Doe' / 'a.pdf').write_text('aa')
+
+    entries = list(walk_files(tmp_path))
+    assert [str(e.relative_path) for e in entries] == ['John Doe/a.pdf', 'John Doe/WHS/b.pdf']
+    assert entries[0].stat.st_size == 2
+
+
+def test_remainder_date_uses_walker_stat(tmp_path):
+    target = tmp_path / 'notes.pdf'
+    target.write_text('x')
+    modified = datetime(2022, 3, 4, 12, 0).timestamp()
+    os.utime(target, (modified, modified))
+
+    without_stat = extract_date_from_remainder('Incidents/notes').split('|')
+    with_stat = extract_date_from_remainder('Incidents/notes', target.stat()).split('|')
+
+    assert without_stat[0] == ''
+    assert with_stat[0] == '20220304'
+    assert with_stat[1] == 'Incidents/notes'
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Filename Formatter Tests.
+
+File Path: tests/test_filename_formatter.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Components join in the configured order, skipping empty ones
+- Separators at component edges and doubled separators are cleaned up
+- Templates compile to the same component order
+- Template formatters keep the template's separators and default order
+- Category placement uses the same separator handling
+- The configuration and formatter of format_filename are built once
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.category_processor import CategoryProcessor
+from core.utils import user_mapping
+from core.utils.filename_formatter import FilenameFormatter, template_order
+import main
+
+
+CONFIG = {'Global': {'component_order': ['id', 'name', 'remainder', 'date', 'category', 'management', 'unknown'],
+                     'component_separator': '_'}}
+
+
+def test_component_order():
+    formatter = FilenameFormatter(CONFIG)
+    components = {'id': '1001', 'name': 'John Doe', 'remainder': 'Report', 'date': '20230515', 'category': 'MED'}
+    assert formatter.format(components) == '1001_John Doe_Report_20230515_MED'
+    assert formatter.format(dict(components, remainder='', category='')) == '1001_John Doe_20230515'
+    assert FilenameFormatter(CONFIG, ['date', 'id']).format(components) == '20230515_1001'
+    assert formatter.format({}) == ''
+
+
+def test_separator_cleanup():
+    formatter = FilenameFormatter(CONFIG)
+    assert formatter.format({'id': '_1001_', 'name': 'John__Doe', 'remainder': '___', 'date': '2023'}) == \
+        '1001_John_Doe_2023'
+    assert formatter.join(['a_', '', '_b']) == 'a_b'
+    assert FilenameFormatter({'Global': {'component_separator': '-'}}).join(['a--', 'b']) == 'a-b'
+
+
+def test_template_order():
+    assert template_order('{id}_{name}_{remainder}_{date}') == ['id', 'name', 'remainder', 'date']
+    assert template_order('{date}-{management_flag}') == ['date', 'management']
+
+
+def test_template_separators(tmp_path, monkeypatch):
+    formatter = FilenameFormatter(CONFIG, template='{date}-{id} {name}_{remainder}')
+    assert formatter.format({'id': '1001', 'name': 'John Doe', 'date': '20230515', 'remainder': 'Report'}) == \
+        '20230515-1001 John Doe_Report'
+    assert formatter.format({'id': '1001', 'name': 'John Doe', 'date': '20230515'}) == '20230515-1001 John Doe'
+    assert FilenameFormatter(CONFIG, template='{id}__{management_flag}').format({'id': '1', 'management': 'M'}) == \
+        '1_M'
+
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text("Global:\n  component_order: [id, name, remainder, date, category, management]\n")
+    monkeypatch.setenv('VC_CONFIG_FILE', str(config_file))
+    assert user_mapping.format_filename_with_id('1001', 'John Doe', '20230515', 'Report', 'MED', '_yes') == \
+        '1001_John Doe_Report_20230515'
+    assert user_mapping._cached_config()['formatter'] is user_mapping._cached_config()['formatter']
+
+
+def test_category_placement():
+    processor = CategoryProcessor(dict(CONFIG, Category={'placement': 'suffix'}))
+    assert processor.format_filename_with_category('1001_John Doe_20230515.pdf', 'MED') == \
+        '1001_John Doe_20230515_MED.pdf'
+    assert processor.format_filename_with_category('1001_John Doe_', 'MED') == '1001_John Doe_MED'
+    processor.category_settings['placement'] = 'prefix'
+    assert processor.format_filename_with_category('1001_John Doe.pdf', 'MED') == 'MED_1001_John Doe.pdf'
+    assert processor.format_filename_with_category('1001_John Doe.pdf', '') == '1001_John Doe.pdf'
+
+
+def test_configuration_is_cached():
+    assert main.get_config() is main.get_config()
+    assert main.get_filename_formatter() is main.get_filename_formatter()
+    assert main.format_filename('1001', 'John Doe', 'Report', '20230515', management_flag='_yes',
+                                exclude_management_flag=True) == '1001_John Doe_Report_20230515'
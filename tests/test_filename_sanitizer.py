@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+"""
+Filename Sanitizer Tests.
+
+File Path: tests/test_filename_sanitizer.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Illegal and control characters are replaced and runs collapsed
+- Trailing dots/spaces and reserved device names are fixed
+- The output name builder applies the sanitizer to every component
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.filename_sanitizer import FilenameSanitizer
+from core.utils.name_limits import OutputNameBuilder
+
+
+def test_illegal_characters_replaced():
+    sanitizer = FilenameSanitizer({})
+    assert sanitizer.replace_illegal('Review: "Q1" <draft>?') == 'Review Q1 draft'
+    assert sanitizer.replace_illegal('Care\tplan') == 'Care plan'
+    assert sanitizer.replace_illegal('Care plan') == 'Care plan'
+    mapped = FilenameSanitizer({'FilenameSanitizer': {'replacement': '', 'character_map': {':': '-'}}})
+    assert mapped.replace_illegal('Re:Review?') == 'Re-Review'
+
+
+def test_trailing_and_reserved_names():
+    sanitizer = FilenameSanitizer({})
+    assert sanitizer.finish('Notes. ') == 'Notes'
+    assert sanitizer.finish('CON.pdf') == 'CON_.pdf'
+    assert sanitizer.finish('nul') == 'nul_'
+    assert sanitizer.finish('CONTRACT.pdf') == 'CONTRACT.pdf'
+    assert sanitizer.sanitize('lpt1 .txt') == 'lpt1_.txt'
+    assert FilenameSanitizer({'FilenameSanitizer': {'enabled': False}}).sanitize('a:b.') == 'a:b.'
+
+
+def test_builder_sanitizes_components():
+    config = {'Global': {'component_order': ['id', 'name', 'remainder', 'date'], 'component_separator': '_'}}
+    built = OutputNameBuilder(config).build({'id': '1001', 'name': 'John Doe', 'remainder': 'Plan: v2?',
+                                             'date': '20230515'}, '.pdf', 'John Doe')
+    assert built.filename == '1001_John Doe_Plan v2_20230515.pdf'
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""
+Fuzzy Name Resolution Tests.
+
+File Path: tests/test_fuzzy_names.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- OSA distance counts adjacent transpositions as one edit
+- Typo'd folder names resolve to the registered person
+- Ambiguous and distant names are left unresolved
+- Approximate matching is off unless enabled
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.fuzzy_names import FuzzyNameIndex, osa_distance
+
+
+ENABLED = {'FuzzyNames': {'enabled': True}}
+
+REGISTRY = [('John Doe', '1001'), ('Jane Smith', '1002'), ('Bob Johnson', '1003'), ('Zoë Müller', '1004'),
+            ('Mark Lee', '1005'), ('Mary Lee', '1006')]
+
+
+def test_osa_distance():
+    assert osa_distance('john doe', 'john doe') == 0
+    assert osa_distance('john doe', 'jon doe') == 1
+    assert osa_distance('john doe', 'jhon doe') == 1
+    assert osa_distance('ca', 'abc') == 3
+    assert osa_distance('', 'abc') == 3
+    assert osa_distance('kitten', 'sitting') == 3
+
+
+def test_typos_resolve():
+    index = FuzzyNameIndex(ENABLED, REGISTRY)
+    match = index.match('Jon Doe')
+    assert match.value == '1001' and match.name == 'John Doe' and match.distance == 1
+    assert not match.ambiguous
+    assert index.match('John  Do').value == '1001'
+    assert index.match('Zoe Muller').value == '1004'
+    assert index.match('Jnae Smtih').value == '1002'
+    assert index.match('John Doe') is None
+
+
+def test_unresolved_names():
+    index = FuzzyNameIndex(ENABLED, REGISTRY)
+    assert index.match('Peter Parker') is None
+    assert index.match('Jon') is None
+    ambiguous = index.match('Marx Lee')
+    assert ambiguous.ambiguous and ambiguous.alternatives
+    assert 'Ambiguous' in ambiguous.describe()
+    first = FuzzyNameIndex({'FuzzyNames': {'enabled': True, 'ambiguity': 'first'}}, REGISTRY).match('Marx Lee')
+    assert not first.ambiguous and first.value == '1005'
+    assert FuzzyNameIndex({}, REGISTRY).match('Jon Doe') is None
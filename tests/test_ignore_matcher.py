@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+"""
+Compiled Ignore Matcher Tests.
+
+File Path: tests/test_ignore_matcher.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Global.file_exclusions and FileIgnore rules match like globs (dots are literal)
+- Ignored directories are pruned from the walk
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.file_walker import walk_files
+from core.utils.ignore_matcher import IgnoreMatcher
+
+
+CONFIG = {
+    'Global': {
+        'file_exclusions': ["desktop.ini", "*.tmp", "~$*", "*backup*", "scan?.pdf"],
+        'directory_exclusions': ["$RECYCLE.BIN"],
+    },
+    'FileIgnore': {'ignore_files': ["*.BAK"], 'ignore_directories': ["node_modules"]},
+}
+
+
+def test_file_rules():
+    matcher = IgnoreMatcher(CONFIG)
+    for name in ("desktop.ini", "notes.tmp", "~$report.docx", "old backup copy.pdf", "scan1.pdf", "plan.bak"):
+        assert matcher.ignores_file(name), name
+    # "*.tmp" must not match a name that merely contains "tmp" after another character
+    for name in ("Desktop.ini", "atmp.doc", "scan12.pdf", ".profile"):
+        assert not matcher.ignores_file(name), name
+    assert IgnoreMatcher(CONFIG, ignore_hidden=True).ignores_file(".profile")
+
+
+def test_ignored_directories_are_not_walked(tmp_path):
+    for relative in ("John Doe/report.pdf", "John Doe/$RECYCLE.BIN/old.pdf", "node_modules/x/y.js", "John Doe/a.tmp"):
+        (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative).write_text('x')
+    matcher = IgnoreMatcher(CONFIG)
+    found = [entry.relative_path.as_posix() for entry in walk_files(tmp_path, matcher.skip_dir)
+             if matcher.include(entry.relative_path)]
+    assert found == ["John Doe/report.pdf"]
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+"""
+Launcher and Configuration Override Tests.
+
+File Path: tests/test_launcher.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Configuration loaders honor VC_CONFIG_FILE
+- bin/vcmigrate passes its options through to main.py
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils import date_matcher, user_mapping
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_config_override(tmp_path, monkeypatch):
+    config_file = tmp_path / 'custom.yaml'
+    config_file.write_text("UserMapping:\n  mapping_file: custom.csv\n")
+    monkeypatch.setenv('VC_CONFIG_FILE', str(config_file))
+    assert user_mapping.load_config()['UserMapping']['mapping_file'] == 'custom.csv'
+    assert date_matcher.load_config()['UserMapping']['mapping_file'] == 'custom.csv'
+
+
+def test_launcher_passes_options():
+    result = subprocess.run(['sh', str(ROOT / 'bin' / 'vcmigrate'), '--help'],
+                            capture_output=True, text=True, env={'PYTHON': sys.executable, 'PATH': '/usr/bin:/bin'})
+    assert result.returncode == 0
+    assert '--config' in result.stdout and '--dry-run' in result.stdout
+    missing = subprocess.run(['sh', str(ROOT / 'bin' / 'vcmigrate'), '--config', 'missing.yaml', '--input-dir', '.'],
+                             capture_output=True, text=True, env={'PYTHON': sys.executable, 'PATH': '/usr/bin:/bin'})
+    assert missing.returncode == 1
+    assert 'Configuration file not found' in missing.stdout
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+"""
+Run Metrics Tests.
+
+File Path: tests/test_metrics.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Prometheus text rendering of counters and histograms
+- Textfile exporter writes the final values on close
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.metrics import MetricsRegistry, TextfileExporter
+
+
+def test_render_counters_and_histograms():
+    registry = MetricsRegistry()
+    registry.enabled = True
+    registry.files_processed.inc(result='success')
+    registry.files_processed.inc(result='success')
+    registry.errors.inc(stage='transfer')
+    timer = registry.timer()
+    timer.lap('user')
+    registry.transfer_seconds.observe(0.02)
+
+    text = registry.render()
+    assert 'vcmigrate_files_processed_total{result="success"} 2' in text
+    assert 'vcmigrate_errors_total{stage="transfer"} 1' in text
+    assert 'vcmigrate_bytes_copied_total 0' in text
+    assert 'vcmigrate_extraction_seconds_count{stage="user"} 1' in text
+    assert 'vcmigrate_transfer_seconds_bucket{le="0.01"} 0' in text
+    assert 'vcmigrate_transfer_seconds_bucket{le="0.025"} 1' in text
+    assert 'vcmigrate_transfer_seconds_bucket{le="+Inf"} 1' in text
+
+
+def test_textfile_exporter(tmp_path):
+    registry = MetricsRegistry()
+    exporter = TextfileExporter(registry, str(tmp_path / 'vcmigrate.prom'), interval=3600)
+    registry.bytes_copied.inc(2048)
+    exporter.close()
+    assert 'vcmigrate_bytes_copied_total 2048' in (tmp_path / 'vcmigrate.prom').read_text()
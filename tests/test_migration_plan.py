@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""
+Migration Plan Tests.
+
+File Path: tests/test_migration_plan.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Case-insensitive destination collision detection
+- Collisions are detected when worker threads share one tracker
+- Table and JSONL plan output
+"""
+
+import io
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.migration_plan import CollisionTracker, PlanEntry, PlanWriter
+
+
+def test_collision_tracker_is_case_insensitive():
+    tracker = CollisionTracker()
+    assert not tracker.check('John Doe/1001_John Doe_report.pdf')
+    assert tracker.check('john doe/1001_JOHN DOE_report.pdf')
+    assert not tracker.check('John Doe/1001_John Doe_other.pdf')
+    assert tracker.collisions == 1
+
+
+def test_collision_tracker_is_thread_safe():
+    tracker = CollisionTracker()
+    destinations = [f'John Doe/{i % 500}.pdf' for i in range(8000)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        new = sum(not collided for collided in pool.map(tracker.check, destinations))
+    assert new == 500
+    assert tracker.collisions == 7500
+
+
+def test_plan_writer_formats():
+    entry = PlanEntry(Path('/in/John Doe/report.pdf'), 'John Doe/report.pdf', 'John Doe',
+                      '1001_John Doe_report.pdf', '1001', warnings=('Collision: example',))
+    failed = PlanEntry(Path('/in/John Doe/bad.pdf'), 'John Doe/bad.pdf', error='boom')
+
+    table = io.StringIO()
+    writer = PlanWriter(table)
+    writer.write(entry)
+    writer.write(failed)
+    assert table.getvalue().splitlines() == [
+        'SOURCE -> DESTINATION',
+        'John Doe/report.pdf -> John Doe/1001_John Doe_report.pdf',
+        '  ! Collision: example',
+        'John Doe/bad.pdf -> ERROR: boom',
+    ]
+
+    jsonl = io.StringIO()
+    writer = PlanWriter(jsonl, 'jsonl')
+    writer.write(entry)
+    writer.write(failed)
+    records = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+    assert records[0]['destination'] == 'John Doe/1001_John Doe_report.pdf'
+    assert records[0]['warnings'] == ['Collision: example']
+    assert records[1] == {'source': 'John Doe/bad.pdf', 'destination': '', 'person': '', 'user_id': '', 'error': 'boom'}
+    assert writer.count == 2
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""
+Misfiled Document Audit Tests.
+
+File Path: tests/test_misfiled_audit.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Files naming another registered person are reported, the folder's own names are not
+- Prefixed and management person folders resolve to their own person
+- The CSV report lists every finding
+"""
+
+import csv
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.misfiled_audit import MisfiledAudit, MisfiledReport
+
+
+CONFIG = {'Global': {'separators': {'input': [" ", "-", "_", "."]}}}
+USERS = {'John Doe': '1001', 'Jane Smith': '1002', 'Mary Jane Wilson': '1003', 'Jane Wilson': '1004'}
+
+
+def test_check_flags_other_people_only():
+    audit = MisfiledAudit(CONFIG, USERS)
+    findings = audit.check(Path('John Doe/Medical/Jane Smith report.pdf'))
+    assert [(f.folder_user_id, f.matched_user_id, f.kind) for f in findings] == [('1001', '1002', 'person')]
+    assert audit.check(Path('John Doe/John Doe jdoe notes.pdf')) == []
+    # "Jane Wilson" inside the folder person's own full name is not a conflict
+    assert audit.check(Path('Mary Jane Wilson/Mary Jane Wilson plan.pdf')) == []
+
+
+def test_prefixed_folders_resolve():
+    config = dict(CONFIG, UserMapping={'prefix': 'VC - ', 'management_suffix': ' Management'})
+    audit = MisfiledAudit(config, USERS)
+    assert audit.check(Path('VC - Mary Jane Wilson/Mary Jane Wilson plan.pdf')) == []
+    assert audit.check(Path('John Doe Management/John Doe budget.pdf')) == []
+    findings = audit.check(Path('VC - John Doe/Jane Smith report.pdf'))
+    assert [(f.folder_user_id, f.matched_user_id) for f in findings] == [('1001', '1002')]
+
+
+def test_run_writes_report(tmp_path):
+    input_dir = tmp_path / 'input'
+    (input_dir / 'John Doe').mkdir(parents=True)
+    (input_dir / 'John Doe' / 'j-smith referral.pdf').write_text('x')
+    (input_dir / 'John Doe' / 'john doe plan.pdf').write_text('x')
+    report = MisfiledReport(str(tmp_path / 'misfiled.csv'))
+    try:
+        assert MisfiledAudit(CONFIG, USERS).run(str(input_dir), report) == 1
+    finally:
+        report.close()
+    with open(tmp_path / 'misfiled.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]['relative_path'] == 'John Doe/j-smith referral.pdf'
+    assert rows[0]['matched_name'] == 'Jane Smith'
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+"""
+Multi-Pattern Name Index Tests.
+
+File Path: tests/test_name_index.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Full names, shorthand, initials and categories are found in one scan with original offsets
+- Bounded variants are not reported inside longer words
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.name_index import AhoCorasick, NameIndex
+
+
+CONFIG = {'Global': {'separators': {'input': [" ", "-", "_", ".", "/"]}}}
+USERS = {'John Doe': '1001', 'Jane Smith': '1002', 'Mary Jane Wilson': '1003'}
+CATEGORIES = {'Medical': '2', 'Personal Care': '3'}
+
+
+def test_automaton_reports_overlapping_patterns():
+    automaton = AhoCorasick()
+    for pattern in ('he', 'she', 'his', 'hers'):
+        automaton.add(pattern, pattern)
+    assert sorted(automaton.iter('ushers')) == [(4, 'he'), (4, 'she'), (6, 'hers')]
+
+
+def test_scan_finds_variants_with_offsets():
+    index = NameIndex.from_mappings(CONFIG, USERS, CATEGORIES)
+    path = "Mary Jane Wilson/Personal_Care/J-Doe report JOHNDOE.pdf"
+    hits = {(hit.kind, hit.key, hit.text) for hit in index.scan(path)}
+    assert ('person', '1003', 'Mary Jane Wilson') in hits
+    assert ('category', '3', 'Personal_Care') in hits
+    assert ('shorthand', '1001', 'J-Doe') in hits
+    assert ('person', '1001', 'JOHNDOE') in hits
+    for hit in index.scan(path):
+        assert path[hit.start:hit.end] == hit.text
+
+
+def test_bounded_variants_need_separators():
+    index = NameIndex.from_mappings(CONFIG, USERS, CATEGORIES)
+    kinds = {(hit.kind, hit.key) for hit in index.scan("Johnson_paramedical_jds.pdf")}
+    assert ('name_part', '1001') not in kinds
+    assert ('category', '2') not in kinds
+    assert ('initials', '1001') not in kinds
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+"""
+Output Name Limit Tests.
+
+File Path: tests/test_name_limits.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Short names are formatted exactly like format_filename
+- Long remainders are shortened deterministically and keep the other components
+- Byte and path limits are enforced, unfixable names are reported
+- format_filename, --extract-filename style calls and person folders are
+  sanitized and limited like a real run
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.name_limits import OutputNameBuilder
+from main import format_filename, normalize_filename
+
+
+CONFIG = {
+    'Global': {
+        'component_order': ['id', 'name', 'remainder', 'date', 'category', 'management'],
+        'component_separator': '_',
+    },
+    'OutputLimits': {'max_component_chars': 60, 'max_component_bytes': 60, 'max_path_chars': 100},
+}
+
+COMPONENTS = {'id': '1001', 'name': 'John Doe', 'date': '20230515', 'category': 'MED', 'management': 'yes'}
+
+
+def test_short_names_unchanged():
+    components = dict(COMPONENTS, remainder='Report')
+    built = OutputNameBuilder(CONFIG).build(components, '.pdf', 'John Doe')
+    expected = format_filename('1001', 'John Doe', 'Report', '20230515', 'MED', 'yes') + '.pdf'
+    assert built.filename == expected
+    assert not built.truncated and built.warnings == ()
+
+
+def test_long_remainder_shortened():
+    builder = OutputNameBuilder(CONFIG)
+    components = dict(COMPONENTS, remainder='Annual review of care plan ' * 4)
+    built = builder.build(components, '.pdf', 'John Doe')
+    assert built.truncated
+    assert len(built.filename) <= 60
+    assert built.filename.startswith('1001_John Doe_Annual')
+    assert built.filename.endswith('_20230515_MED_yes.pdf')
+    assert '~' in built.filename
+    assert built.warnings[0].startswith('Truncated:')
+    assert builder.build(components, '.pdf', 'John Doe') == built
+    other = builder.build(dict(components, remainder=components['remainder'] + 'x'), '.pdf', 'John Doe')
+    assert other.filename != built.filename
+
+
+def test_byte_and_path_limits():
+    builder = OutputNameBuilder(CONFIG)
+    built = builder.build(dict(COMPONENTS, remainder='Überprüfung ' * 4), '.pdf', 'John Doe')
+    assert len(built.filename.encode('utf-8')) <= 60
+
+    deep = builder.build(dict(COMPONENTS, remainder='Report notes'), '.pdf', 'x' * 50)
+    assert len(deep.filename) + 51 <= 100
+
+    hopeless = builder.build(dict(COMPONENTS, remainder='Report'), '.pdf', 'x' * 90)
+    assert any(warning.startswith('Over limit:') for warning in hopeless.warnings)
+
+
+def test_every_output_name_is_built():
+    builder = OutputNameBuilder(CONFIG)
+    assert format_filename('1001', 'John Doe', 'Notes: a/b', '20230515') == '1001_John Doe_Notes a b_20230515'
+    assert builder.folder_name('John Doe?. ') == 'John Doe'
+    long_name = normalize_filename('John Doe/' + 'Annual review ' * 30 + '.pdf')
+    assert len(long_name) <= 255 and '~' in long_name
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+"""
+Plugin Manager Tests.
+
+File Path: tests/test_plugin_manager.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Hooks run over batches and may replace or drop records
+- Failing hooks are skipped unless fail_on_error is set
+- Directory plugins load, including the bundled filename validation plugin
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.migration_plan import PlanEntry
+from core.utils.plugin_manager import PluginManager
+
+
+def test_batched_hooks():
+    manager = PluginManager({'Plugins': {'batch_size': 3}})
+    assert list(manager.apply('pre_extract', range(3))) == [0, 1, 2]
+    sizes = []
+    manager.register('pre_extract', lambda batch: sizes.append(len(batch)))
+    manager.register('pre_extract', lambda batch: [record for record in batch if record % 2 == 0])
+    assert list(manager.apply('pre_extract', range(10))) == [0, 2, 4, 6, 8]
+    assert sizes == [3, 3, 3, 1]
+    with pytest.raises(ValueError):
+        manager.register('pre_upload', print)
+
+
+def test_failing_hooks():
+    def broken(batch):
+        raise RuntimeError("boom")
+
+    manager = PluginManager({})
+    manager.register('post_write', broken)
+    assert list(manager.apply('post_write', [1, 2])) == [1, 2]
+    strict = PluginManager({'Plugins': {'fail_on_error': True}})
+    strict.register('post_write', broken)
+    with pytest.raises(RuntimeError):
+        list(strict.apply('post_write', [1]))
+
+
+def test_validate_filenames_plugin(tmp_path):
+    plugin = tmp_path / 'tag.py'
+    plugin.write_text("def pre_write(entries):\n    return entries[:1]\n")
+    assert PluginManager.from_config({'Plugins': {'directories': ['plugins', str(tmp_path)]}}).plugins == \
+        ['validate_filenames']
+    manager = PluginManager.from_config({'Plugins': {'directories': ['plugins', str(tmp_path)],
+                                                     'allowed': ['validate_filenames', 'tag']}})
+    assert manager.plugins == ['validate_filenames', 'tag']
+    assert PluginManager.from_config({'Plugins': {'directories': [str(tmp_path)],
+                                                  'allowed': ['*']}}).plugins == ['tag']
+
+    entries = [PlanEntry(Path('a'), 'a', 'John Doe', '1001_John Doe_Report_20230515.pdf'),
+               PlanEntry(Path('b'), 'b', 'John Doe', 'Bad: name  .pdf'),
+               PlanEntry(Path('c'), 'c', error='Failed'),
+               PlanEntry(Path('d'), 'd', 'John Doe', 'x' * 300 + '.pdf'),
+               PlanEntry(Path('e'), 'e', 'John Doe', 'x' * 300 + '.pdf',
+                         warnings=('Over limit: Filename is 304 characters (limit 255)',))]
+    checked = list(manager.apply('post_extract', entries))
+    assert checked[0].warnings == ()
+    assert len(checked[1].warnings) == 2
+    assert 'invalid characters' in checked[1].warnings[0]
+    assert checked[2] == entries[2]
+    assert len(checked[3].warnings) == 1 and '(limit 255)' in checked[3].warnings[0]
+    assert checked[4] == entries[4]
+    assert len(list(manager.apply('pre_write', entries))) == 1
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+"""
+Progress Reporting Tests.
+
+File Path: tests/test_progress.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Counters, per-person breakdown and final render
+- JSON status lines
+- The total grows with the main walk or comes from the work unit sizing
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.progress import ProgressReporter, format_duration
+from core.utils.results import FileResult
+
+
+def test_progress_counters_and_status():
+    stream, status = io.StringIO(), io.StringIO()
+    progress = ProgressReporter({'Progress': {'refresh_interval': 3600, 'status_interval': 3600}}, stream, status)
+    walk = progress.discover(['a.pdf', 'b.pdf', 'c.pdf'])
+    assert next(walk) == 'a.pdf'
+    assert (progress.discovered, progress.total) == (1, None)
+    assert list(walk) == ['b.pdf', 'c.pdf']
+
+    progress.update(FileResult('John Doe/a.pdf', 'a.pdf', 'John Doe', True, 'copied', size=2048))
+    progress.update(FileResult('Jane Smith/b.pdf', person='Jane Smith', error='boom'))
+    progress.close()
+
+    record = json.loads(status.getvalue().splitlines()[-1])
+    assert record['files_total'] == 3
+    assert record['files_done'] == 2
+    assert record['bytes_done'] == 2048
+    assert record['errors'] == 1
+    assert record['person_counts'] == {'John Doe': 1, 'Jane Smith': 1}
+    assert stream.getvalue().splitlines()[-1].startswith('[2/3  66.7%]')
+
+
+def test_format_duration():
+    assert format_duration(3725) == '1:02:05'
+
+
+def test_total_from_sizing():
+    status = io.StringIO()
+    progress = ProgressReporter({'Progress': {'status_interval': 3600}}, None, status)
+    progress.set_total(40)
+    progress.update(FileResult('John Doe/a.pdf', 'a.pdf', 'John Doe', True, 'copied', size=1))
+    progress.close()
+    assert json.loads(status.getvalue())['files_total'] == 40
+    hidden = ProgressReporter({'Progress': {'count_total': False}}, None)
+    assert list(hidden.discover(['a.pdf'])) == ['a.pdf']
+    assert (hidden.discovered, hidden.total) == (1, None)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+"""
+Processing Results Tests.
+
+File Path: tests/test_results.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Streaming aggregation with bounded error samples
+- JSONL sink output in the legacy result dict shape
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.results import FileResult, ResultAggregator, ResultSink
+
+
+def test_aggregator_bounds_error_samples(tmp_path):
+    sink = ResultSink(str(tmp_path / 'results.jsonl'))
+    summary = ResultAggregator(max_error_samples=2, sink=sink)
+    summary.consume([
+        FileResult('John Doe/a.pdf', '1001_John Doe_a.pdf', 'John Doe', True, 'copied'),
+        FileResult('John Doe/b.pdf', person='John Doe', error='error 1'),
+        FileResult('Jane Smith/c.pdf', person='Jane Smith', error='error 2'),
+        FileResult('Jane Smith/d.pdf', person='Jane Smith', error='error 3'),
+    ])
+    sink.close()
+
+    assert (summary.total, summary.successful, summary.errors) == (4, 1, 3)
+    assert summary.error_samples == ['error 1', 'error 2']
+    assert summary.person_counts == {'John Doe': 2, 'Jane Smith': 2}
+
+    records = [json.loads(line) for line in (tmp_path / 'results.jsonl').read_text().splitlines()]
+    assert len(records) == 4
+    assert records[0] == {'original_filename': 'John Doe/a.pdf', 'success': True,
+                          'new_filename': '1001_John Doe_a.pdf', 'person': 'John Doe', 'copied': True}
+    assert records[1]['error'] == 'error 1'
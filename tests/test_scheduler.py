@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+"""
+Balanced Work Scheduler Tests.
+
+File Path: tests/test_scheduler.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Oversized person folders are split by category and units are ordered largest first
+- Units together cover every file exactly once
+- Parallel workers are rejected together with the async backend
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.file_walker import walk_files
+from core.utils.scheduler import plan_work_units, run_largest_first, size_tree
+
+
+def _make_tree(root):
+    layout = {
+        'John Doe/Medical': 6, 'John Doe/WHS/2024': 3, 'John Doe': 2,
+        'Jane Smith/Medical': 2, 'Sarah Johnson': 1, '': 1,
+    }
+    for folder, count in layout.items():
+        (root / folder).mkdir(parents=True, exist_ok=True)
+        for i in range(count):
+            (root / folder / f'file{i}.pdf').write_text('x' * (i + 1))
+
+
+def test_units_split_and_ordered(tmp_path):
+    _make_tree(tmp_path)
+    units = plan_work_units(size_tree(tmp_path), max_unit_files=5)
+
+    assert [(u.person, u.category, u.files) for u in units] == [
+        ('John Doe', 'Medical', 6),
+        ('John Doe', 'WHS', 3),
+        ('John Doe', '', 2),
+        ('Jane Smith', None, 2),
+        ('Sarah Johnson', None, 1),
+        ('', '', 1),
+    ]
+
+    covered = list(run_largest_first(units, lambda unit: (e.relative_path for e in unit.walk(tmp_path)), 3))
+    assert sorted(covered) == sorted(e.relative_path for e in walk_files(tmp_path))
+
+
+def test_workers_reject_async_backend(tmp_path):
+    result = subprocess.run([sys.executable, str(Path(__file__).parent.parent / 'main.py'), '--input-dir', str(tmp_path),
+                             '--dry-run', '--workers', '2', '--backend', 'async'], capture_output=True, text=True)
+    assert result.returncode == 1
+    assert '--backend async cannot be combined' in result.stdout
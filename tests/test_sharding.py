@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+Sharded Execution Tests.
+
+File Path: tests/test_sharding.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- Every file belongs to exactly one shard; person sharding keeps people together
+- Reconcile merges journals and reports cross-shard collisions and missing shards
+- A shard whose run raised is reported as incomplete
+- Journals of a run with another shard count in the same directory are ignored
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.results import FileResult
+from core.utils.sharding import ShardJournal, ShardSpec, reconcile
+
+
+PATHS = [Path(f'Person {p}/Folder {f}/file {i}.pdf') for p in range(20) for f in range(3) for i in range(5)]
+
+
+@pytest.mark.parametrize('mode', ['person', 'hash'])
+def test_shards_partition_the_tree(mode):
+    shards = [ShardSpec.parse(f'{n}/4', mode) for n in range(1, 5)]
+    for path in PATHS:
+        assert sum(shard.owns(path) for shard in shards) == 1
+    if mode == 'person':
+        for shard in shards:
+            owned = {path.parts[0] for path in PATHS if shard.owns(path)}
+            assert all(shard.skips_directory(Path(f'Person {p}')) == (f'Person {p}' not in owned) for p in range(20))
+
+
+def test_reconcile_reports_cross_shard_collisions(tmp_path):
+    first = ShardJournal(str(tmp_path), ShardSpec.parse('1/3'))
+    first.write(FileResult('John Doe/a.pdf', '1001_John Doe_a.pdf', 'John Doe', True, 'copied'))
+    first.finish()
+    first.close()
+    second = ShardJournal(str(tmp_path), ShardSpec.parse('2/3'))
+    second.write(FileResult('VC - John Doe/a.pdf', '1001_John Doe_a.pdf', 'John Doe', True, 'copied'))
+    second.finish()
+    second.close()
+
+    report = reconcile(str(tmp_path))
+    assert report.summary.total == 2
+    assert report.collisions == 1
+    assert report.missing_shards == [3]
+    assert report.incomplete_shards == []
+    assert not report.ok
+    with pytest.raises(ValueError):
+        ShardSpec.parse('5/4')
+
+
+def test_failed_run_leaves_shard_incomplete(tmp_path):
+    def results():
+        yield FileResult('John Doe/a.pdf', '1001_John Doe_a.pdf', 'John Doe', True, 'copied')
+        raise KeyboardInterrupt
+
+    journal = ShardJournal(str(tmp_path), ShardSpec.parse('1/1'))
+    with pytest.raises(KeyboardInterrupt):
+        try:
+            for result in results():
+                journal.write(result)
+            journal.finish()
+        finally:
+            journal.close()
+
+    report = reconcile(str(tmp_path))
+    assert report.summary.total == 1
+    assert report.incomplete_shards == [1]
+    assert not report.ok
+
+
+def test_reconcile_ignores_other_shard_counts(tmp_path):
+    for label in ('1/2', '2/2', '1/3', '3/3'):
+        journal = ShardJournal(str(tmp_path), ShardSpec.parse(label))
+        journal.write(FileResult(f'John Doe/{label[0]}.pdf', '1001_John Doe_a.pdf', 'John Doe', True, 'copied'))
+        journal.finish()
+        journal.close()
+
+    with pytest.raises(ValueError):
+        reconcile(str(tmp_path))
+    two = reconcile(str(tmp_path), shard_count=2)
+    assert two.shard_count == 2 and two.summary.total == 2
+    assert two.missing_shards == [] and two.collisions == 1
+    three = reconcile(str(tmp_path), shard_count=3)
+    assert three.summary.total == 2 and three.missing_shards == [2]
+    assert reconcile(str(tmp_path), shard_count=4).missing_shards == [1, 2, 3, 4]
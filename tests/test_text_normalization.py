@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+Text Normalization Tests.
+
+File Path: tests/test_text_normalization.py
+
+@package VisualCare\\FileMigration\\Tests
+@since   1.0.0
+
+Tests:
+- NFD/NFC variants, case and Unicode spaces reduce to one key
+- NormalizedIndex lookups and first-value-wins semantics
+- Category matching keeps non-ASCII letters
+- Registry lookups parse the configuration once
+"""
+
+import sys
+import unicodedata
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils import user_mapping
+from core.utils.category_processor import CategoryProcessor
+from core.utils.text_normalization import NormalizedIndex, TextNormalizer
+
+
+def test_keys_are_canonical():
+    normalizer = TextNormalizer()
+    composed = 'Zoë Müller'
+    decomposed = unicodedata.normalize('NFD', composed)
+    assert composed != decomposed
+    assert normalizer.key(decomposed) == normalizer.key(composed) == 'zoë müller'
+    assert normalizer.key('ZOË\u00a0 MÜLLER\u200b ') == 'zoë müller'
+    assert normalizer.key('Strauß') == normalizer.key('STRAUSS')
+    assert normalizer.canonical('Zoë Müller') == 'Zoë Müller'
+    assert TextNormalizer({'TextNormalization': {'casefold': False}}).key('Zoë') == 'Zoë'
+
+
+def test_normalized_index():
+    index = NormalizedIndex(TextNormalizer(), [('Zoë Müller', '2001'), ('ZOË MÜLLER', '2002'), ('John Doe', '1001')])
+    assert len(index) == 2
+    assert index.get(unicodedata.normalize('NFD', 'zoë müller')) == '2001'
+    assert index.get('john doe') == '1001'
+    assert 'Jane Smith' not in index
+    assert index.get('Jane Smith', '') == ''
+
+
+def test_category_keys_keep_unicode():
+    processor = CategoryProcessor({'Category': {'enabled': True, 'mapping_test_file': '/nonexistent.csv'}})
+    processor.category_mapping[processor._key('Ärztliche Berichte')] = 'MED'
+    assert processor._match_category_name(unicodedata.normalize('NFD', 'ärztliche berichte')) == 'MED'
+
+
+def test_lookups_parse_config_once(tmp_path, monkeypatch):
+    mapping = tmp_path / 'users.csv'
+    mapping.write_text("user_id,full_name\n2001,Zoë Müller\n")
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(f"UserMapping:\n  mapping_test_file: {mapping}\n  prefix: 'VC - '\n")
+    monkeypatch.setenv('VC_CONFIG_FILE', str(config_file))
+    parses = []
+    safe_load = user_mapping.yaml.safe_load
+    monkeypatch.setattr(user_mapping.yaml, 'safe_load', lambda stream: parses.append(1) or safe_load(stream))
+    for _ in range(5):
+        assert user_mapping.get_user_id_by_name('VC - ZOË MÜLLER') == '2001'
+    assert len(parses) == 1
+    config = user_mapping.load_config()
+    assert user_mapping.resolve_person_name('Zoe Muller', config) == (None, None)
+    assert len(parses) == 1